@@ -0,0 +1,27 @@
+"""Shared helpers for the benchmark scripts in this directory.
+
+Run a benchmark from the repository root, e.g. ``python benchmarks/bench_columnar.py --rows 100000``.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from tiketnlphub.datasets.synthetic import synthetic_reviews
+
+
+def sample_reviews(n: int, seed: int = 0, lang: str = "mixed", adversarial: bool = False) -> list:
+    # the shared workload of the benchmarks, see tiketnlphub.datasets.synthetic.SyntheticReviews
+    return synthetic_reviews(n, lang=lang, seed=seed, adversarial=adversarial)
+
+
+def timed(label: str, func, *args, repeat: int = 1, **kwargs):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<48} {best:10.3f} s")
+    return best, result
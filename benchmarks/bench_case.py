@@ -0,0 +1,52 @@
+"""Case normalization on caps-heavy reviews: the previous callback based `upper_selected_word` and `lower_letter_sequence_caps` vs. their split based versions, and `truecase`.
+
+The callback versions run `re.sub` with a Python lambda per match, as the steps did before. Half of the corpus is shouted in ALL CAPS, so every word of these texts is a match.
+Results of both versions are checked to be identical.
+
+Usage: python benchmarks/bench_case.py [--docs 200000]
+"""
+import argparse
+import re
+
+from _common import sample_reviews, timed
+
+from tiketnlphub.preprocessing.cleaner import lower_letter_sequence_caps, upper_selected_word
+from tiketnlphub.preprocessing.re_pattern import RegexString
+from tiketnlphub.preprocessing.truecase import truecase_batch
+
+
+def corpus(docs: int) -> list:
+    return [text.upper() if i % 2 else text.lower() for i, text in enumerate(sample_reviews(docs))]
+
+
+# the pattern of the callback version
+UPPER_SELECTED_WORD = r"(^|[.?!])\s*([a-zA-Z])"
+
+
+def upper_selected_word_callback(texts):
+    return [re.sub(UPPER_SELECTED_WORD, lambda p: p.group(0).upper(), text.capitalize()) for text in texts]
+
+
+def lower_letter_sequence_caps_callback(texts):
+    return [re.sub(RegexString.REPEAT_CAPS, lambda x: x.group(0).lower(), text) for text in texts]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=200_000)
+    args = parser.parse_args()
+
+    texts = corpus(args.docs)
+    print(f"docs: {args.docs:,}")
+
+    _, expected = timed("upper_selected_word, callback", upper_selected_word_callback, texts, repeat=3)
+    _, result = timed("upper_selected_word", lambda: list(map(upper_selected_word, texts)), repeat=3)
+    print(f"{'':<48} identical: {expected == result}")
+    _, expected = timed("lower_letter_sequence_caps, callback", lower_letter_sequence_caps_callback, texts, repeat=3)
+    _, result = timed("lower_letter_sequence_caps", lambda: list(map(lower_letter_sequence_caps, texts)), repeat=3)
+    print(f"{'':<48} identical: {expected == result}")
+    timed("truecase_batch (en)", truecase_batch, texts, lang="en", repeat=3)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Columnar pipeline vs. chained ``Series.apply`` calls.
+
+Usage: python benchmarks/bench_columnar.py [--rows 1000000]
+"""
+import argparse
+
+from _common import sample_reviews, timed
+
+import pandas as pd
+
+from tiketnlphub.preprocessing import cleaner, normalizer
+from tiketnlphub.preprocessing.pipeline import Pipeline
+
+
+def chained_apply(series: pd.Series) -> pd.Series:
+    return (
+        series.apply(cleaner.remove_urls)
+        .apply(cleaner.remove_mentions)
+        .apply(cleaner.remove_hashtags)
+        .apply(normalizer.normalize_symbols)
+        .apply(cleaner.remove_white_spaces)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    series = pd.Series(sample_reviews(args.rows), dtype=object)
+    pipeline = Pipeline(["remove_urls", "remove_mentions", "remove_hashtags", "normalize_symbols", "remove_white_spaces"])
+
+    print(f"rows: {args.rows:,}")
+    _, expected = timed("chained Series.apply", chained_apply, series, repeat=args.repeat)
+    _, result = timed("Pipeline.transform_column", pipeline.transform_column, series, repeat=args.repeat)
+    assert expected.tolist() == result.tolist()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Scaling of memory-mapped parallel corpus cleaning across worker processes.
+
+Usage: python benchmarks/bench_corpus.py [--lines 2000000] [--workers 1 2 4 8]
+"""
+import argparse
+import os
+import resource
+import tempfile
+
+from _common import sample_reviews, timed
+
+from tiketnlphub.preprocessing.corpus import clean_corpus
+from tiketnlphub.preprocessing.pipeline import Pipeline
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=2_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--chunk-size", type=int, default=16 * 1024 * 1024)
+    args = parser.parse_args()
+
+    pipeline = Pipeline(["remove_urls", "remove_mentions", "remove_hashtags", "normalize_symbols", "remove_white_spaces"])
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = os.path.join(tmp, "reviews.txt")
+        with open(input_path, "w", encoding="utf-8") as f:
+            for start in range(0, args.lines, 100_000):
+                f.write("\n".join(sample_reviews(min(100_000, args.lines - start), seed=start)) + "\n")
+        size_mb = os.path.getsize(input_path) / 1024 / 1024
+        print(f"lines: {args.lines:,}  size: {size_mb:.1f} MiB  cpus: {os.cpu_count()}")
+
+        baseline = None
+        for workers in args.workers:
+            seconds, _ = timed(f"clean_corpus workers={workers}", clean_corpus, input_path, os.path.join(tmp, f"out-{workers}"), pipeline, workers=workers, chunk_size=args.chunk_size)
+            baseline = baseline or seconds
+            print(f"{'':<48} {size_mb / seconds:8.1f} MiB/s  speedup x{baseline / seconds:.2f}")
+
+        peak_rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+        print(f"peak worker RSS: {peak_rss:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Near-duplicate detection throughput and index memory of `NearDuplicateDetector`.
+
+The corpus mixes distinct reviews (random words) with lightly edited copies of earlier ones (case, punctuation and spacing changes, a dropped word), so the share of near duplicates found can be checked against `--dup-rate`.
+The per-text Python MinHash baseline shows the cost of the vectorized signatures, it runs on the first `--baseline-docs` texts only.
+
+Usage: python benchmarks/bench_dedup.py [--docs 1000000] [--dup-rate 0.3] [--batch-size 10000] [--baseline-docs 2000]
+"""
+import argparse
+import random
+import zlib
+
+from _common import sample_reviews, timed
+
+from tiketnlphub.preprocessing.dedup import MinHash, NearDuplicateDetector
+
+
+def synthetic_corpus(docs: int, dup_rate: float, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    vocabulary = sorted({word for text in sample_reviews(1000, seed) for word in text.split()})
+    texts = []
+    for _ in range(docs):
+        if texts and rng.random() < dup_rate:
+            words = rng.choice(texts).split()
+            if len(words) > 12:
+                del words[rng.randrange(len(words))]
+            text = "  ".join(words) if rng.random() < 0.5 else " ".join(words).upper()
+            texts.append(text + rng.choice(["", "!", "!!", "."]))
+        else:
+            texts.append(" ".join(rng.choices(vocabulary, k=rng.randint(15, 30))))
+    return texts
+
+
+def python_signatures(texts, num_perm=128, shingle_size=5):
+    # one Python set of shingles and `num_perm` salted CRC32 minimums per text
+    signatures = []
+    for text in texts:
+        data = " ".join(text.lower().split()).encode("utf-8")
+        shingles = {data[i:i + shingle_size] for i in range(max(len(data) - shingle_size + 1, 1))}
+        signatures.append([min(zlib.crc32(shingle, seed) for shingle in shingles) for seed in range(num_perm)])
+    return signatures
+
+
+def deduplicate(texts, batch_size):
+    detector = NearDuplicateDetector(threshold=0.8)
+    unique = sum(1 for _ in detector.deduplicate(texts, batch_size=batch_size))
+    return detector, unique
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=1_000_000)
+    parser.add_argument("--dup-rate", type=float, default=0.3)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--baseline-docs", type=int, default=2_000)
+    args = parser.parse_args()
+
+    texts = synthetic_corpus(args.docs, args.dup_rate)
+    print(f"docs: {args.docs:,}  duplicate rate: {args.dup_rate}  batch size: {args.batch_size:,}")
+
+    baseline = texts[:args.baseline_docs]
+    seconds, _ = timed(f"Python MinHash signatures ({len(baseline):,} docs)", python_signatures, baseline)
+    print(f"{'':<48} {len(baseline) / seconds:10,.0f} docs/s")
+    seconds, _ = timed(f"MinHash.signatures ({len(baseline):,} docs)", MinHash().signatures, baseline)
+    print(f"{'':<48} {len(baseline) / seconds:10,.0f} docs/s")
+
+    seconds, (detector, unique) = timed("NearDuplicateDetector.deduplicate", deduplicate, texts, args.batch_size)
+    print(f"{'':<48} {args.docs / seconds:10,.0f} docs/s")
+    print(f"unique texts: {unique:,} ({1 - unique / args.docs:.1%} removed)  index: {detector.index.nbytes / 2 ** 20:.1f} MiB "
+          f"({detector.index.nbytes / max(unique, 1):.0f} bytes per unique text, {len(detector.index._runs)} runs)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Full-width folding: `normalize_fullwidth_chars` vs. chained `str.replace` calls and per-text NFKC normalization.
+
+The corpus mixes the review templates with Japanese, Korean and Chinese reviews written with full-width letters, digits and punctuations.
+The chained baseline calls `str.replace` once per entry of the same translation table, NFKC is `unicodedata.normalize` on every text, which also folds ligatures, superscripts and fractions.
+
+Usage: python benchmarks/bench_fullwidth.py [--docs 200000]
+"""
+import argparse
+import unicodedata
+
+from _common import sample_reviews, timed
+
+from tiketnlphub.preprocessing.normalizer import load_fullwidth_table, normalize_fullwidth_chars
+
+
+ASIAN_REVIEWS = [
+    "ホテルは最高でした！部屋は１２３号室、ＷｉＦｉも速い。スタッフも親切です",
+    "방이 깨끗해요！ＧＯＯＤ　위치도 좋고 조식도 맛있어요～",
+    "【推荐】房间很干净，服务很好！价格ＲＰ　５００．０００",
+    "ﾌﾛﾝﾄのｽﾀｯﾌが｢ﾁｪｯｸｲﾝ｣を早めてくれました",
+]
+
+
+def corpus(docs: int) -> list:
+    reviews = sample_reviews(docs)
+    return [f"{ASIAN_REVIEWS[i % len(ASIAN_REVIEWS)]} {i}" if i % 2 else text for i, text in enumerate(reviews)]
+
+
+def chained_replace(texts, pairs):
+    results = []
+    for text in texts:
+        for char, replacement in pairs:
+            text = text.replace(char, replacement)
+        results.append(text)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=200_000)
+    args = parser.parse_args()
+
+    texts = corpus(args.docs)
+    pairs = [(chr(code_point), replacement) for code_point, replacement in load_fullwidth_table().items()]
+    print(f"docs: {args.docs:,}  table: {len(pairs)} characters")
+
+    timed("chained str.replace", chained_replace, texts, pairs)
+    timed("unicodedata.normalize NFKC", lambda: [unicodedata.normalize("NFKC", text) for text in texts])
+    timed("normalize_fullwidth_chars", lambda: [normalize_fullwidth_chars(text) for text in texts])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Fused deletion passes vs. calling the deletion steps one after another.
+
+Usage: python benchmarks/bench_fusion.py [--docs 200000]
+"""
+import argparse
+
+from _common import sample_reviews, timed
+
+from tiketnlphub.preprocessing import cleaner
+from tiketnlphub.preprocessing.pipeline import Pipeline
+
+
+CHAINS = [
+    ["remove_urls", "remove_mentions", "remove_hashtags", "remove_phone_numbers", "remove_digits"],
+    ["remove_hashtags", "remove_mentions", "remove_phone_numbers", "remove_urls", "remove_digits"],
+    ["remove_mentions", "remove_hashtags", "remove_digits"],
+]
+
+
+def sequential(texts, names):
+    steps = [getattr(cleaner, name) for name in names]
+    results = []
+    for text in texts:
+        for step in steps:
+            text = step(text)
+        results.append(text)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=200_000)
+    args = parser.parse_args()
+
+    texts = sample_reviews(args.docs)
+    print(f"docs: {args.docs:,}")
+    for names in CHAINS:
+        pipeline = Pipeline(names)
+        passes = len(pipeline.compile()[0].rules)
+        print(f"{' > '.join(name[len('remove_'):] for name in names)}  ({len(names)} steps -> {passes} passes)")
+        _, expected = timed("  sequential steps", sequential, texts, names, repeat=3)
+        _, result = timed("  fused pipeline", pipeline.run_batch, texts, repeat=3)
+        assert expected == result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Featurization throughput of `HashingVectorizer`, fused with cleaning, vs. clean-then-count with a vocabulary.
+
+The baseline cleans the corpus with `run_batch`, then builds a vocabulary dict of the n-grams and counts them per text in Python, which is what a separate bag-of-words pass does, with its vocabulary held in memory.
+scikit-learn's `HashingVectorizer` is timed on the cleaned texts when it is installed.
+
+Usage: python benchmarks/bench_hashing.py [--docs 500000] [--chunk-size 10000] [--max-n 2]
+"""
+import argparse
+from collections import Counter
+
+from _common import sample_reviews, timed
+
+from tiketnlphub.feature_extraction.hashing import HashingVectorizer
+from tiketnlphub.preprocessing.pipeline import Pipeline
+
+
+STEPS = ["remove_urls", "remove_punctuations", "remove_white_spaces"]
+
+
+def vocabulary_counts(pipeline, texts, max_n):
+    vocabulary, rows = {}, []
+    for text in pipeline.run_batch(texts):
+        tokens = text.lower().split()
+        ngrams = [" ".join(tokens[i:i + n]) for n in range(1, max_n + 1) for i in range(len(tokens) - n + 1)]
+        rows.append({vocabulary.setdefault(ngram, len(vocabulary)): count for ngram, count in Counter(ngrams).items()})
+    return vocabulary, rows
+
+
+def fused(vectorizer, texts, chunk_size):
+    return sum(len(chunk.data) for chunk in vectorizer.transform_stream(texts, chunk_size=chunk_size))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=500_000)
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    parser.add_argument("--max-n", type=int, default=2)
+    args = parser.parse_args()
+
+    texts = sample_reviews(args.docs)
+    pipeline = Pipeline(STEPS)
+    print(f"docs: {args.docs:,}  n-grams: 1-{args.max_n}  chunk size: {args.chunk_size:,}")
+
+    _, (vocabulary, _) = timed("clean, then vocabulary counts", vocabulary_counts, pipeline, texts, args.max_n)
+    print(f"vocabulary: {len(vocabulary):,} n-grams")
+    vectorizer = HashingVectorizer(n_features=2 ** 20, ngram_range=(1, args.max_n), pipeline=pipeline)
+    seconds, nonzeros = timed("HashingVectorizer with pipeline (one pass)", fused, vectorizer, texts, args.chunk_size)
+    print(f"{'':<48} {args.docs / seconds:10,.0f} docs/s, {nonzeros:,} non-zeros")
+    timed("pipeline run_batch alone", pipeline.run_batch, texts)
+
+    try:
+        from sklearn.feature_extraction.text import HashingVectorizer as SklearnHashingVectorizer
+    except ImportError:
+        print("scikit-learn not installed, skipped")
+    else:
+        cleaned = pipeline.run_batch(texts)
+        sklearn = SklearnHashingVectorizer(n_features=2 ** 20, ngram_range=(1, args.max_n), token_pattern=r"\S+")
+        timed("scikit-learn HashingVectorizer (cleaned)", sklearn.transform, cleaned)
+
+
+if __name__ == "__main__":
+    main()
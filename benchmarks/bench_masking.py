@@ -0,0 +1,68 @@
+"""Placeholder masking and value extraction: the `mode` of the removal steps vs. separate `re.findall` and `re.sub` calls.
+
+Every text goes through `remove_urls`, `remove_mentions`, `remove_hashtags` and `remove_phone_numbers`.
+The baseline extracts the values with `re.findall` and masks or removes them with `re.sub`, scanning every text twice per pattern; `mode="extract"` and `mode="mask"` scan it once.
+
+Usage: python benchmarks/bench_masking.py [--docs 200000]
+"""
+import argparse
+import re
+
+from _common import sample_reviews, timed
+
+from tiketnlphub.preprocessing import cleaner
+from tiketnlphub.preprocessing.re_pattern import RegexReplacement, RegexString
+
+
+STEPS = [
+    (cleaner.remove_urls, RegexString.URLS, re.IGNORECASE, "urls"),
+    (cleaner.remove_mentions, RegexString.MENTIONS, 0, "mentions"),
+    (cleaner.remove_hashtags, RegexString.HASTAGS, 0, "hashtags"),
+    (cleaner.remove_phone_numbers, RegexString.PHONE_NUMBERS, re.IGNORECASE, "phone_numbers"),
+]
+
+
+def findall_and_sub(texts, mask: bool):
+    # the whole match of every pattern, as `findall` returns the groups of patterns with groups
+    patterns = [(re.compile(f"(?:{pattern})", flags), RegexReplacement.PLACEHOLDERS[key] if mask else "") for _, pattern, flags, key in STEPS]
+    results = []
+    for text in texts:
+        values = []
+        for pattern, replacement in patterns:
+            values.extend(match.group() for match in pattern.finditer(text))
+            text = pattern.sub(replacement, text)
+        results.append((text, values))
+    return results
+
+
+def run_mode(texts, mode: str):
+    results = []
+    for text in texts:
+        values = []
+        for remove, _, _, _ in STEPS:
+            text = remove(text, mode=mode)
+            if mode == "extract":
+                text, extracted = text
+                values.extend(extracted)
+        results.append((text, values))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=200_000)
+    args = parser.parse_args()
+
+    texts = sample_reviews(args.docs)
+    print(f"docs: {args.docs:,}")
+
+    timed("remove (re.sub only)", run_mode, texts, "remove", repeat=3)
+    timed("finditer + re.sub, removed", findall_and_sub, texts, False, repeat=3)
+    _, extracted = timed("mode='extract'", run_mode, texts, "extract", repeat=3)
+    timed("finditer + re.sub, masked", findall_and_sub, texts, True, repeat=3)
+    timed("mode='mask'", run_mode, texts, "mask", repeat=3)
+    print(f"{'':<48} {sum(len(values) for _, values in extracted):,} values extracted")
+
+
+if __name__ == "__main__":
+    main()
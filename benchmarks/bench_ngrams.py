@@ -0,0 +1,79 @@
+"""N-gram counting: `collections.Counter` of strings vs. `NgramCounter` and the parallel `count_ngrams`.
+
+Peak memory is measured in separate runs with tracemalloc, which sees both Python objects and NumPy buffers, for growing corpora (`--peak-docs`): a chunk of texts has a fixed cost,
+so `NgramCounter` only uses less memory than a `Counter` once the vocabulary is large. The corpus gets a long tail of rare tokens (room numbers, names) so the bigram vocabulary keeps growing like a real one.
+
+Usage: python benchmarks/bench_ngrams.py [--docs 500000] [--max-n 2] [--workers 4] [--max-size 0] [--sketch-width 0] [--peak-docs 10000,100000,500000]
+"""
+import argparse
+import random
+import tracemalloc
+from collections import Counter
+
+from _common import sample_reviews, timed
+
+from tiketnlphub.feature_extraction.ngrams import NgramCounter, count_ngrams
+
+
+def corpus(docs: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    return [f"{text} room{rng.randint(0, 99999)} guest{rng.randint(0, 99999)}" for text in sample_reviews(docs, seed)]
+
+
+def python_counter(texts, max_n):
+    counts = Counter()
+    for text in texts:
+        tokens = text.lower().split()
+        for n in range(1, max_n + 1):
+            counts.update(" ".join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+    return counts
+
+
+def ngram_counter(texts, max_n, options):
+    counter = NgramCounter(ngram_range=(1, max_n), **options)
+    counter.update_stream(texts, chunk_size=10_000)
+    return counter
+
+
+def peak(label, func, *args):
+    tracemalloc.start()
+    result = func(*args)
+    print(f"{label + ' peak memory':<48} {tracemalloc.get_traced_memory()[1] / 2 ** 20:10.1f} MiB")
+    tracemalloc.stop()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=500_000)
+    parser.add_argument("--max-n", type=int, default=2)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--max-size", type=int, default=0)
+    parser.add_argument("--sketch-width", type=int, default=0)
+    parser.add_argument("--peak-docs", default="10000,100000,500000")
+    args = parser.parse_args()
+
+    texts = corpus(args.docs)
+    options = {"max_size": args.max_size or None, "sketch_width": args.sketch_width or None}
+    print(f"docs: {args.docs:,}  n-grams: 1-{args.max_n}  options: {options}")
+
+    _, expected = timed("collections.Counter", python_counter, texts, args.max_n)
+    print(f"{'':<48} {len(expected):10,} distinct n-grams")
+    _, counter = timed("NgramCounter", ngram_counter, texts, args.max_n, options)
+    top, found = sorted(expected.items(), key=lambda item: (-item[1], item[0]))[:1000], counter.most_common(1000)
+    recall = len({ngram for ngram, _ in top} & {ngram for ngram, _ in found}) / len(top)
+    print(f"{'':<48} {counter.nbytes / 2 ** 20:10.1f} MiB of count arrays, top-1000 exact: {top == found}, recall: {recall:.3f}")
+    timed(f"count_ngrams ({args.workers} workers)", count_ngrams, texts, (1, args.max_n), workers=args.workers, **options)
+    timed("most_common(50_000, min_count=5)", counter.most_common, 50_000, min_count=5)
+    del expected, counter
+
+    for docs in map(int, args.peak_docs.split(",")):
+        texts = corpus(docs)
+        print(f"docs: {docs:,}")
+        distinct = len(peak("collections.Counter", python_counter, texts, args.max_n))
+        peak("NgramCounter", ngram_counter, texts, args.max_n, options)
+        print(f"{'':<48} {distinct:10,} distinct n-grams")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Shared-memory text transport (`run_parallel`) vs. `ProcessPoolExecutor.map` on short reviews.
+
+`ProcessPoolExecutor.map` pickles every input and output string and the callable with every chunk. `run_parallel` packs each chunk into one UTF-8 buffer plus offsets in shared memory, so only small descriptors cross the pipes.
+Compare with the serial `run_batch` time to see the share of the transport overhead.
+
+Usage: python benchmarks/bench_parallel.py [--docs 1000000] [--workers 4] [--chunk-size 10000]
+"""
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from _common import sample_reviews, timed
+
+from tiketnlphub.preprocessing.parallel import run_parallel
+from tiketnlphub.preprocessing.pipeline import Pipeline
+
+
+STEPS = ["remove_urls", "remove_white_spaces"]
+
+
+def executor_map(pipeline, texts, workers, chunk_size):
+    with ProcessPoolExecutor(workers) as executor:
+        return list(executor.map(pipeline, texts, chunksize=chunk_size))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    # short reviews, where moving the strings costs as much as cleaning them
+    texts = [text[:40] for text in sample_reviews(args.docs)]
+    pipeline = Pipeline(STEPS)
+
+    print(f"docs: {args.docs:,}  workers: {args.workers}  chunk size: {args.chunk_size:,}")
+    _, expected = timed("serial run_batch", pipeline.run_batch, texts)
+    _, result = timed("ProcessPoolExecutor.map", executor_map, pipeline, texts, args.workers, args.chunk_size)
+    assert expected == result
+    _, result = timed("run_parallel (shared memory)", run_parallel, pipeline, texts, workers=args.workers, chunk_size=args.chunk_size)
+    assert expected == result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Price extraction: `extract_prices_batch` vs. the chain of textual normalizers pricing analytics runs before re-parsing prices.
+
+The corpus is price dense: every review mentions two to four prices in the formats of the reviews (`Rp. 252,000/night`, `500rb`, `1,5jt`, `$50`, `€200`).
+The baseline runs `normalize_symbols`, `normalize_slashes` and `normalize_non_ascii_char_currencies` and then finds the amounts with `re.findall`, without parsing them; `extract_prices_batch` returns parsed `(amount, currency, per_unit, span)` records in one scan.
+
+Usage: python benchmarks/bench_prices.py [--docs 200000]
+"""
+import argparse
+import random
+import re
+
+from _common import sample_reviews, timed
+
+from tiketnlphub.feature_extraction.prices import extract_prices_batch
+from tiketnlphub.preprocessing.normalizer import normalize_non_ascii_char_currencies, normalize_slashes, normalize_symbols
+
+
+PRICES = [
+    "Rp. 252,000/night", "500rb", "1,5jt per malam", "$50", "€200", "IDR 1.250.000", "Rp 450.000,- semalam", "50k/pax", "$35 a night", "2jt",
+]
+
+AMOUNTS = re.compile(r"(?:Rp\.?|IDR|USD|EUR|\$)\s?[\d.,]+|[\d.,]+\s?(?:rb|k|jt)\b", re.IGNORECASE)
+
+
+def corpus(docs: int) -> list:
+    rng = random.Random(0)
+    return [f"{text} harga {' tapi '.join(rng.sample(PRICES, rng.randint(2, 4)))}" for text in sample_reviews(docs)]
+
+
+def normalize_and_findall(texts):
+    results = []
+    for text in texts:
+        text = normalize_non_ascii_char_currencies(normalize_slashes(normalize_symbols(text, lang="id"), lang="id"))
+        results.append(AMOUNTS.findall(text))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=200_000)
+    args = parser.parse_args()
+
+    texts = corpus(args.docs)
+    print(f"docs: {args.docs:,}")
+
+    timed("normalizers + re.findall (unparsed)", normalize_and_findall, texts, repeat=3)
+    _, prices = timed("extract_prices_batch", extract_prices_batch, texts, repeat=3)
+    print(f"{'':<48} {sum(map(len, prices)):,} prices")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""De-elongation: the three regex steps `remove_repeated_chars`, `remove_repeated_puncts` and `remove_repeated_words` vs. the single pass `collapse_repeats`.
+
+The corpus is the review templates with elongated words, punctuation runs and repeated words, as in "bagusss bangettt!!!!! sangat sangat".
+A Pipeline of the three steps is timed against a Pipeline of `collapse_repeats`, the results are checked to be identical.
+
+Usage: python benchmarks/bench_repeats.py [--docs 200000]
+"""
+import argparse
+import random
+
+from _common import sample_reviews, timed
+
+from tiketnlphub.preprocessing.cleaner import collapse_repeats_batch
+from tiketnlphub.preprocessing.pipeline import Pipeline
+
+
+ELONGATIONS = ["bagusss bangettt!!!!!", "mantap mantap mantappp", "sangat sangat puas.....", "kurang?!?!", "okeee", "nyaman nyaman"]
+
+
+def corpus(docs: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    return [f"{text} {rng.choice(ELONGATIONS)}" if i % 2 else text for i, text in enumerate(sample_reviews(docs, seed))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=200_000)
+    args = parser.parse_args()
+
+    texts = corpus(args.docs)
+    print(f"docs: {args.docs:,}")
+
+    _, expected = timed("3 regex steps", Pipeline(["remove_repeated_chars", "remove_repeated_puncts", "remove_repeated_words"]).run_batch, texts, repeat=3)
+    _, fused = timed("collapse_repeats", Pipeline(["collapse_repeats"]).run_batch, texts, repeat=3)
+    timed("collapse_repeats_batch", collapse_repeats_batch, texts, repeat=3)
+    print(f"{'':<48} identical: {expected == fused}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Sentence splitting throughput of `SentenceSplitter`, in sentences per minute on one core, vs. a naive split on the white spaces after `.?!`.
+
+The naive split breaks sentences after every abbreviation (Rp., Jl., No.), number bullet and ellipsis. NLTK's Punkt tokenizer is timed as well when it is installed.
+
+Usage: python benchmarks/bench_sentences.py [--docs 200000]
+"""
+import argparse
+import re
+
+from _common import sample_reviews, timed
+
+from tiketnlphub.preprocessing.sentences import SentenceSplitter
+
+
+EXTRA = "Hotel di Jl. Sudirman No. 5. Harga Rp. 450.000 per malam... tapi worth it! Check-out jam 12.00, sarapan 4.5/5."
+
+NAIVE = re.compile(r"(?<=[.!?])\s+")
+
+
+def naive_split(texts):
+    return [NAIVE.split(text) for text in texts]
+
+
+def report(label, seconds, sentences):
+    print(f"{'':<48} {sentences:,} sentences, {sentences / seconds * 60 / 1e6:.1f} M sentences/minute ({label})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=200_000)
+    args = parser.parse_args()
+
+    texts = [f"{text} {EXTRA}" if i % 2 else text for i, text in enumerate(sample_reviews(args.docs))]
+    splitter = SentenceSplitter()
+    print(f"docs: {args.docs:,}")
+
+    seconds, result = timed("naive re.split", naive_split, texts, repeat=3)
+    report("naive", seconds, sum(map(len, result)))
+    seconds, result = timed("SentenceSplitter.split", lambda: list(splitter.iter_split(texts)), repeat=3)
+    report("split", seconds, sum(map(len, result)))
+    seconds, (indices, _, _) = timed("SentenceSplitter.spans_batch", splitter.spans_batch, texts, repeat=3)
+    report("spans_batch", seconds, len(indices))
+
+    try:
+        import nltk
+        punkt = nltk.data.load("tokenizers/punkt/english.pickle")
+    except (ImportError, LookupError):
+        return
+    seconds, result = timed("nltk punkt", lambda: [punkt.tokenize(text) for text in texts])
+    report("nltk punkt", seconds, sum(map(len, result)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Per-worker memory of a large slang dictionary copied into every pool worker vs. one packed table shared by all of them.
+
+Workers are spawned, so they start from a fresh interpreter like the workers of a long-running service. Each worker receives the dictionary through the pool initializer and normalizes a batch of reviews,
+then reports its private (RssAnon) and shared (RssShmem + RssFile) resident memory from /proc/self/status, which makes this benchmark Linux only.
+
+Usage: python benchmarks/bench_shared_tables.py [--workers 4] [--entries 300000] [--docs 20000]
+"""
+import argparse
+import multiprocessing
+import os
+import tempfile
+
+from _common import sample_reviews, timed
+from bench_slang import synthetic_mapping
+
+from tiketnlphub.preprocessing.slang import SlangDictionary
+
+
+_slangs = None
+
+
+def _init(slangs):
+    global _slangs
+    _slangs = slangs
+
+
+def _rss() -> dict:
+    with open("/proc/self/status") as f:
+        fields = dict(line.split(":", 1) for line in f)
+    return {key: int(fields[key].split()[0]) / 1024 for key in ("RssAnon", "RssFile", "RssShmem")}
+
+
+def _work(texts):
+    if _slangs is not None:
+        texts = [_slangs.normalize(text) for text in texts]
+    return os.getpid(), _rss()
+
+
+def measure(label, slangs, texts, workers):
+    with multiprocessing.get_context("spawn").Pool(workers, initializer=_init, initargs=(slangs,)) as pool:
+        reports = dict(pool.map(_work, [texts] * workers * 2, chunksize=1))
+    private = sum(report["RssAnon"] for report in reports.values()) / len(reports)
+    shared = sum(report["RssFile"] + report["RssShmem"] for report in reports.values()) / len(reports)
+    print(f"{label:<48} {private:8.1f} MiB private {shared:8.1f} MiB shared  per worker ({len(reports)} workers)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--entries", type=int, default=300_000)
+    parser.add_argument("--docs", type=int, default=20_000)
+    args = parser.parse_args()
+
+    texts = [f"{text} yg bgt krn tp gk papa sdh mantul" for text in sample_reviews(args.docs)]
+    _, slangs = timed("build dictionary", SlangDictionary, synthetic_mapping(args.entries))
+    _, table = timed("pack dictionary", slangs.to_table)
+    print(f"entries: {len(slangs):,}  packed table: {table.nbytes / 2 ** 20:.1f} MiB")
+
+    measure("no dictionary", None, texts, args.workers)
+    measure("dict copied into every worker", slangs, texts, args.workers)
+
+    shared_table = table.to_shared_memory()
+    try:
+        measure("packed table in shared memory", SlangDictionary.from_table(shared_table), texts, args.workers)
+    finally:
+        shared_table.unlink()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "slangs.tbl")
+        table.save(path)
+        measure("packed table in a memory-mapped file", SlangDictionary.open(path), texts, args.workers)
+
+    shared = SlangDictionary.from_table(table)
+    _, expected = timed("normalize, dict", lambda: [slangs.normalize(text) for text in texts], repeat=3)
+    _, result = timed("normalize, packed table", lambda: [shared.normalize(text) for text in texts], repeat=3)
+    assert expected == result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Dictionary-driven slang normalization vs. a per-token Python loop, with a large dictionary.
+
+The dictionary holds the built-in Indonesian entries plus synthetic entries, up to `--entries` in total, and is written to a TSV file first to measure its load time.
+The baselines are the usual `" ".join(mapping.get(token.lower(), token) for token in text.split())` loop, which handles neither punctuation, case nor multi-token entries,
+and a per-token loop that strips punctuation and preserves case like `SlangDictionary` does (without multi-token entries).
+
+Usage: python benchmarks/bench_slang.py [--docs 100000] [--entries 100000]
+"""
+import argparse
+import os
+import random
+import string
+import tempfile
+
+from _common import sample_reviews, timed
+
+from tiketnlphub.preprocessing.re_pattern import RegexReplacement
+from tiketnlphub.preprocessing.slang import SlangDictionary
+
+
+def synthetic_mapping(entries: int, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    mapping = dict(RegexReplacement.SLANGS["id"])
+    while len(mapping) < entries:
+        key = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 8)))
+        mapping.setdefault(key, key.upper())
+    return mapping
+
+
+def naive(mapping, text):
+    return " ".join(mapping.get(token.lower(), token) for token in text.split())
+
+
+def per_token(mapping, text):
+    tokens = []
+    for token in text.split():
+        core = token.strip(string.punctuation)
+        replacement = mapping.get(core.lower())
+        if replacement is None:
+            tokens.append(token)
+            continue
+        if len(core) > 1 and core.isupper():
+            replacement = replacement.upper()
+        elif core[:1].isupper():
+            replacement = replacement[:1].upper() + replacement[1:]
+        start = token.find(core)
+        tokens.append(token[:start] + replacement + token[start + len(core):])
+    return " ".join(tokens)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=100_000)
+    parser.add_argument("--entries", type=int, default=100_000)
+    args = parser.parse_args()
+
+    mapping = synthetic_mapping(args.entries)
+    texts = [f"{text} yg bgt krn tp gk papa sdh mantul" for text in sample_reviews(args.docs)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "slangs.tsv")
+        with open(path, "w", encoding="utf-8") as f:
+            f.writelines(f"{key}\t{value}\n" for key, value in mapping.items())
+        print(f"docs: {args.docs:,}  entries: {len(mapping):,}  file: {os.path.getsize(path) / 1e6:.1f} MB")
+        _, slangs = timed("load TSV dictionary", SlangDictionary.from_file, path, repeat=3)
+
+    timed("per-token loop, lowercase lookup only", lambda: [naive(mapping, text) for text in texts], repeat=3)
+    timed("per-token loop, punctuation and case", lambda: [per_token(mapping, text) for text in texts], repeat=3)
+    timed("SlangDictionary.normalize", lambda: [slangs.normalize(text) for text in texts], repeat=3)
+
+
+if __name__ == "__main__":
+    main()
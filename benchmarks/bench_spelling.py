@@ -0,0 +1,110 @@
+"""Spelling correction: `SpellingCorrector` (symmetric delete index) vs. generating every edit of a token, with a large frequency dictionary.
+
+The dictionary holds the words of the synthetic reviews plus random words, up to `--words` in total. Every review gets typos (a deletion, an insertion, a substitution or a transposition) in a few of its words.
+The baseline is the classic edit generation corrector: every string within 2 edits of an out-of-vocabulary token is generated and looked up in the vocabulary, the most frequent closest word wins.
+
+Usage: python benchmarks/bench_spelling.py [--docs 100000] [--words 100000]
+"""
+import argparse
+import os
+import random
+import string
+import tempfile
+
+from _common import sample_reviews, timed
+
+from tiketnlphub.preprocessing.spelling import SpellingCorrector
+
+
+LETTERS = string.ascii_lowercase
+
+
+def frequency_dictionary(words: int, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    frequencies = {word.lower(): 1000 for text in sample_reviews(10_000, seed + 1) for word in text.split() if word.isalpha()}
+    while len(frequencies) < words:
+        frequencies.setdefault("".join(rng.choices(LETTERS, k=rng.randint(3, 10))), rng.randint(1, 500))
+    return frequencies
+
+
+def misspell(word: str, rng: random.Random) -> str:
+    position = rng.randrange(len(word))
+    edit = rng.randrange(4)
+    if edit == 0:
+        return word[:position] + word[position + 1:]
+    if edit == 1:
+        return word[:position] + rng.choice(LETTERS) + word[position:]
+    if edit == 2:
+        return word[:position] + rng.choice(LETTERS) + word[position + 1:]
+    return word[:position] + word[position + 1:position + 2] + word[position:position + 1] + word[position + 2:]
+
+
+def corpus(docs: int) -> list:
+    rng = random.Random(0)
+    texts = []
+    for text in sample_reviews(docs):
+        tokens = text.split()
+        for position in rng.sample(range(len(tokens)), 3):
+            if tokens[position].isalpha() and len(tokens[position]) > 3:
+                tokens[position] = misspell(tokens[position], rng)
+        texts.append(" ".join(tokens))
+    return texts
+
+
+def edits(word: str) -> set:
+    splits = [(word[:i], word[i:]) for i in range(len(word) + 1)]
+    deletes = [left + right[1:] for left, right in splits if right]
+    transposes = [left + right[1] + right[0] + right[2:] for left, right in splits if len(right) > 1]
+    replaces = [left + char + right[1:] for left, right in splits if right for char in LETTERS]
+    inserts = [left + char + right for left, right in splits for char in LETTERS]
+    return set(deletes + transposes + replaces + inserts)
+
+
+def edit_generation(frequencies: dict, texts: list) -> list:
+    results = []
+    for text in texts:
+        tokens = []
+        for token in text.split():
+            word = token.lower()
+            if len(word) < 3 or not word.isalpha() or word in frequencies:
+                tokens.append(token)
+                continue
+            candidates = [edit for edit in edits(word) if edit in frequencies]
+            if not candidates:
+                candidates = [second for edit in edits(word) for second in edits(edit) if second in frequencies]
+            tokens.append(max(candidates, key=frequencies.get) if candidates else token)
+        results.append(" ".join(tokens))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=100_000)
+    parser.add_argument("--words", type=int, default=100_000)
+    args = parser.parse_args()
+
+    frequencies = frequency_dictionary(args.words)
+    texts = corpus(args.docs)
+    print(f"docs: {args.docs:,}  words: {len(frequencies):,}")
+
+    _, corrector = timed("build index", SpellingCorrector, frequencies)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "spelling.tbl")
+        corrector.save(path)
+        print(f"{'':<48} {os.path.getsize(path) / 1e6:.1f} MB index file")
+        _, opened = timed("open memory-mapped index", SpellingCorrector.open, path, repeat=3)
+
+        oov = sorted({token.lower() for text in texts for token in text.split() if token.isalpha() and len(token) >= 3 and token.lower() not in frequencies})
+        best, _ = timed("lookup of every distinct OOV token", lambda: [opened.lookup(word) for word in oov])
+        print(f"{'':<48} {len(oov):,} OOV tokens, {best / len(oov) * 1e6:.0f} us/token")
+
+        sample = texts[:max(len(texts) // 20, 1)]
+        best, _ = timed("edit generation (5% of the docs)", edit_generation, frequencies, sample)
+        print(f"{'':<48} {len(texts) * best / len(sample):.1f} s extrapolated")
+        timed("SpellingCorrector.correct", lambda: [corrector.correct(text) for text in texts], repeat=3)
+        timed("SpellingCorrector.correct_batch", SpellingCorrector.open(path).correct_batch, texts)
+        opened.to_table().close()
+
+
+if __name__ == "__main__":
+    main()
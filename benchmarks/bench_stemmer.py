@@ -0,0 +1,87 @@
+"""Indonesian stemming throughput on a synthetic 10M-token review corpus.
+
+Stemming every token with the affix rules is compared with the memoized `stem_tokens` and with `stem_batch`, which stems the distinct tokens of each batch once.
+The uncached baseline runs on the first `--baseline-tokens` tokens only and is extrapolated. PySastrawi is timed the same way when it is installed.
+
+Usage: python benchmarks/bench_stemmer.py [--tokens 10000000] [--batch-size 10000] [--baseline-tokens 1000000]
+"""
+import argparse
+import random
+
+from _common import timed
+
+from tiketnlphub.preprocessing.stemmer import IndonesianStemmer
+
+
+ROOTS = """
+    bersih nyaman layan puas inap pesan bayar senang tunggu lihat rasa buat dapat sedia letak jangkau sempat makan jalan
+    ruang main kerja baik tulis pakai ajar antar kamar hotel kolam mandi sarap harga murah mahal ramah bantu kecewa
+""".split()
+
+AFFIXES = [
+    "{}", "{}nya", "ke{}an", "pe{}an", "me{}kan", "di{}kan", "ter{}", "ber{}", "se{}nya", "{}an", "{}-{}",
+]
+
+
+def synthetic_corpus(tokens: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    vocabulary = [affix.format(root, root) for root in ROOTS for affix in AFFIXES]
+    # a Zipf-like distribution, plus prices and room numbers as a long tail of rare tokens
+    weights = [1 / rank for rank in range(1, len(vocabulary) + 1)]
+    texts, count = [], 0
+    while count < tokens:
+        words = rng.choices(vocabulary, weights, k=rng.randint(10, 30))
+        words.append(f"Rp{rng.randint(100, 2000) * 1000}")
+        texts.append(" ".join(words))
+        count += len(words)
+    return texts
+
+
+def per_token(stemmer, texts):
+    return [" ".join(map(stemmer._stem, text.split())) for text in texts]
+
+
+def memoized(stemmer, texts):
+    return [" ".join(stemmer.stem_tokens(text.split())) for text in texts]
+
+
+def batched(stemmer, texts, batch_size):
+    results = []
+    for start in range(0, len(texts), batch_size):
+        results.extend(stemmer.stem_batch(texts[start:start + batch_size]))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokens", type=int, default=10_000_000)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--baseline-tokens", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    texts = synthetic_corpus(args.tokens)
+    tokens = sum(len(text.split()) for text in texts)
+    vocabulary = len({token for text in texts for token in text.split()})
+    baseline = synthetic_corpus(args.baseline_tokens)
+    scale = tokens / sum(len(text.split()) for text in baseline)
+    print(f"tokens: {tokens:,}  texts: {len(texts):,}  distinct tokens: {vocabulary:,}")
+
+    seconds, _ = timed(f"uncached rules (x{scale:.0f} extrapolated)", per_token, IndonesianStemmer(cache_size=0), baseline)
+    print(f"{'':<48} {seconds * scale:10.3f} s")
+    try:
+        from Sastrawi.Stemmer.StemmerFactory import StemmerFactory
+    except ImportError:
+        print("PySastrawi not installed, skipped")
+    else:
+        sastrawi = StemmerFactory().create_stemmer(False)
+        seconds, _ = timed(f"PySastrawi (x{scale:.0f} extrapolated)", lambda: [sastrawi.stem(text) for text in baseline])
+        print(f"{'':<48} {seconds * scale:10.3f} s")
+
+    _, expected = timed("memoized stem_tokens", memoized, IndonesianStemmer(), texts)
+    seconds, result = timed("stem_batch (distinct tokens)", batched, IndonesianStemmer(), texts, args.batch_size)
+    assert expected == result
+    print(f"{'':<48} {tokens / seconds:10,.0f} tokens/s")
+
+
+if __name__ == "__main__":
+    main()
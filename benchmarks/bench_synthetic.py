@@ -0,0 +1,58 @@
+"""Synthetic review generation throughput, and the cost of every pipeline step on regular vs. adversarial reviews.
+
+`SyntheticReviews` generates the shared workload of the benchmarks (see `_common.sample_reviews`). The generation rate is measured by streaming `--stream` reviews batch by batch.
+Then every pipeline step of `STEPS` (but `correct_spelling`, which needs a dictionary) runs on `--docs` regular and `--docs` adversarial reviews, whose long runs stress the patterns of `re_pattern.py`;
+the steps whose cost grows the most on adversarial reviews come first.
+
+Usage: python benchmarks/bench_synthetic.py [--docs 5000] [--stream 1000000] [--run-length 64]
+"""
+import argparse
+import time
+import warnings
+
+from _common import sample_reviews, timed
+
+from tiketnlphub.datasets.synthetic import SyntheticReviews
+from tiketnlphub.preprocessing.pipeline import STEPS
+
+
+def stream(n: int) -> int:
+    return sum(map(len, SyntheticReviews().iter_batches(n)))
+
+
+def cost(func, texts) -> float:
+    start = time.perf_counter()
+    for text in texts:
+        func(text)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=5_000)
+    parser.add_argument("--stream", type=int, default=1_000_000)
+    parser.add_argument("--run-length", type=int, default=64)
+    args = parser.parse_args()
+
+    best, _ = timed(f"stream {args.stream:,} reviews", stream, args.stream)
+    print(f"{'':<48} {args.stream / best:,.0f} reviews/second")
+
+    regular = sample_reviews(args.docs)
+    adversarial = SyntheticReviews(adversarial=True, run_length=args.run_length).generate(args.docs)
+    print(f"docs: {args.docs:,}  mean length: {sum(map(len, regular)) / args.docs:.0f} regular, {sum(map(len, adversarial)) / args.docs:.0f} adversarial chars")
+
+    costs = []
+    with warnings.catch_warnings():
+        # BeautifulSoup warns about texts looking like file names or URLs
+        warnings.simplefilter("ignore")
+        for name, func in STEPS.items():
+            if name != "correct_spelling":
+                costs.append((name, cost(func, regular), cost(func, adversarial)))
+
+    print(f"{'step':<40} {'regular':>10} {'adversarial':>12} {'ratio':>8}")
+    for name, regular_cost, adversarial_cost in sorted(costs, key=lambda item: item[2] / max(item[1], 1e-9), reverse=True):
+        print(f"{name:<40} {regular_cost:9.3f}s {adversarial_cost:11.3f}s {adversarial_cost / max(regular_cost, 1e-9):7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
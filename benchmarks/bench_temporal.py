@@ -0,0 +1,52 @@
+"""Time and date normalization: `TimeDateRecognizer`, one scan shared by every format, vs. one regex scan per format and `handle_time_format`.
+
+The corpus mixes the review templates with time and date expressions (`jam 3 sore`, `14.30 WIB`, `check-in 2pm`, `17 Agustus 2023`, `Aug 17, 2023`, `17/08/2023`).
+The per format baseline runs `finditer` with each format of the recognizer compiled on its own, without parsing the matches; `handle_time_format` only rewrites `hh:mm` times.
+
+Usage: python benchmarks/bench_temporal.py [--docs 200000]
+"""
+import argparse
+import random
+import re
+
+from _common import sample_reviews, timed
+
+from tiketnlphub.preprocessing.cleaner import handle_time_format
+from tiketnlphub.preprocessing.re_pattern import RegexReplacement
+from tiketnlphub.preprocessing.temporal import TimeDateRecognizer, _alternation, _formats
+
+
+EXPRESSIONS = [
+    "jam 3 sore", "14.30 WIB", "check-in 2pm", "17 Agustus 2023", "Aug 17, 2023", "17/08/2023", "pukul 7 pagi", "06:30-10:00", "12 am", "1 Jan",
+]
+
+
+def corpus(docs: int) -> list:
+    rng = random.Random(0)
+    return [f"{text} {rng.choice(EXPRESSIONS)}" if i % 2 else text for i, text in enumerate(sample_reviews(docs))]
+
+
+def scan_per_format(texts, patterns):
+    return [[match.span() for pattern in patterns for match in pattern.finditer(text)] for text in texts]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=200_000)
+    args = parser.parse_args()
+
+    texts = corpus(args.docs)
+    patterns = [re.compile(rf"(?<![\w.,:/]){pattern}", re.IGNORECASE) for pattern in _formats(_alternation(RegexReplacement.MONTHS))]
+    print(f"docs: {args.docs:,}  formats: {len(patterns)}")
+
+    timed("handle_time_format (hh:mm only)", lambda: [handle_time_format(text) for text in texts], repeat=3)
+    timed("finditer per format (unparsed)", scan_per_format, texts, patterns, repeat=3)
+    recognizer = TimeDateRecognizer()
+    best, _ = timed("TimeDateRecognizer.normalize_batch", recognizer.normalize_batch, texts, repeat=3)
+    print(f"{'':<48} {args.docs / best:,.0f} docs/second")
+    _, expressions = timed("TimeDateRecognizer.recognize", lambda: [recognizer.recognize(text) for text in texts], repeat=3)
+    print(f"{'':<48} {sum(map(len, expressions)):,} times and dates")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Shared token stream vs. token-level steps that split and join the text each.
+
+Per-review allocations are measured with tracemalloc as the transient peak above the memory held before the review is processed.
+
+Usage: python benchmarks/bench_tokens.py [--docs 100000]
+"""
+import argparse
+import tracemalloc
+
+from _common import sample_reviews, timed
+
+from tiketnlphub.preprocessing import cleaner, normalizer
+from tiketnlphub.preprocessing.pipeline import Pipeline
+
+
+STEPS = ["upper_i_word", "remove_white_spaces", "normalize_non_ascii_char_currencies"]
+
+
+def sequential(text):
+    text = cleaner.upper_i_word(text)
+    text = cleaner.remove_white_spaces(text)
+    return normalizer.normalize_non_ascii_char_currencies(text)
+
+
+def peak_bytes_per_review(func, texts):
+    tracemalloc.start()
+    total = 0
+    for text in texts:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        func(text)
+        _, peak = tracemalloc.get_traced_memory()
+        total += peak - before
+    tracemalloc.stop()
+    return total / len(texts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=100_000)
+    args = parser.parse_args()
+
+    # long, whitespace-heavy reviews make the cost of every extra split/join visible
+    texts = [f"  i   {text}  €20 " * 8 for text in sample_reviews(args.docs)]
+    pipeline = Pipeline(STEPS)
+    plan = pipeline.compile()
+
+    print(f"docs: {args.docs:,}  plan: {plan}")
+    _, expected = timed("separate token steps", lambda: [sequential(text) for text in texts], repeat=3)
+    _, result = timed("shared token stream", pipeline.run_batch, texts, repeat=3)
+    assert expected == result
+
+    sample = texts[:10_000]
+    print(f"{'separate token steps':<48} {peak_bytes_per_review(sequential, sample):10.0f} B peak/review")
+    print(f"{'shared token stream':<48} {peak_bytes_per_review(pipeline, sample):10.0f} B peak/review")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+from typing import Callable, Dict, Iterator, List
+import random
+
+from ..preprocessing.re_pattern import RegexReplacement, RegexString
+
+
+LANGUAGES = ("id", "en", "mixed")
+
+# the features a review may contain, with the share of reviews containing each of them by default
+DEFAULT_RATES = {
+    "emojis": 0.3,
+    "emoticons": 0.2,
+    "urls": 0.05,
+    "mentions": 0.1,
+    "hashtags": 0.1,
+    "html": 0.05,
+    "bullets": 0.1,
+    "prices": 0.2,
+    "times": 0.15,
+    "elongations": 0.25,
+    "phone_numbers": 0.03,
+    "slangs": 0.3,
+}
+
+NOUNS = {
+    "id": ["kamar", "kamar mandi", "sarapan", "kolam renang", "pelayanan", "staf", "lokasi", "wifi", "AC", "kasur", "lobi", "parkiran", "resepsionis", "pemandangan", "restoran", "handuk"],
+    "en": ["room", "bathroom", "breakfast", "pool", "service", "staff", "location", "wifi", "AC", "bed", "lobby", "parking", "front desk", "view", "restaurant", "towel"],
+}
+
+ADJECTIVES = {
+    "id": ["bersih", "kotor", "nyaman", "enak", "ramah", "strategis", "luas", "sempit", "bagus", "mahal", "murah", "lambat", "kencang", "dingin", "berisik", "wangi"],
+    "en": ["clean", "dirty", "comfortable", "delicious", "friendly", "strategic", "spacious", "small", "good", "pricey", "cheap", "slow", "fast", "cold", "noisy", "fresh"],
+}
+
+INTENSIFIERS = {
+    "id": ["sangat", "cukup", "agak", "kurang", "lumayan", "terlalu", "tidak"],
+    "en": ["very", "quite", "a bit", "not so", "really", "too", "super"],
+}
+
+TEMPLATES = {
+    "id": [
+        "{noun}nya {intensifier} {adjective}",
+        "{noun} {adjective} banget",
+        "tapi {noun}nya {adjective}",
+        "overall puas, {noun} {adjective} dan {noun2} {adjective2}",
+        "sayang {noun} {intensifier} {adjective}",
+        "menginap {nights} malam, {noun}nya {adjective}",
+        "{noun} {adjective}, {noun2} {intensifier} {adjective2}",
+        "pasti balik lagi karena {noun}nya {adjective}",
+    ],
+    "en": [
+        "the {noun} was {intensifier} {adjective}",
+        "{noun} {adjective}, {noun2} {adjective2}",
+        "I stayed {nights} nights and the {noun} was {adjective}",
+        "would recommend, the {noun} is {adjective}",
+        "not bad but the {noun} is {intensifier} {adjective}",
+        "the {noun} was {adjective} and the {noun2} was {intensifier} {adjective2}",
+        "will come back for the {adjective} {noun}",
+        "the {noun} could be more {adjective2}",
+    ],
+}
+
+ENDINGS = ["", ".", ".", ".", "!", "..."]
+
+EMOJIS = ["😍", "👍", "🙏", "😡", "🔥", "💯", "😊", "😭", "🏖️", "✨", "❤️", "👎🏻"]
+
+SITES = ["tiket.com", "example.com", "booking.example.co.id", "hotelku.id"]
+
+NAMES = ["budi", "dewi", "ayu_putri", "JohnTravel", "tiketcom", "rina88"]
+
+TAGS = ["staycation", "JWMarriott", "liburan2023", "BaliTrip", "HotelReview", "tiketcom"]
+
+ELONGATIONS = ["bagusss", "bangettt", "sooo", "enakkk", "mantappp", "niceee", "!!!", "???", "?!?!", "......"]
+
+MONTH_NAMES = [month for month in RegexReplacement.MONTHS if len(month) > 3]
+
+SLANGS = sorted(RegexReplacement.SLANGS["id"])
+
+
+def _price(rng: random.Random) -> str:
+    amount = rng.randrange(100, 5000) * 1000
+    formats = (
+        f"Rp. {amount:,}/malam",
+        f"Rp {amount:,}".replace(",", "."),
+        f"IDR {amount:,}",
+        f"{amount // 1000}rb",
+        f"{amount // 1000}k/night",
+        f"{amount / 1e6:.1f}jt".replace(".", ","),
+        f"${rng.randint(20, 400)}",
+        f"€{rng.randint(20, 400)} per night",
+    )
+    return rng.choice(formats)
+
+
+def _time(rng: random.Random) -> str:
+    hour, minute = rng.randint(0, 23), rng.choice((0, 15, 30, 45))
+    formats = (
+        f"jam {hour}.{minute:02d}",
+        f"{hour:02d}:{minute:02d}",
+        f"pukul {hour}.{minute:02d} WIB",
+        f"{hour % 12 + 1}pm",
+        f"check-in jam {hour % 12 + 1} sore",
+        f"{rng.randint(1, 28)} {rng.choice(MONTH_NAMES).capitalize()} {rng.randint(2015, 2025)}",
+        f"{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/{rng.randint(2015, 2025)}",
+    )
+    return rng.choice(formats)
+
+
+def _html(rng: random.Random) -> str:
+    return rng.choice(("<br>", "<br/>", "<p>", "</p>", "<b>", "</b>", "&nbsp;", "<i>mantap</i>"))
+
+
+def _bullets(rng: random.Random) -> str:
+    return rng.choice(("1. dekat bandara 2. sarapan enak", "Pros: - kolam bersih - staff ramah", "(+) lokasi (-) parkir", "> AC dingin > wifi lambat", "1: clean room 2: good food"))
+
+
+# the piece of text added to a review by every feature
+FEATURES: Dict[str, Callable[[random.Random], str]] = {
+    "emojis": lambda rng: rng.choice(EMOJIS),
+    "emoticons": lambda rng: rng.choice(RegexString.EMOTICONS),
+    "urls": lambda rng: rng.choice((f"https://www.{rng.choice(SITES)}/promo?id={rng.randint(1, 9999)}", f"www.{rng.choice(SITES)}/hotel", f"http://{rng.choice(SITES)}")),
+    "mentions": lambda rng: f"@{rng.choice(NAMES)}",
+    "hashtags": lambda rng: f"#{rng.choice(TAGS)}",
+    "html": _html,
+    "bullets": _bullets,
+    "prices": _price,
+    "times": _time,
+    "elongations": lambda rng: rng.choice(ELONGATIONS),
+    "phone_numbers": lambda rng: f"+62 8{rng.randint(11, 59)} {rng.randint(1000, 9999)} {rng.randint(1000, 9999)}",
+    "slangs": lambda rng: rng.choice(SLANGS),
+}
+
+# pieces of text stressing the patterns of tiketnlphub.preprocessing.re_pattern with long runs of what they match, or almost match
+ADVERSARIAL: Dict[str, Callable[[random.Random, int], str]] = {
+    "repeated_chars": lambda rng, length: "a" * length,
+    "repeated_puncts": lambda rng, length: "?!." * (length // 3),
+    "repeated_words": lambda rng, length: " ".join(["bagus"] * (length // 6)),
+    "caps": lambda rng, length: " ".join(["SANGAT"] * (length // 7)),
+    "word_numbers": lambda rng, length: "a1" * (length // 2),
+    "digits": lambda rng, length: "9" * length,
+    "white_spaces": lambda rng, length: "x" + " \t" * (length // 2) + "x",
+    "phone_numbers": lambda rng, length: "+62" + " 8" * (length // 2),
+    "urls": lambda rng, length: "https:// www." + " a" * (length // 2),
+    "numbering_bullets": lambda rng, length: "1." * (length // 2),
+    "hashtags_mentions": lambda rng, length: "#@" * (length // 2),
+    "bullets": lambda rng, length: "-" * length,
+    "emoticons": lambda rng, length: ":" + ")" * length,
+    "times": lambda rng, length: ":".join(["12"] * (length // 3)),
+    "prices": lambda rng, length: "Rp" + ".1" * (length // 2),
+    "fullstops": lambda rng, length: "." * length,
+    "html": lambda rng, length: "<" * length,
+    "long_tokens": lambda rng, length: "".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=length)),
+}
+
+
+class SyntheticReviews:
+    """
+    A seeded generator of synthetic hotel reviews in Indonesian, English or a mix of both, a shared and reproducible workload for benchmarks that ships no real review.
+
+    A review is made of one to `max_sentences` sentences built from templates and small lexicons, to which every feature of `rates` (emojis, emoticons of tiketnlphub.preprocessing.re_pattern.RegexString.EMOTICONS, URLs, mentions, hashtags, HTML fragments, bullets,
+    prices, times and dates, elongations, phone numbers and slangs) is added with its own probability. Mixed reviews switch language between sentences.
+    In adversarial mode, every review also holds a few pieces stressing the patterns of tiketnlphub.preprocessing.re_pattern with runs of `run_length` characters of what they match or almost match (repeated characters, punctuation runs, `+62 8 8 8 ...`, `https:// www. a a a ...`).
+
+    Review `i` only depends on the seed, the settings and `i`, so any range of reviews can be generated on its own, in any order or in parallel, and streams of millions of reviews never hold more than one batch in memory.
+    Reviews never contain a line break, so they can be written as a line-delimited corpus.
+
+    Example
+    -------
+    >>> from tiketnlphub.datasets.synthetic import SyntheticReviews
+    >>> reviews = SyntheticReviews(lang="id", seed=42)
+    >>> texts = reviews.generate(1000)
+    >>> texts[:2] == reviews.generate(2)
+    True
+
+    Parameters
+    ----------
+    lang: str
+        The language of the reviews, `id`, `en` or `mixed`. Default is `mixed`.
+
+    seed: int
+        The seed of the generator. Default is `0`.
+
+    rates: dict
+        The probability of every feature to appear in a review, overriding `DEFAULT_RATES`. Default is `None`, the default rates.
+
+    adversarial: bool
+        Whether to add pieces stressing the regex patterns to every review. Default is `False`.
+
+    run_length: int
+        The length of the adversarial pieces. Default is `64`.
+
+    max_sentences: int
+        The maximum number of sentences of a review. Default is `5`.
+    """
+
+    def __init__(self, lang: str = "mixed", seed: int = 0, rates: Dict[str, float] = None, adversarial: bool = False, run_length: int = 64, max_sentences: int = 5):
+        if lang not in LANGUAGES:
+            raise ValueError(f"Unknown language '{lang}'. Available languages: {', '.join(LANGUAGES)}")
+        unknown = [feature for feature in rates or {} if feature not in FEATURES]
+        if unknown:
+            raise ValueError(f"Unknown feature(s) {', '.join(unknown)}. Available features: {', '.join(FEATURES)}")
+
+        self.lang = lang
+        self.seed = seed
+        self.rates = {**DEFAULT_RATES, **(rates or {})}
+        self.adversarial = adversarial
+        self.run_length = run_length
+        self.max_sentences = max_sentences
+        self._languages = ["id", "en"] if lang == "mixed" else [lang]
+        self._features = [(FEATURES[feature], rate) for feature, rate in self.rates.items() if rate > 0]
+        self._adversarial = list(ADVERSARIAL.values())
+        self._rng = random.Random()
+
+    def _sentence(self, rng: random.Random, lang: str) -> str:
+        nouns, adjectives = NOUNS[lang], ADJECTIVES[lang]
+        sentence = rng.choice(TEMPLATES[lang]).format(
+            noun=rng.choice(nouns),
+            noun2=rng.choice(nouns),
+            adjective=rng.choice(adjectives),
+            adjective2=rng.choice(adjectives),
+            intensifier=rng.choice(INTENSIFIERS[lang]),
+            nights=rng.randint(1, 7),
+        )
+        if rng.random() < 0.7:
+            sentence = sentence[0].upper() + sentence[1:]
+
+        return sentence + rng.choice(ENDINGS)
+
+    def review(self, index: int) -> str:
+        """
+        The review of index `index`.
+        """
+        rng = self._rng
+        # every review has its own seed, the index takes the low 40 bits
+        rng.seed((self.seed << 40) + index)
+        lang = rng.choice(self._languages)
+        pieces = []
+        for _ in range(rng.randint(1, self.max_sentences)):
+            if len(self._languages) > 1 and rng.random() < 0.3:
+                lang = rng.choice(self._languages)
+            pieces.append(self._sentence(rng, lang))
+
+        for feature, rate in self._features:
+            if rng.random() < rate:
+                pieces.insert(rng.randint(0, len(pieces)), feature(rng))
+        if self.adversarial:
+            for feature in rng.sample(self._adversarial, 3):
+                pieces.insert(rng.randint(0, len(pieces)), feature(rng, self.run_length))
+
+        return " ".join(pieces)
+
+    def iter_reviews(self, n: int, start: int = 0) -> Iterator[str]:
+        """
+        Lazily generate the reviews of index `start` to `start + n - 1`.
+        """
+        return map(self.review, range(start, start + n))
+
+    def generate(self, n: int, start: int = 0) -> List[str]:
+        """
+        Generate the reviews of index `start` to `start + n - 1`.
+
+        Parameters
+        ----------
+        n: int
+            The number of reviews.
+
+        start: int
+            The index of the first review. Default is `0`.
+
+        Returns
+        -------
+        reviews: list
+            The reviews.
+        """
+        return list(self.iter_reviews(n, start))
+
+    def iter_batches(self, n: int, batch_size: int = 10000, start: int = 0) -> Iterator[List[str]]:
+        """
+        Lazily generate `n` reviews as lists of at most `batch_size` reviews.
+        """
+        for offset in range(start, start + n, batch_size):
+            yield self.generate(min(batch_size, start + n - offset), offset)
+
+    def write(self, path: str, n: int, batch_size: int = 10000):
+        """
+        Write `n` reviews to a line-delimited UTF-8 file, one batch at a time.
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            for batch in self.iter_batches(n, batch_size):
+                f.write("\n".join(batch) + "\n")
+
+    def __repr__(self) -> str:
+        return f"SyntheticReviews(lang={self.lang!r}, seed={self.seed}, adversarial={self.adversarial})"
+
+
+def synthetic_reviews(n: int, lang: str = "mixed", seed: int = 0, adversarial: bool = False, **kwargs) -> List[str]:
+    """
+    Generate `n` synthetic reviews, see tiketnlphub.datasets.synthetic.SyntheticReviews.
+
+    Example
+    -------
+    >>> from tiketnlphub.datasets.synthetic import synthetic_reviews
+    >>> texts = synthetic_reviews(10_000, lang="mixed", seed=0)
+    >>> len(texts)
+    10000
+
+    Parameters
+    ----------
+    n: int
+        The number of reviews.
+
+    lang: str
+        The language of the reviews, `id`, `en` or `mixed`. Default is `mixed`.
+
+    seed: int
+        The seed of the generator. Default is `0`.
+
+    adversarial: bool
+        Whether to add pieces stressing the regex patterns to every review. Default is `False`.
+
+    Returns
+    -------
+    reviews: list
+        The reviews.
+    """
+    return SyntheticReviews(lang, seed, adversarial=adversarial, **kwargs).generate(n)
+
+
+def iter_synthetic_reviews(n: int, lang: str = "mixed", seed: int = 0, adversarial: bool = False, **kwargs) -> Iterator[str]:
+    """
+    Generator variant of `synthetic_reviews`, lazily yielding the reviews one by one.
+    """
+    return SyntheticReviews(lang, seed, adversarial=adversarial, **kwargs).iter_reviews(n)
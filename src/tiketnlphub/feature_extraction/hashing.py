@@ -0,0 +1,256 @@
+from itertools import chain, islice
+from typing import Iterable, Iterator, NamedTuple, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError("tiketnlphub.feature_extraction.hashing requires the optional `numpy` package: pip install numpy") from e
+
+from ..preprocessing.dedup import _mix64
+from ..preprocessing.pipeline import Pipeline
+
+
+# multiplier of the polynomial token hash and of the n-gram combination
+_PRIME = np.uint64(0x100000001B3)
+
+_SPACE = ord(" ")
+
+
+class CSRChunk(NamedTuple):
+    """
+    The features of a chunk of texts as the three arrays of a compressed sparse row matrix: the columns and values of row `i` are `indices[indptr[i]:indptr[i + 1]]` and `data[indptr[i]:indptr[i + 1]]`.
+    """
+
+    indptr: "np.ndarray"
+    indices: "np.ndarray"
+    data: "np.ndarray"
+    shape: Tuple[int, int]
+
+    def to_scipy(self):
+        """
+        Wrap the arrays into a `scipy.sparse.csr_matrix`, without copying them. Requires the optional `scipy` package.
+        """
+        from scipy.sparse import csr_matrix
+
+        return csr_matrix((self.data, self.indices, self.indptr), shape=self.shape)
+
+    def toarray(self) -> "np.ndarray":
+        """
+        The features as a dense array, for small chunks.
+        """
+        dense = np.zeros(self.shape, dtype=self.data.dtype)
+        rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        dense[rows, self.indices] = self.data
+
+        return dense
+
+
+def token_hashes(tokens: Sequence[str]) -> "np.ndarray":
+    """
+    Hash tokens into stable 64 bits values with one vectorized pass over their UTF-8 bytes.
+
+    Unlike the built-in `hash`, the values do not depend on the process, so features computed by different workers or jobs line up.
+
+    Parameters
+    ----------
+    tokens: list
+        The tokens, without whitespace.
+
+    Returns
+    -------
+    hashes: numpy.ndarray
+        One `uint64` hash per token.
+    """
+    if not tokens:
+        return np.zeros(0, dtype=np.uint64)
+
+    data = np.frombuffer(" ".join(tokens).encode("utf-8", "surrogatepass"), dtype=np.uint8)
+    ends = np.append(np.flatnonzero(data == _SPACE), len(data))
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    lengths = ends - starts
+
+    # byte `j` of a token of length `n` weighs PRIME ** (n - 1 - j), the separators weigh 0
+    powers = _PRIME ** np.arange(lengths.max(), dtype=np.uint64)
+    token_end = np.repeat(ends, lengths + 1)[:len(data)]
+    weights = powers[np.maximum(token_end - np.arange(len(data)) - 1, 0)]
+    weights[ends[:-1]] = 0
+
+    return _mix64(np.add.reduceat(data * weights, starts, dtype=np.uint64) + lengths.astype(np.uint64))
+
+
+def iter_ngram_hashes(hashes: "np.ndarray", rows: "np.ndarray", ngram_range: Tuple[int, int]) -> Iterator[Tuple[int, "np.ndarray", "np.ndarray"]]:
+    """
+    Combine the hashes of consecutive tokens into the hashes of the n-grams of every order of `ngram_range`, without crossing the boundaries of texts.
+
+    Parameters
+    ----------
+    hashes: numpy.ndarray
+        The hashes of the tokens of several texts, one after another (see `token_hashes`).
+
+    rows: numpy.ndarray
+        The text of every token, in non-decreasing order.
+
+    ngram_range: tuple
+        The smallest and largest number of tokens of an n-gram.
+
+    Returns
+    -------
+    ngrams: generator
+        One `(n, hashes, starts)` tuple per order: the `uint64` hashes of the n-grams and the position of their first token.
+    """
+    min_n, max_n = ngram_range
+    combined = hashes
+    for n in range(1, max_n + 1):
+        if n > 1:
+            # the n-gram starting at token `i` extends the (n - 1)-gram starting at `i` with token `i + n - 1`
+            combined = _mix64(combined[:-1] * _PRIME + hashes[n - 1:])
+        if n >= min_n:
+            starts = np.flatnonzero(rows[:max(len(rows) - n + 1, 0)] == rows[n - 1:])
+            yield n, combined[starts] ^ np.uint64(n), starts
+
+
+class HashingVectorizer:
+    """
+    Bag of n-grams features of texts with the hashing trick: every n-gram is hashed straight into one of `n_features` columns, so no vocabulary is built or held in memory and texts can be featurized in one streaming pass.
+
+    Texts are lowercased and split on whitespace, optionally after running through a cleaning pipeline chunk by chunk (see `pipeline`), so cleaning and featurization share a single pass over the corpus.
+    Token hashes are computed with NumPy over all the tokens of a chunk at once, n-grams are combined from the token hashes and duplicates are summed, without any Python code per token.
+    With `alternate_sign`, the sign of every n-gram is drawn from its hash, so colliding n-grams tend to cancel out instead of piling up.
+
+    Example
+    -------
+    >>> from tiketnlphub.feature_extraction.hashing import HashingVectorizer
+    >>> from tiketnlphub.preprocessing.pipeline import Pipeline
+    >>> vectorizer = HashingVectorizer(n_features=2 ** 18, ngram_range=(1, 2), pipeline=Pipeline(["remove_urls", "remove_white_spaces"]))
+    >>> for chunk in vectorizer.transform_stream(open("reviews.txt"), chunk_size=10_000):
+    ...     model.partial_fit(chunk.to_scipy(), ...)
+
+    Parameters
+    ----------
+    n_features: int
+        The number of columns. Default is `2 ** 20`.
+
+    ngram_range: tuple
+        The smallest and largest number of tokens of an n-gram. Default is `(1, 1)`, unigrams only.
+
+    alternate_sign: bool
+        Whether to give every n-gram a sign of `+1` or `-1` drawn from its hash. Default is `True`.
+
+    norm: str
+        Normalize every row with its `l2` or `l1` norm, or not at all with `None`. Default is `l2`.
+
+    lowercase: bool
+        Whether to lowercase the texts before splitting them. Default is `True`.
+
+    pipeline: tiketnlphub.preprocessing.pipeline.Pipeline
+        A pipeline run over every chunk of texts before featurization. Default is `None`, the texts are already clean.
+
+    lang: str
+        The language of the pipeline plan. Default is `None`, use the pipeline language.
+
+    dtype: numpy.dtype
+        The type of the values. Default is `numpy.float32`.
+    """
+
+    def __init__(self, n_features: int = 2 ** 20, ngram_range: Tuple[int, int] = (1, 1), alternate_sign: bool = True, norm: str = "l2", lowercase: bool = True, pipeline: Pipeline = None, lang: str = None, dtype=np.float32):
+        if n_features <= 0:
+            raise ValueError("n_features must be positive")
+        if not 1 <= ngram_range[0] <= ngram_range[1]:
+            raise ValueError(f"Invalid ngram_range {ngram_range}")
+        if norm not in ("l1", "l2", None):
+            raise ValueError(f"Invalid norm {norm!r}, expected 'l1', 'l2' or None")
+
+        self.n_features = n_features
+        self.ngram_range = tuple(ngram_range)
+        self.alternate_sign = alternate_sign
+        self.norm = norm
+        self.lowercase = lowercase
+        self.pipeline = pipeline
+        self.lang = lang
+        self.dtype = dtype
+
+    def transform(self, texts: Sequence[str]) -> CSRChunk:
+        """
+        Featurize a chunk of texts.
+
+        Parameters
+        ----------
+        texts: list
+            The texts to featurize.
+
+        Returns
+        -------
+        features: CSRChunk
+            A `(len(texts), n_features)` sparse matrix. Column indices are sorted within every row and columns whose signed counts cancel out are left out.
+        """
+        if self.pipeline is not None:
+            texts = self.pipeline.run_batch(texts, langs=self.lang)
+        if self.lowercase:
+            texts = [text.lower() for text in texts]
+        tokenized = [text.split() for text in texts]
+        counts = np.fromiter(map(len, tokenized), dtype=np.int64, count=len(tokenized))
+        hashes = token_hashes(list(chain.from_iterable(tokenized)))
+        rows = np.repeat(np.arange(len(tokenized), dtype=np.int64), counts)
+
+        ngram_hashes, ngram_rows = [], []
+        for _, keys, starts in iter_ngram_hashes(hashes, rows, self.ngram_range):
+            ngram_hashes.append(keys)
+            ngram_rows.append(rows[starts])
+
+        return self._to_csr(np.concatenate(ngram_hashes), np.concatenate(ngram_rows), len(tokenized))
+
+    def transform_stream(self, texts: Iterable[str], chunk_size: int = 10_000) -> Iterator[CSRChunk]:
+        """
+        Lazily featurize a stream of texts chunk by chunk, so only one chunk of texts and features is held in memory at a time.
+
+        Parameters
+        ----------
+        texts: iterable
+            The texts to featurize, e.g. the lines of an open file.
+
+        chunk_size: int
+            The number of texts per chunk. Default is `10_000`.
+
+        Returns
+        -------
+        chunks: generator
+            One `CSRChunk` per chunk of texts, in input order.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive number of texts")
+
+        texts = iter(texts)
+        while True:
+            chunk = list(islice(texts, chunk_size))
+            if not chunk:
+                return
+            yield self.transform(chunk)
+
+    def _to_csr(self, hashes: "np.ndarray", rows: "np.ndarray", n_rows: int) -> CSRChunk:
+        columns = (hashes % np.uint64(self.n_features)).astype(np.int64)
+        if self.alternate_sign:
+            values = np.where(hashes >> np.uint64(63), -1.0, 1.0)
+        else:
+            values = np.ones(len(hashes))
+
+        # one sort of the (row, column) keys sums the duplicates and orders the columns of every row
+        keys, inverse = np.unique(rows * self.n_features + columns, return_inverse=True)
+        sums = np.bincount(inverse.ravel(), weights=values, minlength=len(keys))
+        nonzero = sums != 0
+        keys, sums = keys[nonzero], sums[nonzero]
+        key_rows = keys // self.n_features
+
+        if self.norm is not None:
+            magnitudes = np.abs(sums) if self.norm == "l1" else sums * sums
+            norms = np.bincount(key_rows, weights=magnitudes, minlength=n_rows)
+            if self.norm == "l2":
+                norms = np.sqrt(norms)
+            sums = sums / norms[key_rows]
+
+        indptr = np.searchsorted(key_rows, np.arange(n_rows + 1)).astype(np.int64)
+        indices = (keys % self.n_features).astype(np.int32 if self.n_features <= np.iinfo(np.int32).max else np.int64)
+
+        return CSRChunk(indptr, indices, sums.astype(self.dtype), (n_rows, self.n_features))
+
+    def __repr__(self) -> str:
+        return f"HashingVectorizer(n_features={self.n_features}, ngram_range={self.ngram_range}, alternate_sign={self.alternate_sign}, norm={self.norm!r})"
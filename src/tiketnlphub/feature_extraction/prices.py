@@ -0,0 +1,221 @@
+from functools import lru_cache
+from itertools import groupby
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+import re
+
+from ..preprocessing.re_pattern import RegexReplacement
+
+
+# the rest of a number after its first digit: digits with any `.` or `,` separators, told apart as thousands or decimal separators by `_parse_number`
+_NUMBER_REST = r"\d*(?:[.,]\d+)*"
+
+_WORD_END = r"(?![a-z])"
+
+
+def _alternation(words: Iterable[str]) -> str:
+    # longest first, so `rp.` wins over `rp` and `ribu` over `rb`
+    return "|".join(map(re.escape, sorted(words, key=len, reverse=True)))
+
+
+def _parse_number(number: str) -> float:
+    # the last separator is a decimal one when the other separator comes before it (1.250.000,50) or when it is alone and not followed by exactly 3 digits (1,5 or 4.25)
+    last = max(number.rfind("."), number.rfind(","))
+    if last < 0:
+        return float(number)
+
+    integer, fraction = number[:last], number[last + 1:]
+    mark = number[last]
+    other = "," if mark == "." else "."
+    if other in integer or (mark not in integer and len(fraction) != 3):
+        return float(f"{integer.replace(other, '').replace(mark, '')}.{fraction}")
+
+    return float(number.replace(".", "").replace(",", ""))
+
+
+def _compile_prices(currencies: Iterable[str], multipliers: Iterable[str], units: Iterable[str]) -> Tuple["re.Pattern", "re.Pattern"]:
+    # A price starts with the first digit of its number, so the regex engine only tries the digits of a text instead of every position.
+    # The currency before the number is checked with fixed width lookbehinds, one per length of currency, gated by the last character of the currencies;
+    # a number without one must be directly followed by a multiplier or a currency, so bare numbers never reach Python code
+    currency, multiplier, unit = _alternation(currencies), _alternation(multipliers), _alternation(units)
+    last = "".join(sorted({re.escape(word[-1]) for word in currencies}))
+    attached, spaced = (
+        "|".join(rf"(?<=(?<![a-z])(?:{_alternation(words)}){space}\d)" for _, words in groupby(sorted(currencies, key=len), key=len))
+        for space in ("", r"\s")
+    )
+    start = (
+        rf"(?:(?<=[{last}]\d)(?:{attached})"
+        rf"|(?<=[{last}]\s\d)(?:{spaced})"
+        rf"|(?<![\w.,]\d)(?={_NUMBER_REST}(?:,-)?\s?(?:{multiplier}|{currency}){_WORD_END}))"
+    )
+    price = re.compile(
+        # the first digit of a number, not preceded by a digit or a digit and a separator
+        rf"(?P<number>\d(?<!\d\d)(?<!\d[.,]\d){start}{_NUMBER_REST})(?:,-)?"
+        rf"(?:\s?(?P<multiplier>{multiplier}){_WORD_END})?"
+        rf"(?:\s?(?P<suffix>{currency}){_WORD_END})?"
+        # Rp. 252,000/night, $50 per night, $50 a night, 500rb semalam
+        rf"(?:(?:\s?/\s?|\s(?:per|a)\s|\s?se)(?P<unit>{unit}){_WORD_END})?",
+        re.IGNORECASE,
+    )
+    # searched right before a price, up to its number
+    prefix = re.compile(rf"(?<![a-z])(?:{currency})\s?\Z", re.IGNORECASE)
+
+    return price, prefix
+
+
+class Price(NamedTuple):
+    """
+    A price found in a text: its amount, the ISO 4217 code of its currency, its canonical unit (`night`, `day`, `person`, `room` or `None`) and the `(start, end)` span of the price in the text.
+    """
+
+    amount: float
+    currency: str
+    per_unit: Optional[str]
+    span: Tuple[int, int]
+
+
+class PriceExtractor:
+    """
+    Extracts structured prices from texts (`Rp. 252,000/night`, `500rb`, `1,5jt`, `$50 a night`, `€200`) in a single scan of every text with one precompiled regex.
+
+    A price is a number with a currency before or after it, or with a multiplier (`rb`, `ribu`, `k`, `jt`, `juta`) after it, optionally followed by a unit (`/night`, `per malam`, `a night`, `semalam`).
+    Thousands and decimal separators are told apart from their position (`252,000`, `450.000`, `1.250.000,50` and `1,5jt` all parse as expected), amounts are scaled by their multiplier and currencies and units are canonicalized,
+    see tiketnlphub.preprocessing.re_pattern.RegexReplacement.CURRENCIES, PRICE_MULTIPLIERS and PRICE_UNITS.
+    The regex starts at the first digit of a number, so the rest of the text is skipped at C speed, and numbers without a currency or a multiplier are rejected inside the regex.
+    Reviews repeat the same few prices over and over, so every distinct price string is parsed once and memoized in a bounded cache.
+
+    Example
+    -------
+    >>> from tiketnlphub.feature_extraction.prices import PriceExtractor
+    >>> extractor = PriceExtractor()
+    >>> extractor.extract("Dapat promo Rp. 252,000/night, biasanya 500rb. Sarapan $5 per pax")
+    [Price(amount=252000.0, currency='IDR', per_unit='night', span=(12, 29)), Price(amount=500000.0, currency='IDR', per_unit=None, span=(40, 45)), Price(amount=5.0, currency='USD', per_unit='person', span=(55, 65))]
+
+    Parameters
+    ----------
+    default_currency: str
+        The currency of the prices given with a multiplier only (`500rb`, `50k`). Default is `IDR`.
+
+    currencies: dict
+        Additional currency symbols and words and their ISO 4217 code. Default is `None`, the built-in ones only.
+
+    cache_size: int
+        The maximum number of memoized price strings, the cache is emptied once it holds more. Default is `65536`.
+    """
+
+    def __init__(self, default_currency: str = "IDR", currencies: Dict[str, str] = None, cache_size: int = 65536):
+        self.default_currency = default_currency
+        self.currencies = dict(RegexReplacement.CURRENCIES)
+        self.currencies.update((symbol.lower(), code) for symbol, code in (currencies or {}).items())
+        self.cache_size = cache_size
+        self._pattern, self._prefix = _compile_prices(self.currencies, RegexReplacement.PRICE_MULTIPLIERS, RegexReplacement.PRICE_UNITS)
+        self._prefix_length = max(map(len, self.currencies)) + 1
+        # the amount, currency and unit of every memoized price string
+        self._parsed = {}
+
+    def _parse(self, price: str, prefix: str, match: "re.Match") -> Tuple[float, str, Optional[str]]:
+        number, multiplier, suffix, unit = match.group("number", "multiplier", "suffix", "unit")
+        amount = _parse_number(number)
+        if multiplier:
+            amount *= RegexReplacement.PRICE_MULTIPLIERS[multiplier.lower()]
+        symbol = prefix.strip() if prefix else suffix
+        parsed = (
+            amount,
+            self.currencies[symbol.lower()] if symbol else self.default_currency,
+            RegexReplacement.PRICE_UNITS[unit.lower()] if unit else None,
+        )
+        self._parsed[price] = parsed
+
+        return parsed
+
+    def extract(self, text: str) -> List[Price]:
+        """
+        Extract the prices of a text.
+
+        Parameters
+        ----------
+        text: str
+            The text to extract the prices from.
+
+        Returns
+        -------
+        prices: list
+            The prices of the text, in order.
+        """
+        if len(self._parsed) > self.cache_size:
+            self._parsed.clear()
+
+        prices = []
+        for match in self._pattern.finditer(text):
+            start, end = match.span()
+            prefix = self._prefix.search(text, max(start - self._prefix_length, 0), start)
+            if prefix is not None:
+                start = prefix.start()
+            price = text[start:end]
+            parsed = self._parsed.get(price)
+            if parsed is None:
+                parsed = self._parse(price, prefix and prefix.group(), match)
+            prices.append(Price(*parsed, (start, end)))
+
+        return prices
+
+    def extract_batch(self, texts: Iterable[str]) -> List[List[Price]]:
+        """
+        Extract the prices of a batch of texts.
+        """
+        return list(map(self.extract, texts))
+
+    def __repr__(self) -> str:
+        return f"PriceExtractor(default_currency={self.default_currency!r}, {len(self.currencies)} currencies, cache_size={self.cache_size})"
+
+
+@lru_cache(maxsize=None)
+def get_price_extractor(default_currency: str = "IDR") -> PriceExtractor:
+    """
+    Get the shared price extractor of a default currency, whose regex is compiled once and whose cache is reused by every call of `extract_prices`.
+    """
+    return PriceExtractor(default_currency)
+
+
+def extract_prices(text: str, default_currency: str = "IDR") -> List[Price]:
+    """
+    Extract the structured prices of the input text, see tiketnlphub.feature_extraction.prices.PriceExtractor.
+
+    Unlike tiketnlphub.preprocessing.normalizer.normalize_symbols and normalize_slashes, which rewrite prices textually, every price is returned as an `(amount, currency, per_unit, span)` record.
+
+    Example
+    -------
+    >>> from tiketnlphub.feature_extraction.prices import extract_prices
+    >>> extract_prices("Harga 1,5jt per malam, di Agoda €200")
+    [Price(amount=1500000.0, currency='IDR', per_unit='night', span=(6, 21)), Price(amount=200.0, currency='EUR', per_unit=None, span=(32, 36))]
+
+    Parameters
+    ----------
+    text: str
+        The text to extract the prices from.
+
+    default_currency: str
+        The currency of the prices given with a multiplier only (`500rb`, `50k`). Default is `IDR`.
+
+    Returns
+    -------
+    prices: list
+        The prices of the text, in order.
+    """
+    return get_price_extractor(default_currency).extract(text)
+
+
+def extract_prices_batch(texts: Iterable[str], default_currency: str = "IDR") -> List[List[Price]]:
+    """
+    Batch variant of `extract_prices`, resolving the extractor once for the whole batch.
+
+    Parameters
+    ----------
+    texts: list
+        The texts to extract the prices from.
+
+    Returns
+    -------
+    prices: list
+        The list of prices of every text.
+    """
+    return get_price_extractor(default_currency).extract_batch(texts)
@@ -0,0 +1,243 @@
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Sequence
+import hashlib
+import os
+import sqlite3
+import time
+
+
+# SQLite limits the number of host parameters of a statement, lookups are split into batches of this size
+_LOOKUP_BATCH_SIZE = 500
+
+# hits are marked as recently used with the next write, or once this many of them are pending
+_TOUCH_BATCH_SIZE = 10_000
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS results ("
+    "id INTEGER PRIMARY KEY, pipeline TEXT NOT NULL, text_hash BLOB NOT NULL, "
+    "result TEXT NOT NULL, last_used INTEGER NOT NULL, UNIQUE (pipeline, text_hash))",
+    "CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)",
+    # a running count of the results, so bounding the cache does not scan the whole table on every write
+    "CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL)",
+    "CREATE TRIGGER IF NOT EXISTS results_insert AFTER INSERT ON results BEGIN UPDATE counters SET value = value + 1 WHERE name = 'results'; END",
+    "CREATE TRIGGER IF NOT EXISTS results_delete AFTER DELETE ON results BEGIN UPDATE counters SET value = value - 1 WHERE name = 'results'; END",
+)
+
+
+def hash_text(text: str) -> bytes:
+    """
+    Hash a text into the 16 bytes key used by `ResultCache`.
+
+    Parameters
+    ----------
+    text: str
+        The text to hash.
+
+    Returns
+    -------
+    digest: bytes
+        The BLAKE2b digest of the UTF-8 encoded text.
+    """
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+class ResultCache:
+    """
+    A persistent on-disk cache of processed texts keyed by `(pipeline fingerprint, text hash)`, shared across processes and runs.
+
+    The cache is a SQLite database in WAL mode, so many worker processes can read it concurrently while one of them writes.
+    Lookups and inserts are batched to amortize I/O, and the least recently used entries are evicted once the cache holds more than `max_entries` results.
+    Reads take no write lock: hits are marked as recently used in memory, and written with the next `put_many` or `flush` of the process (or every 10,000 hits). `Pipeline.run_batch` flushes them at the end of every batch.
+    Each process opens its own connection lazily, so a cache can be pickled and shipped to pool workers.
+
+    Example
+    -------
+    >>> from tiketnlphub.preprocessing.cache import ResultCache
+    >>> from tiketnlphub.preprocessing.pipeline import Pipeline
+    >>> cache = ResultCache("reviews_cache.sqlite", max_entries=5_000_000)
+    >>> pipeline = Pipeline(["remove_urls", "remove_white_spaces"])
+    >>> pipeline.run_batch(["visit  https://example.com", "all good"], cache=cache)
+    ['visit', 'all good']
+
+    Parameters
+    ----------
+    path: str
+        The path of the SQLite database. It is created if it does not exist.
+
+    max_entries: int
+        The maximum number of cached results. Default is `None`, no limit.
+
+    timeout: float
+        How many seconds to wait for a lock held by another process. Default is `30.0`.
+    """
+
+    def __init__(self, path: str, max_entries: int = None, timeout: float = 30.0):
+        self.path = path
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._connection = None
+        self._pid = None
+        self._touched = set()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        # SQLite connections must not be shared across a fork, reconnect in every process
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                for statement in _SCHEMA:
+                    connection.execute(statement)
+                # counted once, when the counter is created
+                if connection.execute("SELECT 1 FROM counters WHERE name = 'results'").fetchone() is None:
+                    connection.execute("INSERT INTO counters (name, value) SELECT 'results', COUNT(*) FROM results")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+            self._connection = connection
+            self._pid = os.getpid()
+            self._touched = set()
+
+        return self._connection
+
+    def get_many(self, fingerprint: str, texts: Sequence[str], touch: bool = True) -> List[Optional[str]]:
+        """
+        Look up the cached results of a batch of texts.
+
+        Parameters
+        ----------
+        fingerprint: str
+            The fingerprint of the pipeline that produced the results.
+
+        texts: list
+            The input texts.
+
+        touch: bool
+            Mark the hits as recently used so they survive eviction longer, from the next `put_many` or `flush` on. Default is `True`.
+
+        Returns
+        -------
+        results: list
+            The cached result of each text, or `None` when the text is not cached.
+        """
+        hashes = [hash_text(text) for text in texts]
+        found = {}
+        connection = self.connection
+        for start in range(0, len(hashes), _LOOKUP_BATCH_SIZE):
+            batch = hashes[start:start + _LOOKUP_BATCH_SIZE]
+            rows = connection.execute(
+                f"SELECT text_hash, result FROM results WHERE pipeline = ? AND text_hash IN ({','.join('?' * len(batch))})",
+                [fingerprint, *batch],
+            )
+            found.update(rows)
+
+        if touch and found:
+            self._touched.update((fingerprint, text_hash) for text_hash in found)
+            if len(self._touched) >= _TOUCH_BATCH_SIZE:
+                with self._transaction() as connection:
+                    self._flush_touched(connection)
+
+        return [found.get(text_hash) for text_hash in hashes]
+
+    def put_many(self, fingerprint: str, texts: Sequence[str], results: Sequence[str]):
+        """
+        Store the results of a batch of texts in a single transaction, then evict the least recently used entries if the cache is over its size bound.
+
+        Parameters
+        ----------
+        fingerprint: str
+            The fingerprint of the pipeline that produced the results.
+
+        texts: list
+            The input texts.
+
+        results: list
+            The processed texts, in the same order as `texts`.
+        """
+        if len(texts) != len(results):
+            raise ValueError(f"Got {len(texts)} texts but {len(results)} results")
+
+        now = time.time_ns()
+        with self._transaction() as connection:
+            self._flush_touched(connection)
+            # an upsert, unlike INSERT OR REPLACE, does not delete the row it replaces without firing the delete trigger
+            connection.executemany(
+                "INSERT INTO results (pipeline, text_hash, result, last_used) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (pipeline, text_hash) DO UPDATE SET result = excluded.result, last_used = excluded.last_used",
+                [(fingerprint, hash_text(text), result, now) for text, result in zip(texts, results)],
+            )
+            if self.max_entries is not None:
+                excess = self._count(connection) - self.max_entries
+                if excess > 0:
+                    connection.execute(
+                        "DELETE FROM results WHERE id IN (SELECT id FROM results ORDER BY last_used LIMIT ?)",
+                        (excess,),
+                    )
+
+    def _flush_touched(self, connection: sqlite3.Connection):
+        if self._touched:
+            now = time.time_ns()
+            connection.executemany(
+                "UPDATE results SET last_used = ? WHERE pipeline = ? AND text_hash = ?",
+                [(now, fingerprint, text_hash) for fingerprint, text_hash in self._touched],
+            )
+            self._touched = set()
+
+    @staticmethod
+    def _count(connection: sqlite3.Connection) -> int:
+        return connection.execute("SELECT value FROM counters WHERE name = 'results'").fetchone()[0]
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        # BEGIN IMMEDIATE takes the write lock upfront, so concurrent writers wait on the busy timeout instead of failing mid-transaction
+        connection = self.connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def clear(self):
+        """
+        Remove every cached result.
+        """
+        with self._transaction() as connection:
+            connection.execute("DELETE FROM results")
+        self._touched = set()
+
+    def flush(self):
+        """
+        Write the pending recently used marks of the current process in a single transaction.
+        """
+        if self._touched and self._connection is not None and self._pid == os.getpid():
+            with self._transaction() as connection:
+                self._flush_touched(connection)
+
+    def close(self):
+        """
+        Close the connection of the current process, writing the pending recently used marks first.
+        """
+        if self._connection is not None and self._pid == os.getpid():
+            self.flush()
+            self._connection.close()
+        self._connection = None
+
+    def __len__(self) -> int:
+        return self._count(self.connection)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        state["_pid"] = None
+        state["_touched"] = set()
+
+        return state
+
+    def __repr__(self) -> str:
+        return f"ResultCache({self.path!r}, max_entries={self.max_entries!r})"
+
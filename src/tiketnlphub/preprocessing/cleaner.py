@@ -1,4 +1,7 @@
-from typing import List
+from functools import lru_cache, partial
+from itertools import filterfalse, islice
+from operator import eq
+from typing import Iterable, List, Tuple, Union
 import re
 import string
 
@@ -8,7 +11,42 @@ from bs4 import BeautifulSoup
 from .re_pattern import RegexString, RegexReplacement
 
 
-def remove_digits(text: str) -> str:
+MODES = ("remove", "mask", "extract")
+
+
+@lru_cache(maxsize=None)
+def _compile_scan(pattern: str, flags: int = 0) -> "re.Pattern":
+    # the whole match is the first group, so `split` interleaves the kept text, the matches and the inner groups of the pattern
+    return re.compile(f"({pattern})", flags)
+
+
+def _scan(text: str, pattern: str, flags: int, mode: str, placeholder: str) -> Union[str, Tuple[str, List[str]]]:
+    # removal, masking and extraction of the matches of a pattern, each in a single scan of the text
+    compiled = _compile_scan(pattern, flags)
+    if mode == "remove":
+        return compiled.sub("", text)
+    if mode not in MODES:
+        raise ValueError(f"Invalid mode {mode!r}, expected 'remove', 'mask' or 'extract'")
+
+    parts = compiled.split(text)
+    if len(parts) == 1:
+        return (text, []) if mode == "extract" else text
+
+    stride = compiled.groups + 1
+    kept, matches = parts[::stride], parts[1::stride]
+    if mode == "extract":
+        # some patterns also match the white spaces after the value
+        return "".join(kept), list(map(str.rstrip, matches))
+
+    # the placeholder keeps the white spaces matched after the value, so it does not stick to the next word
+    masked = [None] * (len(kept) + len(matches))
+    masked[::2] = kept
+    masked[1::2] = [placeholder + match[len(match.rstrip()):] for match in matches]
+
+    return "".join(masked)
+
+
+def remove_digits(text: str, mode: str = "remove", placeholder: str = RegexReplacement.PLACEHOLDERS["digits"]) -> Union[str, Tuple[str, List[str]]]:
     """
     Removes all digits from the input text.
 
@@ -24,12 +62,18 @@ def remove_digits(text: str) -> str:
     text: str
         The text from which digits are to be removed.
 
+    mode: str
+        `remove` deletes the digits, `mask` replaces them with `placeholder` and `extract` deletes them and also returns them. Default is `remove`.
+
+    placeholder: str
+        The replacement of the digits with `mode="mask"`. Default is `<NUMBER>`.
+
     Returns
     -------
-    text: str
-        The input text with all digits removed.
+    text: str or tuple
+        The input text with all digits removed, or masked. With `mode="extract"`, a `(text, digits)` tuple of the text with all digits removed and the list of the removed digits.
     """
-    return re.sub(RegexString.DIGITS, "", text)
+    return _scan(text, RegexString.DIGITS, 0, mode, placeholder)
     
 
 def remove_emojis_emoticons(text: str, additional_emoticons: List[str] = None) -> str:
@@ -82,7 +126,7 @@ def remove_emojis_emoticons(text: str, additional_emoticons: List[str] = None) -
     return text
 
 
-def remove_hashtags(text: str) -> str:
+def remove_hashtags(text: str, mode: str = "remove", placeholder: str = RegexReplacement.PLACEHOLDERS["hashtags"]) -> Union[str, Tuple[str, List[str]]]:
     """
     Removes all X (a.k.a Twitter) style hashtags from the input text.
 
@@ -98,15 +142,21 @@ def remove_hashtags(text: str) -> str:
     text: str
         The text from which hashtags are to be removed.
 
+    mode: str
+        `remove` deletes the hashtags, `mask` replaces them with `placeholder` and `extract` deletes them and also returns them. Default is `remove`.
+
+    placeholder: str
+        The replacement of the hashtags with `mode="mask"`. Default is `<HASHTAG>`.
+
     Returns
     -------
-    text: str
-        The input text with all hashtags removed.
+    text: str or tuple
+        The input text with all hashtags removed, or masked. With `mode="extract"`, a `(text, hashtags)` tuple of the text with all hashtags removed and the list of the removed hashtags.
     """
-    return re.sub(RegexString.HASTAGS, "", text)
+    return _scan(text, RegexString.HASTAGS, 0, mode, placeholder)
 
 
-def remove_mentions(text: str) -> str:
+def remove_mentions(text: str, mode: str = "remove", placeholder: str = RegexReplacement.PLACEHOLDERS["mentions"]) -> Union[str, Tuple[str, List[str]]]:
     """
     Removes all X (a.k.a Twitter) style mentions from the input text.
 
@@ -116,21 +166,30 @@ def remove_mentions(text: str) -> str:
     >>> text = remove_mentions("kudos to @martin for your hospitality in the last 3 nights. really appreciate it.")
     >>> text
     kudos to  for your hospitality in the last 3 nights. really appreciate it.
+
+    >>> remove_mentions("kudos to @martin and @dewi", mode="mask")
+    kudos to <MENTION> and <MENTION>
     
     Parameters
     ----------
     text: str
         The text from which mentions are to be removed.
 
+    mode: str
+        `remove` deletes the mentions, `mask` replaces them with `placeholder` and `extract` deletes them and also returns them. Default is `remove`.
+
+    placeholder: str
+        The replacement of the mentions with `mode="mask"`. Default is `<MENTION>`.
+
     Returns
     -------
-    text: str
-        The input text with all mentions removed.
+    text: str or tuple
+        The input text with all mentions removed, or masked. With `mode="extract"`, a `(text, mentions)` tuple of the text with all mentions removed and the list of the removed mentions.
     """
-    return re.sub(RegexString.MENTIONS, "", text)
+    return _scan(text, RegexString.MENTIONS, 0, mode, placeholder)
 
 
-def remove_urls(text: str) -> str:
+def remove_urls(text: str, mode: str = "remove", placeholder: str = RegexReplacement.PLACEHOLDERS["urls"]) -> Union[str, Tuple[str, List[str]]]:
     """
     Removes all web URLs from the input text.
 
@@ -140,21 +199,32 @@ def remove_urls(text: str) -> str:
     >>> text = remove_urls("there is a promo going on. you can visit their website at https://www.jwmariott.com/promotions")
     >>> text
     there is a promo going on. you can visit their website at 
+
+    >>> remove_urls("promo at https://www.jwmariott.com/promotions until friday", mode="mask")
+    promo at <URL> until friday
+    >>> remove_urls("promo at https://www.jwmariott.com/promotions until friday", mode="extract")
+    ('promo at  until friday', ['https://www.jwmariott.com/promotions'])
     
     Parameters
     ----------
     text: str
         The text from which URLs are to be removed.
 
+    mode: str
+        `remove` deletes the URLs, `mask` replaces them with `placeholder` and `extract` deletes them and also returns them. Default is `remove`.
+
+    placeholder: str
+        The replacement of the URLs with `mode="mask"`. Default is `<URL>`.
+
     Returns
     -------
-    text: str
-        The input text with all URLs removed.
+    text: str or tuple
+        The input text with all URLs removed, or masked. With `mode="extract"`, a `(text, urls)` tuple of the text with all URLs removed and the list of the removed URLs.
     """
-    return re.sub(RegexString.URLS, "", text, flags=re.IGNORECASE)
+    return _scan(text, RegexString.URLS, re.IGNORECASE, mode, placeholder)
 
 
-def remove_phone_numbers(text: str) -> str:
+def remove_phone_numbers(text: str, mode: str = "remove", placeholder: str = RegexReplacement.PLACEHOLDERS["phone_numbers"]) -> Union[str, Tuple[str, List[str]]]:
     """
     Removes all phone numbers from the input text. 
     
@@ -172,12 +242,18 @@ def remove_phone_numbers(text: str) -> str:
     text: str
         The text from which phone numbers are to be removed.
 
+    mode: str
+        `remove` deletes the phone numbers, `mask` replaces them with `placeholder` and `extract` deletes them and also returns them. Default is `remove`.
+
+    placeholder: str
+        The replacement of the phone numbers with `mode="mask"`. Default is `<PHONE>`.
+
     Returns
     -------
-    text: str
-        The input text with all phone numbers removed.
+    text: str or tuple
+        The input text with all phone numbers removed, or masked. With `mode="extract"`, a `(text, phone_numbers)` tuple of the text with all phone numbers removed and the list of the removed phone numbers.
     """
-    return re.sub(RegexString.PHONE_NUMBERS, "", text, flags=re.IGNORECASE)
+    return _scan(text, RegexString.PHONE_NUMBERS, re.IGNORECASE, mode, placeholder)
 
 
 def remove_numbering_bullets(text: str) -> str:
@@ -328,7 +404,153 @@ def remove_white_spaces(text: str) -> str:
     text: str
         The input text with all white spaces removed.
     """
-    return " ".join(word.strip() for word in text.split())
+    return " ".join(remove_white_spaces_tokens(text.split()))
+
+
+def remove_white_spaces_tokens(tokens: List[str]) -> List[str]:
+    """
+    Token-level variant of `remove_white_spaces`, working on the tokens of `text.split()`.
+
+    Whitespace is already gone once a text is split into tokens, so the tokens are returned as they are: joining them with a single space is what removes the excessive white spaces.
+    Token-level steps let a pipeline split a text once, run consecutive token-level steps on the same token list and join it once, see tiketnlphub.preprocessing.pipeline.TOKEN_STEPS.
+
+    Parameters
+    ----------
+    tokens: list
+        The whitespace separated tokens of the text.
+
+    Returns
+    -------
+    tokens: list
+        The tokens, unchanged.
+    """
+    return tokens
+
+
+@lru_cache(maxsize=128)
+def load_stopwords(lang: str = "id", extra: frozenset = frozenset(), casefold: bool = False) -> frozenset:
+    """
+    Build (or fetch from the cache) the stopword set of a language merged with extra stopwords.
+
+    The built-in stopwords are listed in tiketnlphub.preprocessing.re_pattern.RegexString.STOPWORDS. Without `casefold` the set holds the lowercase, uppercase and capitalized form of every stopword, so tokens are matched as they are.
+    With `casefold` it holds the casefolded stopwords, to be matched against casefolded tokens.
+
+    Parameters
+    ----------
+    lang: str
+        The language of the built-in stopwords, `id` or `en`. Default is `id`.
+
+    extra: frozenset
+        Additional stopwords. Default is an empty set.
+
+    casefold: bool
+        Whether the set is meant for casefolded tokens. Default is `False`.
+
+    Returns
+    -------
+    stopwords: frozenset
+        The stopwords.
+    """
+    words = RegexString.STOPWORDS.get(lang, frozenset()).union(word.lower() for word in extra)
+    if casefold:
+        return frozenset(word.casefold() for word in words)
+
+    return frozenset(variant for word in words for variant in (word, word.upper(), word[:1].upper() + word[1:]))
+
+
+def get_stopwords(lang: str = "id", extra: Iterable[str] = None, casefold: bool = False) -> frozenset:
+    """
+    Get the stopword set of a language merged with extra stopwords given as any iterable, see `load_stopwords`.
+    """
+    return load_stopwords(lang, frozenset(extra or ()), casefold)
+
+
+def _filter_stopwords(tokens: List[str], stopwords: frozenset, casefold: bool = False) -> List[str]:
+    if casefold:
+        return [token for token, folded in zip(tokens, map(str.casefold, tokens)) if folded not in stopwords]
+
+    # a single C level pass, no Python code runs per token
+    return list(filterfalse(stopwords.__contains__, tokens))
+
+
+def remove_stopwords(text: str, lang: str = "id", extra: Iterable[str] = None, casefold: bool = False) -> str:
+    """
+    Removes the stopwords (e.g. yang, di, dan, the, of) from the input text.
+
+    Tokens are looked up as they are in a precomputed frozenset holding the lowercase, uppercase and capitalized form of every stopword, so `yang`, `YANG` and `Yang` are removed but `yAng` is not, unless `casefold` is set.
+    Tokens with punctuation attached (e.g. `yang,`) are kept, remove or split the punctuations first. Negations (tidak, bukan, not, no, ...) are not stopwords, as removing them flips the sentiment of a review.
+    The built-in stopwords are listed in tiketnlphub.preprocessing.re_pattern.RegexString.STOPWORDS. The tokens are joined with a single space.
+
+    Example
+    -------
+    >>> from tiketnlphub.preprocessing.cleaner import remove_stopwords
+    >>> text = remove_stopwords("Kamar yang saya pesan di lantai 5 tidak ada jendela")
+    >>> text
+    Kamar pesan lantai 5 tidak ada jendela
+
+    >>> text = remove_stopwords("The room was great BUT the pool was closed", lang="en", extra=["room"])
+    >>> text
+    great pool closed
+
+    Parameters
+    ----------
+    text: str
+        The text from which stopwords are to be removed.
+
+    lang: str
+        The language of the built-in stopwords, `id` or `en`. Default is `id`.
+
+    extra: list
+        Additional stopwords, matched in any case like the built-in ones. Default is `None`.
+
+    casefold: bool
+        Whether to casefold every token before the lookup, to also match mixed case and Unicode case variants. Slower. Default is `False`.
+
+    Returns
+    -------
+    text: str
+        The input text with all stopwords removed.
+    """
+    return " ".join(remove_stopwords_tokens(text.split(), lang, extra, casefold))
+
+
+def remove_stopwords_tokens(tokens: List[str], lang: str = "id", extra: Iterable[str] = None, casefold: bool = False) -> List[str]:
+    """
+    Token-level variant of `remove_stopwords`, working on the tokens of `text.split()`.
+
+    Parameters
+    ----------
+    tokens: list
+        The whitespace separated tokens of the text.
+
+    Returns
+    -------
+    tokens: list
+        The tokens that are not stopwords.
+    """
+    return _filter_stopwords(tokens, get_stopwords(lang, extra, casefold), casefold)
+
+
+def remove_stopwords_batch(texts: Iterable[str], lang: str = "id", extra: Iterable[str] = None, casefold: bool = False) -> List[str]:
+    """
+    Batch variant of `remove_stopwords`, the stopword set is resolved once for all the texts.
+
+    Parameters
+    ----------
+    texts: list
+        The texts from which stopwords are to be removed.
+
+    Returns
+    -------
+    texts: list
+        The input texts with all stopwords removed.
+    """
+    stopwords = get_stopwords(lang, extra, casefold)
+    if casefold:
+        return [" ".join(_filter_stopwords(text.split(), stopwords, True)) for text in texts]
+
+    is_stopword = stopwords.__contains__
+    return [" ".join(filterfalse(is_stopword, text.split())) for text in texts]
 
 
 def remove_repeated_chars(text: str) -> str:
@@ -413,7 +635,183 @@ def remove_repeated_puncts(text: str) -> str:
         The input text with all repeated punctuations removed.
     """
     return re.sub(RegexString.REPEAT_PUNCTS, "", text)
-    
+
+
+_LEADING_WORD = re.compile(RegexString.LEADING_WORD)
+
+_TRAILING_WORD = re.compile(RegexString.TRAILING_WORD)
+
+_WHITE_SPACES = re.compile(RegexString.WHITE_SPACES)
+
+
+class RepeatCollapser:
+    """
+    De-elongation of texts in a single pass: collapses repeated characters, repeated punctuations and repeated words, with the same results as `remove_repeated_chars`, `remove_repeated_puncts` and `remove_repeated_words` applied in this order.
+
+    A run of identical characters or punctuations never crosses whitespace, so the text is split once on whitespace and every distinct token is collapsed once: elongated reviews reuse a small vocabulary (bagusss, bangettt!!!), the collapsed tokens are memoized in a bounded cache.
+    A word is repeated when a token starts with the last word of the previous token, so repeated words are found by comparing the memoized first and last words of consecutive tokens, instead of a backreference scan of the whole text.
+    Texts whose tokens are separated by single spaces are split with `str.split`, other texts keep their white spaces.
+
+    Example
+    -------
+    >>> from tiketnlphub.preprocessing.cleaner import RepeatCollapser
+    >>> collapser = RepeatCollapser()
+    >>> collapser("Hotelnya bagusss bagus bangettt!!!!! mantap mantap")
+    Hotelnya bagus banget! mantap
+
+    Parameters
+    ----------
+    chars: bool
+        Whether to collapse characters repeated more than 2 times, digits excepted. Default is `True`.
+
+    words: bool
+        Whether to collapse consecutive repeated words. Default is `True`.
+
+    puncts: bool
+        Whether to collapse runs of `?`, `.` and `!` into their last punctuation. Default is `True`.
+
+    cache_size: int
+        The maximum number of memoized tokens, the cache is emptied once it holds more. Default is `65536`.
+    """
+
+    def __init__(self, chars: bool = True, words: bool = True, puncts: bool = True, cache_size: int = 65536):
+        self.chars = chars
+        self.words = words
+        self.puncts = puncts
+        self.cache_size = cache_size
+        if chars and puncts:
+            self._sub = partial(re.compile(RegexString.REPEAT_CHARS_PUNCTS).sub, r"\1\2")
+        elif chars:
+            self._sub = partial(re.compile(RegexString.REPEAT_CHARS).sub, r"\1")
+        elif puncts:
+            self._sub = partial(re.compile(RegexString.REPEAT_PUNCTS).sub, "")
+        else:
+            self._sub = None
+        # the collapsed form, the first word and the last word of every memoized token, `None` when a token does not end with a word
+        self._collapsed = {}
+        self._leading = {}
+        self._trailing = {}
+
+    def _collapse_token(self, token: str) -> str:
+        collapsed = self._sub(token) if self._sub is not None else token
+        leading, trailing = _LEADING_WORD.match(collapsed), _TRAILING_WORD.search(collapsed)
+        self._collapsed[token] = collapsed
+        self._leading[token] = leading.group() if leading else ""
+        self._trailing[token] = trailing.group() if trailing else None
+
+        return collapsed
+
+    def _collapse_tokens(self, tokens: List[str]) -> List[str]:
+        collapsed = list(map(self._collapsed.get, tokens))
+        if None in collapsed:
+            collapsed = [value if value is not None else self._collapse_token(token) for value, token in zip(collapsed, tokens)]
+
+        return collapsed
+
+    def __call__(self, text: str) -> str:
+        if len(self._collapsed) > self.cache_size:
+            for cache in (self._collapsed, self._leading, self._trailing):
+                cache.clear()
+
+        tokens = text.split()
+        if " ".join(tokens) == text:
+            separators = None
+        else:
+            # tokens at even positions, the white spaces between them at odd positions
+            parts = _WHITE_SPACES.split(text)
+            tokens = parts[::2]
+            separators = self._collapse_tokens(parts[1::2])
+        collapsed = self._collapse_tokens(tokens)
+
+        if self.words and any(map(eq, map(self._leading.__getitem__, islice(tokens, 1, None)), map(self._trailing.__getitem__, tokens))):
+            return self._collapse_words(tokens, collapsed, separators)
+        if separators is None:
+            return " ".join(collapsed)
+
+        return "".join([part for pair in zip(collapsed, separators) for part in pair] + collapsed[-1:])
+
+    def _collapse_words(self, tokens: List[str], collapsed: List[str], separators: List[str] = None) -> str:
+        trailing = self._trailing
+        results = [collapsed[0]]
+        word = trailing[tokens[0]]
+        for position in range(1, len(tokens)):
+            token = collapsed[position]
+            if self._leading[tokens[position]] == word:
+                # a repetition: the white space and the repeated word are dropped, what follows the word is glued to the previous token
+                token = token[len(word):]
+                if token:
+                    results.append(token)
+                    word = trailing[tokens[position]]
+            else:
+                results.append(" " if separators is None else separators[position - 1])
+                results.append(token)
+                word = trailing[tokens[position]]
+
+        return "".join(results)
+
+    def __repr__(self) -> str:
+        return f"RepeatCollapser(chars={self.chars}, words={self.words}, puncts={self.puncts}, cache_size={self.cache_size})"
+
+
+@lru_cache(maxsize=None)
+def get_repeat_collapser(chars: bool = True, words: bool = True, puncts: bool = True) -> RepeatCollapser:
+    """
+    Get the shared collapser of a combination of behaviors, whose cache is reused by every call of `collapse_repeats`.
+    """
+    return RepeatCollapser(chars, words, puncts)
+
+
+def collapse_repeats(text: str, chars: bool = True, words: bool = True, puncts: bool = True) -> str:
+    """
+    Collapses repeated characters, repeated punctuations and repeated words of the input text in a single pass, see tiketnlphub.preprocessing.cleaner.RepeatCollapser.
+
+    The result is the one of `remove_repeated_chars`, `remove_repeated_puncts` and `remove_repeated_words` applied in this order, each behavior can be turned off.
+
+    Example
+    -------
+    >>> from tiketnlphub.preprocessing.cleaner import collapse_repeats
+    >>> text = collapse_repeats("Hotelnya bagusss bangettt!!!!! sangat sangat puas.....")
+    >>> text
+    Hotelnya bagus banget! sangat puas.
+
+    Parameters
+    ----------
+    text: str
+        The text from which the repetitions are to be collapsed.
+
+    chars: bool
+        Whether to collapse characters repeated more than 2 times. Default is `True`.
+
+    words: bool
+        Whether to collapse consecutive repeated words. Default is `True`.
+
+    puncts: bool
+        Whether to collapse runs of punctuations into their last punctuation. Default is `True`.
+
+    Returns
+    -------
+    text: str
+        The input text with all repetitions collapsed.
+    """
+    return get_repeat_collapser(chars, words, puncts)(text)
+
+
+def collapse_repeats_batch(texts: Iterable[str], chars: bool = True, words: bool = True, puncts: bool = True) -> List[str]:
+    """
+    Batch variant of `collapse_repeats`, resolving the collapser once for the whole batch.
+
+    Parameters
+    ----------
+    texts: list
+        The texts from which the repetitions are to be collapsed.
+
+    Returns
+    -------
+    texts: list
+        The input texts with all repetitions collapsed.
+    """
+    return list(map(get_repeat_collapser(chars, words, puncts), texts))
+
 
 def split_punct_and_word(text: str) -> str:
     """
@@ -441,6 +839,11 @@ def split_punct_and_word(text: str) -> str:
     return re.sub(RegexString.PUNCT_WORD, r"\1 \2", text)
 
 
+_SENTENCE_START = re.compile(RegexString.SENTENCE_START)
+
+_REPEAT_CAPS = re.compile(RegexString.REPEAT_CAPS)
+
+
 def upper_selected_word(text: str) -> str:
     """
     Capitalize input text and convert all letters to uppercase after certain punctuations (.?!).
@@ -462,7 +865,17 @@ def upper_selected_word(text: str) -> str:
     text: str
         The input text with all words capitalized and uppercased after certain punctuations.
     """
-    return re.sub(RegexString.UPPER_SELECTED_WORD, lambda p: p.group(0).upper(), text.capitalize())
+    text = text.capitalize()
+    # `capitalize` uppercased the first character already, unless the text starts with white spaces
+    start = len(text) - len(text.lstrip())
+    if 0 < start < len(text) and text[start] in string.ascii_letters:
+        text = text[:start] + text[start].upper() + text[start + 1:]
+
+    # splitting on the sentence starts puts their first letter at every third position, uppercased with one C level `map` instead of a Python callback per match
+    parts = _SENTENCE_START.split(text)
+    parts[2::3] = map(str.upper, parts[2::3])
+
+    return "".join(parts)
 
 
 def upper_i_word(text: str) -> str:
@@ -486,7 +899,24 @@ def upper_i_word(text: str) -> str:
     text: str
         The input text with all 'i' words uppercased.
     """
-    return ' '.join(word.replace('i', 'I') if word.lower() == 'i' else word for word in text.split())
+    return ' '.join(upper_i_word_tokens(text.split()))
+
+
+def upper_i_word_tokens(tokens: List[str]) -> List[str]:
+    """
+    Token-level variant of `upper_i_word`, working on the tokens of `text.split()`.
+
+    Parameters
+    ----------
+    tokens: list
+        The whitespace separated tokens of the text.
+
+    Returns
+    -------
+    tokens: list
+        The tokens with all 'i' words uppercased.
+    """
+    return [word.replace('i', 'I') if word.lower() == 'i' else word for word in tokens]
 
 
 def lower_letter_sequence_caps(text: str) -> str:
@@ -510,13 +940,21 @@ def lower_letter_sequence_caps(text: str) -> str:
     text: str
         The input text with all uppercased letter sequence words lowercased.
     """
-    return re.sub(RegexString.REPEAT_CAPS, lambda x: x.group(0).lower(), text)
+    parts = _REPEAT_CAPS.split(text)
+    parts[1::2] = map(str.lower, parts[1::2])
+
+    return "".join(parts)
+
+
+_TIME_FORMAT = re.compile(RegexString.TIME_FORMAT_PARTS)
 
 
 def handle_time_format(text: str) -> str:
     """
     Changed the time format from using ':' to '.' instead.
 
+    To also recognize `jam 3 sore`, `2pm`, `14.30 WIB` and dates, see tiketnlphub.preprocessing.temporal.normalize_times_dates.
+
     Example
     -------
     >>> from tiketnlphub.preprocessing.cleaner import handle_time_format
@@ -534,8 +972,5 @@ def handle_time_format(text: str) -> str:
     text: str
         The input text with time format handled.
     """
-    def replace_time(match):
-        return match.group(0).replace(":", ".")
-
-    return re.sub(RegexString.TIME_FORMAT, replace_time, text)
+    return _TIME_FORMAT.sub(r"\1.\2", text)
 
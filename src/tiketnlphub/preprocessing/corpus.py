@@ -0,0 +1,302 @@
+from multiprocessing import Pool
+from typing import Iterator, List, Tuple
+import json
+import mmap
+import os
+import shutil
+
+from .pipeline import Pipeline
+
+
+INDEX_FILENAME = "index.json"
+
+CHECKPOINT_FILENAME = "checkpoint.json"
+
+SHARD_FILENAME = "part-{:05d}.txt"
+
+
+def split_byte_ranges(path: str, chunk_size: int = 64 * 1024 * 1024) -> List[Tuple[int, int]]:
+    """
+    Split a line-delimited file into newline-aligned byte ranges of roughly `chunk_size` bytes.
+
+    Every range starts at the beginning of a line and ends right after a newline (or at the end of the file), so each range can be decoded and processed independently.
+
+    Example
+    -------
+    >>> from tiketnlphub.preprocessing.corpus import split_byte_ranges
+    >>> split_byte_ranges("reviews.txt", chunk_size=32 * 1024 * 1024)
+    [(0, 33554467), (33554467, 67108901), (67108901, 70312954)]
+
+    Parameters
+    ----------
+    path: str
+        The path of the UTF-8 line-delimited file.
+
+    chunk_size: int
+        The target size of a range in bytes. Default is 64 MiB.
+
+    Returns
+    -------
+    ranges: list
+        The `(start, end)` byte offsets of each range.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive number of bytes")
+
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+
+    ranges = []
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        while start < size:
+            newline = mm.find(b"\n", min(start + chunk_size, size) - 1)
+            end = size if newline == -1 else newline + 1
+            ranges.append((start, end))
+            start = end
+
+    return ranges
+
+
+def iter_range_lines(mm, start: int, end: int, block_size: int = 1024 * 1024, errors: str = "strict") -> Iterator[List[str]]:
+    """
+    Decode the lines of a newline-aligned byte range of a memory-mapped file, one block of lines at a time.
+
+    Blocks are cut on newlines, so a multi-byte character is never split, and at most one block is decoded at a time.
+
+    Parameters
+    ----------
+    mm: mmap.mmap
+        The memory-mapped file.
+
+    start: int
+        The first byte of the range.
+
+    end: int
+        The byte right after the range.
+
+    block_size: int
+        The target size of a decoded block in bytes. Default is 1 MiB.
+
+    errors: str
+        The UTF-8 decoding error handler. Default is `strict`.
+
+    Returns
+    -------
+    lines: generator
+        The lists of decoded lines (without their newline), one list per block.
+    """
+    position = start
+    while position < end:
+        newline = mm.find(b"\n", min(position + block_size, end) - 1, end)
+        block_end = end if newline == -1 else newline + 1
+        block = mm[position:block_end].decode("utf-8", errors)
+        if block.endswith("\n"):
+            block = block[:-1]
+        yield block.split("\n")
+        position = block_end
+
+
+def _clean_range(task: tuple) -> dict:
+    input_path, start, end, shard_path, pipeline, lang, errors, cache = task
+    lines = 0
+    # the shard only gets its final name once it is complete, a crash never leaves a partial shard behind
+    tmp_path = f"{shard_path}.tmp"
+    with open(input_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with open(tmp_path, "w", encoding="utf-8", newline="\n") as out:
+            for block in iter_range_lines(mm, start, end, errors=errors):
+                out.write("\n".join(pipeline.run_batch(block, langs=lang, cache=cache)))
+                out.write("\n")
+                lines += len(block)
+    os.replace(tmp_path, shard_path)
+    # every task unpickles its own copy of the cache, with its own connection
+    if cache is not None:
+        cache.close()
+
+    return {"path": os.path.basename(shard_path), "start": start, "end": end, "lines": lines}
+
+
+def _load_checkpoint(output_dir: str, job: dict) -> dict:
+    checkpoint_path = os.path.join(output_dir, CHECKPOINT_FILENAME)
+    if not os.path.exists(checkpoint_path):
+        return {}
+
+    with open(checkpoint_path, encoding="utf-8") as f:
+        checkpoint = json.load(f)
+
+    if checkpoint.get("pipeline") != job["pipeline"]:
+        raise ValueError(
+            f"Cannot resume the job in '{output_dir}': the pipeline configuration changed "
+            f"(checkpoint fingerprint {checkpoint.get('pipeline')}, current fingerprint {job['pipeline']}). "
+            "Use another output directory or pass resume=False to start over."
+        )
+    for key in ("input", "input_size", "input_mtime", "chunk_size", "lang"):
+        if checkpoint.get(key) != job[key]:
+            raise ValueError(
+                f"Cannot resume the job in '{output_dir}': '{key}' changed from {checkpoint.get(key)!r} to {job[key]!r}. "
+                "Use another output directory or pass resume=False to start over."
+            )
+
+    # only trust shards that are still on disk
+    return {
+        shard["start"]: shard
+        for shard in checkpoint.get("shards", [])
+        if os.path.exists(os.path.join(output_dir, shard["path"]))
+    }
+
+
+def clean_corpus(input_path: str, output_dir: str, pipeline: Pipeline, lang: str = None, workers: int = None, chunk_size: int = 64 * 1024 * 1024, errors: str = "strict", resume: bool = True, cache=None) -> str:
+    """
+    Clean a huge line-delimited UTF-8 corpus in parallel, one line per text.
+
+    The input file is memory-mapped and split into newline-aligned byte ranges. Worker processes decode and clean their ranges independently and write one output shard per range.
+    An index of the shards is written to the output directory so that the shards can be concatenated in input order, see `iter_cleaned_lines` and `concatenate_shards`.
+    Peak memory depends on the block size used by the workers, not on the size of the file.
+
+    Every completed shard is committed to a checkpoint file (input offsets, output shard and pipeline fingerprint) in the output directory. When a job dies, running it again with the same arguments only processes the ranges that were not committed yet.
+    Resuming is refused with a `ValueError` when the pipeline configuration, the language, the chunk size or the input size changed since the checkpoint was written.
+    A pipeline without a fingerprint (see `Pipeline.fingerprint`) always starts over, and can not use a result cache.
+
+    Example
+    -------
+    >>> from tiketnlphub.preprocessing.corpus import clean_corpus
+    >>> from tiketnlphub.preprocessing.pipeline import Pipeline
+    >>> pipeline = Pipeline(["remove_urls", "remove_emojis_emoticons", "remove_white_spaces"], lang="id")
+    >>> clean_corpus("reviews.txt", "reviews_clean", pipeline, workers=8)
+    reviews_clean/index.json
+
+    Parameters
+    ----------
+    input_path: str
+        The path of the UTF-8 line-delimited corpus.
+
+    output_dir: str
+        The directory where the shards and the index are written. It is created if it does not exist.
+
+    pipeline: tiketnlphub.preprocessing.pipeline.Pipeline
+        The pipeline to run over every line.
+
+    lang: str
+        The language of the pipeline plan. Default is `None`, use the pipeline language.
+
+    workers: int
+        The number of worker processes. Default is `None`, use `os.cpu_count()`.
+
+    chunk_size: int
+        The target size of a byte range (and output shard) in bytes. Default is 64 MiB.
+
+    errors: str
+        The UTF-8 decoding error handler. Default is `strict`.
+
+    resume: bool
+        Resume from the checkpoint of a previous run in `output_dir`, if any. Default is `True`. Pass `False` to ignore the checkpoint and start over.
+
+    cache: tiketnlphub.preprocessing.cache.ResultCache
+        A persistent result cache shared by the workers, so lines already cleaned by a previous run are not cleaned again. Default is `None`, no cache.
+
+    Returns
+    -------
+    index_path: str
+        The path of the shard index.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    stat = os.stat(input_path)
+    job = {
+        "input": os.path.abspath(input_path),
+        "input_size": stat.st_size,
+        "input_mtime": stat.st_mtime_ns,
+        "chunk_size": chunk_size,
+        "lang": lang or pipeline.lang,
+        "pipeline": pipeline.fingerprint,
+    }
+    if job["pipeline"] is None and cache is not None:
+        raise ValueError("Cannot cache the results of a pipeline without a fingerprint, use named steps with JSON serializable parameters")
+    # the shards of a pipeline without a fingerprint can not be told apart from the shards of another pipeline
+    committed = _load_checkpoint(output_dir, job) if resume and job["pipeline"] is not None else {}
+
+    ranges = split_byte_ranges(input_path, chunk_size)
+    tasks = [
+        (input_path, start, end, os.path.join(output_dir, SHARD_FILENAME.format(i)), pipeline, lang, errors, cache)
+        for i, (start, end) in enumerate(ranges)
+        if committed.get(start, {}).get("end") != end
+    ]
+
+    checkpoint_path = os.path.join(output_dir, CHECKPOINT_FILENAME)
+
+    def commit(shard: dict):
+        committed[shard["start"]] = shard
+        _write_json(checkpoint_path, dict(job, shards=sorted(committed.values(), key=lambda s: s["start"])))
+
+    workers = min(workers or os.cpu_count() or 1, max(len(tasks), 1))
+    if workers == 1:
+        for task in tasks:
+            commit(_clean_range(task))
+    else:
+        with Pool(workers) as pool:
+            for shard in pool.imap_unordered(_clean_range, tasks):
+                commit(shard)
+
+    shards = sorted(committed.values(), key=lambda shard: shard["start"])
+    index_path = os.path.join(output_dir, INDEX_FILENAME)
+    _write_json(index_path, {
+        "input": job["input"],
+        "input_size": job["input_size"],
+        "pipeline": job["pipeline"],
+        "lines": sum(shard["lines"] for shard in shards),
+        "shards": shards,
+    })
+
+    return index_path
+
+
+def _write_json(path: str, payload: dict):
+    # write to a temporary file first so a crash never leaves a truncated file behind
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def iter_cleaned_lines(output_dir: str) -> Iterator[str]:
+    """
+    Iterate over the cleaned lines of a `clean_corpus` output directory in input order.
+
+    Parameters
+    ----------
+    output_dir: str
+        The output directory of `clean_corpus`.
+
+    Returns
+    -------
+    lines: generator
+        The cleaned lines, without their newline.
+    """
+    with open(os.path.join(output_dir, INDEX_FILENAME), encoding="utf-8") as f:
+        index = json.load(f)
+
+    for shard in index["shards"]:
+        with open(os.path.join(output_dir, shard["path"]), encoding="utf-8", newline="\n") as f:
+            for line in f:
+                yield line[:-1] if line.endswith("\n") else line
+
+
+def concatenate_shards(output_dir: str, output_path: str):
+    """
+    Concatenate the shards of a `clean_corpus` output directory into a single file, in input order.
+
+    Parameters
+    ----------
+    output_dir: str
+        The output directory of `clean_corpus`.
+
+    output_path: str
+        The path of the concatenated file.
+    """
+    with open(os.path.join(output_dir, INDEX_FILENAME), encoding="utf-8") as f:
+        index = json.load(f)
+
+    with open(output_path, "wb") as out:
+        for shard in index["shards"]:
+            with open(os.path.join(output_dir, shard["path"]), "rb") as f:
+                shutil.copyfileobj(f, out, 1024 * 1024)
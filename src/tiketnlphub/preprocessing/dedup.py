@@ -0,0 +1,458 @@
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+except ImportError as e:
+    raise ImportError("tiketnlphub.preprocessing.dedup requires the optional `numpy` package: pip install numpy") from e
+
+
+# `numpy.trapz` was renamed in NumPy 2.0
+_trapezoid = getattr(np, "trapezoid", None) or np.trapz
+
+# upper bound of the number of `num_perm x shingles` hashes computed at once, about 64 MiB of uint64
+_HASH_BLOCK = 8 * 1024 * 1024
+
+
+def _mix64(values: "np.ndarray") -> "np.ndarray":
+    # splitmix64 finalizer, spreads the bits of weak hashes such as polynomial shingle sums
+    values = values ^ (values >> np.uint64(30))
+    values = values * np.uint64(0xBF58476D1CE4E5B9)
+    values = values ^ (values >> np.uint64(27))
+    values = values * np.uint64(0x94D049BB133111EB)
+
+    return values ^ (values >> np.uint64(31))
+
+
+def shingle_hashes(texts: Sequence[str], shingle_size: int = 5) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Hash the character shingles (overlapping substrings of `shingle_size` UTF-8 bytes) of a batch of texts in one vectorized pass.
+
+    The texts are lowercased and their whitespace is collapsed first. A text shorter than `shingle_size` bytes gives a single shingle, an empty text gives none.
+
+    Parameters
+    ----------
+    texts: list
+        The texts, preferably already cleaned.
+
+    shingle_size: int
+        The number of bytes of a shingle. Default is `5`.
+
+    Returns
+    -------
+    shingles: tuple
+        The 64 bits hashes of the shingles of all the texts, and the `len(texts) + 1` offsets delimiting the shingles of each text.
+    """
+    encoded = [" ".join(text.lower().split()).encode("utf-8", "surrogatepass") for text in texts]
+    lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+    # every text is followed by `shingle_size - 1` zero bytes, so a window starting in a text never reaches the next one
+    padding = b"\0" * (shingle_size - 1)
+    data = np.frombuffer(padding.join(encoded) + padding + b"\0", dtype=np.uint8)
+    starts = np.cumsum(lengths + shingle_size - 1) - (lengths + shingle_size - 1)
+
+    counts = np.where(lengths > 0, np.maximum(lengths - shingle_size + 1, 1), 0)
+    offsets = np.concatenate(([0], np.cumsum(counts)))
+    text_index = np.repeat(np.arange(len(encoded)), counts)
+    positions = starts[text_index] + np.arange(offsets[-1]) - offsets[text_index]
+
+    windows = sliding_window_view(data, shingle_size)[positions]
+    powers = np.uint64(0x100000001B3) ** np.arange(shingle_size - 1, -1, -1, dtype=np.uint64)
+
+    return _mix64(windows.astype(np.uint64) @ powers), offsets
+
+
+class MinHash:
+    """
+    MinHash signatures of texts, estimating the Jaccard similarity of their sets of character shingles.
+
+    Each of the `num_perm` hash functions is a multiply-shift permutation of the 64 bits shingle hashes, and a signature holds the minimum of every permutation over the shingles of a text.
+    Signatures of a batch are computed with NumPy over all the shingles of the batch at once, the fraction of equal signature values of two texts estimates their Jaccard similarity (see `similarity`).
+
+    Example
+    -------
+    >>> from tiketnlphub.preprocessing.dedup import MinHash
+    >>> minhash = MinHash(num_perm=128)
+    >>> signatures = minhash.signatures(["Kamar bersih, staf ramah sekali!", "Kamar bersih, staf ramah sekali!!", "Sarapan kurang enak"])
+    >>> MinHash.similarity(signatures[0], signatures[1]), MinHash.similarity(signatures[0], signatures[2])
+    (0.9765625, 0.0)
+
+    Parameters
+    ----------
+    num_perm: int
+        The number of hash functions, i.e. the length of a signature. Default is `128`.
+
+    shingle_size: int
+        The number of UTF-8 bytes of a shingle. Default is `5`.
+
+    seed: int
+        The seed of the hash functions. Signatures are only comparable when computed with the same `num_perm`, `shingle_size` and `seed`. Default is `1`.
+    """
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 5, seed: int = 1):
+        if num_perm <= 0 or shingle_size <= 0:
+            raise ValueError("num_perm and shingle_size must be positive")
+
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.seed = seed
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(0, 2 ** 64, size=(num_perm, 1), dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 2 ** 64, size=(num_perm, 1), dtype=np.uint64)
+
+    def signatures(self, texts: Sequence[str]) -> "np.ndarray":
+        """
+        Compute the signatures of a batch of texts.
+
+        Parameters
+        ----------
+        texts: list
+            The texts, preferably already cleaned.
+
+        Returns
+        -------
+        signatures: numpy.ndarray
+            A `(len(texts), num_perm)` array of `uint32`. Texts without any shingle (empty texts) get a signature of `0xFFFFFFFF` values.
+        """
+        hashes, offsets = shingle_hashes(texts, self.shingle_size)
+        signatures = np.full((len(texts), self.num_perm), 0xFFFFFFFF, dtype=np.uint32)
+        counts = np.diff(offsets)
+        # blocks of whole texts, bounded by the number of permuted hashes held in memory at once
+        budget = max(_HASH_BLOCK // self.num_perm, 1)
+        bounds = [0]
+        while bounds[-1] < len(texts):
+            end = int(np.searchsorted(offsets, offsets[bounds[-1]] + budget, side="right")) - 1
+            bounds.append(max(end, bounds[-1] + 1))
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            rows = np.flatnonzero(counts[start:end]) + start
+            if not len(rows):
+                continue
+            block = hashes[offsets[start]:offsets[end]]
+            permuted = (self._a * block + self._b) >> np.uint64(32)
+            signatures[rows] = np.minimum.reduceat(permuted, offsets[rows] - offsets[start], axis=1).T
+
+        return signatures
+
+    def signature(self, text: str) -> "np.ndarray":
+        """
+        Compute the signature of a single text, see `signatures`.
+        """
+        return self.signatures([text])[0]
+
+    @staticmethod
+    def similarity(signature_a: "np.ndarray", signature_b: "np.ndarray") -> float:
+        """
+        Estimate the Jaccard similarity of two texts from their signatures.
+        """
+        return float(np.mean(signature_a == signature_b))
+
+
+@lru_cache(maxsize=None)
+def optimal_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """
+    Choose the number of LSH bands and of rows per band that best separate pairs above and below a Jaccard similarity threshold.
+
+    Two texts become candidates when all the rows of at least one band of their signatures are equal, which happens with probability `1 - (1 - s ** rows) ** bands` for a similarity `s`.
+    The chosen `(bands, rows)` minimize the sum of the false positive area below the threshold and the false negative area above it.
+
+    Parameters
+    ----------
+    num_perm: int
+        The length of the signatures.
+
+    threshold: float
+        The Jaccard similarity from which two texts are near duplicates.
+
+    Returns
+    -------
+    bands: tuple
+        The number of bands and of rows per band, with `bands * rows <= num_perm`.
+    """
+    if not 0 < threshold < 1:
+        raise ValueError("threshold must be between 0 and 1")
+
+    below = np.linspace(0, threshold, 512)
+    above = np.linspace(threshold, 1, 512)
+    best, best_error = None, float("inf")
+    for bands in range(1, num_perm + 1):
+        for rows in range(1, num_perm // bands + 1):
+            false_positives = _trapezoid(1 - (1 - below ** rows) ** bands, below)
+            false_negatives = _trapezoid((1 - above ** rows) ** bands, above)
+            if false_positives + false_negatives < best_error:
+                best, best_error = (bands, rows), false_positives + false_negatives
+
+    return best
+
+
+class LSHIndex:
+    """
+    A locality sensitive hashing index of MinHash signatures, to find the indexed texts whose estimated Jaccard similarity with a query is above a threshold.
+
+    Signatures are cut into `bands` bands of `rows` values and every band is hashed into a 64 bits key. Two signatures are candidates when they share at least one band key, and candidates whose estimated similarity is below `threshold` are dropped.
+    Band keys and row numbers are stored in sorted NumPy runs, merged pairwise as the index grows like a log-structured merge tree, and the signatures and ids in growing arrays,
+    so the index takes `16 * bands + 4 * num_perm + 8` bytes per indexed text without any Python object per entry, and batches of queries run as vectorized binary searches.
+
+    Example
+    -------
+    >>> from tiketnlphub.preprocessing.dedup import LSHIndex, MinHash
+    >>> minhash, index = MinHash(), LSHIndex(threshold=0.8)
+    >>> index.insert(minhash.signatures(["Kamar bersih, staf ramah sekali!", "Sarapan kurang enak"]), [10, 11])
+    >>> index.query(minhash.signatures(["Kamar bersih, staf ramah sekali!!", "Lokasi strategis"]))
+    array([10, -1])
+
+    Parameters
+    ----------
+    num_perm: int
+        The length of the signatures. Default is `128`.
+
+    threshold: float
+        The Jaccard similarity from which two texts are near duplicates, used to choose `bands` and `rows` (see `optimal_bands`). Default is `0.8`.
+
+    bands: int
+        The number of bands. Default is `None`, chosen from `threshold`.
+
+    rows: int
+        The number of signature values per band. Default is `None`, chosen from `threshold`.
+    """
+
+    def __init__(self, num_perm: int = 128, threshold: float = 0.8, bands: int = None, rows: int = None):
+        if bands is None or rows is None:
+            bands, rows = optimal_bands(num_perm, threshold)
+        if bands * rows > num_perm:
+            raise ValueError(f"{bands} bands of {rows} rows do not fit in signatures of {num_perm} values")
+
+        self.num_perm = num_perm
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = rows
+        self._runs = []
+        self._size = 0
+        self._signatures = np.empty((0, num_perm), dtype=np.uint32)
+        self._ids = np.empty(0, dtype=np.int64)
+        rng = np.random.default_rng(0)
+        self._row_multipliers = rng.integers(0, 2 ** 64, size=rows, dtype=np.uint64) | np.uint64(1)
+        self._band_salts = rng.integers(0, 2 ** 64, size=bands, dtype=np.uint64)
+
+    def band_keys(self, signatures: "np.ndarray") -> "np.ndarray":
+        """
+        Hash the bands of a batch of signatures into a `(len(signatures), bands)` array of `uint64` keys, salted per band so that keys of different bands never collide.
+        """
+        signatures = np.asarray(signatures, dtype=np.uint32).reshape(-1, self.num_perm)
+        bands = signatures[:, :self.bands * self.rows].reshape(len(signatures), self.bands, self.rows).astype(np.uint64)
+
+        return _mix64((bands * self._row_multipliers).sum(axis=2, dtype=np.uint64) ^ self._band_salts)
+
+    def insert(self, signatures: "np.ndarray", ids: Iterable[int]):
+        """
+        Index a batch of signatures under integer ids.
+        """
+        signatures = np.asarray(signatures, dtype=np.uint32).reshape(-1, self.num_perm)
+        ids = np.fromiter(ids, dtype=np.int64, count=len(signatures))
+        self._insert(signatures, self.band_keys(signatures), ids)
+
+    def query(self, signatures: "np.ndarray") -> "np.ndarray":
+        """
+        Find the smallest indexed id sharing a band with each signature of a batch, and whose estimated similarity with it is at least `threshold`.
+
+        Returns
+        -------
+        ids: numpy.ndarray
+            One id per signature, `-1` when no indexed signature is similar enough.
+        """
+        signatures = np.asarray(signatures, dtype=np.uint32).reshape(-1, self.num_perm)
+
+        return self._query(signatures, self.band_keys(signatures))
+
+    def _insert(self, signatures: "np.ndarray", keys: "np.ndarray", ids: "np.ndarray"):
+        if not len(ids):
+            return
+
+        start, end = self._size, self._size + len(ids)
+        if end > len(self._ids):
+            # grow the arrays geometrically, so inserting many small batches stays linear
+            capacity = max(end, 2 * len(self._ids))
+            self._signatures = np.concatenate((self._signatures[:start], np.empty((capacity - start, self.num_perm), dtype=np.uint32)))
+            self._ids = np.concatenate((self._ids[:start], np.empty(capacity - start, dtype=np.int64)))
+        self._signatures[start:end] = signatures
+        self._ids[start:end] = ids
+        self._size = end
+
+        keys = keys.ravel()
+        rows = np.repeat(np.arange(start, end, dtype=np.int64), self.bands)
+        order = np.argsort(keys, kind="stable")
+        self._runs.append((keys[order], rows[order]))
+        # merge the runs of similar sizes, so a query searches O(log n) runs
+        while len(self._runs) > 1 and len(self._runs[-2][0]) <= 2 * len(self._runs[-1][0]):
+            (keys_a, rows_a), (keys_b, rows_b) = self._runs.pop(), self._runs.pop()
+            keys, rows = np.concatenate((keys_b, keys_a)), np.concatenate((rows_b, rows_a))
+            order = np.argsort(keys, kind="stable")
+            self._runs.append((keys[order], rows[order]))
+
+    def _query(self, signatures: "np.ndarray", keys: "np.ndarray") -> "np.ndarray":
+        found = np.full(len(keys), np.iinfo(np.int64).max, dtype=np.int64)
+        flat = keys.ravel()
+        queries = np.repeat(np.arange(len(keys), dtype=np.int64), self.bands)
+        pair_queries, pair_rows = [], []
+        for run_keys, run_rows in self._runs:
+            # a key can have several rows in a run, take all of them
+            starts = np.searchsorted(run_keys, flat, side="left")
+            counts = np.searchsorted(run_keys, flat, side="right") - starts
+            hits = counts > 0
+            counts = counts[hits]
+            positions = np.repeat(starts[hits] - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+            pair_queries.append(np.repeat(queries[hits], counts))
+            pair_rows.append(run_rows[positions])
+
+        if pair_rows:
+            # a candidate sharing several bands is compared once, band collisions of dissimilar signatures are dropped
+            pairs = np.unique(np.concatenate(pair_queries) * self._size + np.concatenate(pair_rows))
+            pair_queries, pair_rows = np.divmod(pairs, self._size)
+            similar = (self._signatures[pair_rows] == signatures[pair_queries]).mean(axis=1) >= self.threshold
+            np.minimum.at(found, pair_queries[similar], self._ids[pair_rows[similar]])
+        found[found == np.iinfo(np.int64).max] = -1
+
+        return found
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The memory taken by the indexed entries in bytes, without the spare capacity of the growing arrays.
+        """
+        return sum(keys.nbytes + rows.nbytes for keys, rows in self._runs) + self._size * (self._signatures.itemsize * self.num_perm + self._ids.itemsize)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return f"LSHIndex({self._size} signatures, bands={self.bands}, rows={self.rows})"
+
+
+class NearDuplicateDetector:
+    """
+    Streaming near-duplicate detection of texts with MinHash signatures and an LSH index.
+
+    Texts are numbered in the order they are added. A text whose estimated Jaccard similarity with an earlier indexed text is likely above `threshold` is a near duplicate of it, otherwise it becomes a new cluster representative and is indexed.
+    Only representatives are indexed, so the memory grows with the number of distinct texts, `16 * bands + 4 * num_perm + 8` bytes each (see `LSHIndex`), not with the size of the stream.
+    Batches are processed with vectorized signatures and queries, `add_batch` is much faster than adding texts one by one.
+
+    Example
+    -------
+    >>> from tiketnlphub.preprocessing.dedup import NearDuplicateDetector
+    >>> detector = NearDuplicateDetector(threshold=0.8)
+    >>> detector.add_batch(["Kamar bersih, staf ramah sekali!", "Sarapan kurang enak", "Kamar bersih, staf ramah sekali!!"])
+    array([0, 1, 0])
+    >>> detector.query("kamar bersih,  staf ramah sekali")
+    0
+    >>> list(detector.deduplicate(["Sarapan kurang enak!", "Lokasi strategis"]))
+    ['Lokasi strategis']
+
+    Parameters
+    ----------
+    threshold: float
+        The Jaccard similarity from which two texts are near duplicates. Default is `0.8`.
+
+    num_perm: int
+        The length of the MinHash signatures. Default is `128`.
+
+    shingle_size: int
+        The number of UTF-8 bytes of a shingle. Default is `5`.
+
+    seed: int
+        The seed of the MinHash functions. Default is `1`.
+    """
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 128, shingle_size: int = 5, seed: int = 1):
+        self.minhash = MinHash(num_perm=num_perm, shingle_size=shingle_size, seed=seed)
+        self.index = LSHIndex(num_perm=num_perm, threshold=threshold)
+        self._count = 0
+
+    def add_batch(self, texts: Sequence[str]) -> "np.ndarray":
+        """
+        Add a batch of texts to the stream.
+
+        Parameters
+        ----------
+        texts: list
+            The texts, preferably already cleaned.
+
+        Returns
+        -------
+        clusters: numpy.ndarray
+            The number of the cluster representative of each text: the number of the earlier text it is a near duplicate of, or its own number.
+        """
+        signatures = self.minhash.signatures(texts)
+        keys = self.index.band_keys(signatures)
+        clusters = self.index._query(signatures, keys)
+        ids = np.arange(self._count, self._count + len(texts), dtype=np.int64)
+        self._count += len(texts)
+
+        # texts of the batch can also be near duplicates of earlier texts of the same batch, the positions of the representatives sharing a band key are checked in order
+        representatives = {}
+        threshold = self.index.threshold
+        for i in np.flatnonzero(clusters == -1).tolist():
+            row = keys[i].tolist()
+            candidates = sorted({j for key in row for j in representatives.get(key, ())})
+            match = next((j for j in candidates if MinHash.similarity(signatures[i], signatures[j]) >= threshold), None)
+            if match is None:
+                clusters[i] = ids[i]
+                for key in row:
+                    representatives.setdefault(key, []).append(i)
+            else:
+                clusters[i] = ids[match]
+
+        new = clusters == ids
+        self.index._insert(signatures[new], keys[new], ids[new])
+
+        return clusters
+
+    def add(self, text: str) -> int:
+        """
+        Add a single text to the stream, see `add_batch`.
+        """
+        return int(self.add_batch([text])[0])
+
+    def query(self, text: str) -> Optional[int]:
+        """
+        Find the cluster representative a text would be a near duplicate of, without adding it to the stream.
+        """
+        cluster = int(self.index.query(self.minhash.signatures([text]))[0])
+
+        return None if cluster == -1 else cluster
+
+    def deduplicate(self, texts: Iterable[str], batch_size: int = 10_000) -> Iterator[str]:
+        """
+        Lazily drop the near duplicates of a stream of texts, keeping the first text of every cluster.
+
+        Parameters
+        ----------
+        texts: iterable
+            The texts, preferably already cleaned.
+
+        batch_size: int
+            The number of texts processed at once. Default is `10_000`.
+
+        Returns
+        -------
+        texts: generator
+            The texts that are not near duplicates of an earlier text.
+        """
+        batch = []
+        for text in texts:
+            batch.append(text)
+            if len(batch) == batch_size:
+                yield from self._keep_new(batch)
+                batch = []
+        if batch:
+            yield from self._keep_new(batch)
+
+    def _keep_new(self, batch: Sequence[str]) -> Iterator[str]:
+        start = self._count
+        clusters = self.add_batch(batch)
+        for i in np.flatnonzero(clusters == np.arange(start, start + len(batch))).tolist():
+            yield batch[i]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __repr__(self) -> str:
+        return f"NearDuplicateDetector({self._count} texts, {len(self.index)} clusters)"
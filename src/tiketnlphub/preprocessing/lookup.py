@@ -0,0 +1,299 @@
+from array import array
+from collections.abc import Mapping
+from functools import lru_cache
+from itertools import accumulate
+from multiprocessing import shared_memory
+from typing import Iterator, Optional, Tuple
+import json
+import mmap
+import os
+import struct
+import zlib
+
+
+MAGIC = b"TNLPTBL1"
+
+# magic, number of entries, number of hash slots, sizes of the keys, values and metadata sections
+_HEADER = struct.Struct("<8sQQQQQ")
+
+# slots hold the index of an entry, or -1 when empty. Offsets are 64 bits so a table can grow past 4 GiB
+_SLOT, _OFFSET = "q", "Q"
+
+
+def _align(size: int) -> int:
+    return (size + 7) & ~7
+
+
+def _slot_count(entries: int) -> int:
+    # a power of two at least twice the number of entries keeps the linear probes short
+    slots = 8
+    while slots < 2 * entries:
+        slots *= 2
+
+    return slots
+
+
+def file_signature(path: str) -> Optional[Tuple[int, int]]:
+    """
+    The `(size, modification time in nanoseconds)` of a file, `None` when it does not exist. Dictionaries loaded from a file are reloaded once its signature changes.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    return stat.st_size, stat.st_mtime_ns
+
+
+def pack_mapping(mapping: Mapping, metadata: dict = None) -> bytes:
+    """
+    Pack a string to string mapping into the read-only binary layout of `PackedTable`.
+
+    The entries are sorted by key, so the same mapping always gives the same bytes.
+
+    Parameters
+    ----------
+    mapping: dict
+        The mapping to pack.
+
+    metadata: dict
+        A small JSON serializable payload stored next to the entries. Default is `None`.
+
+    Returns
+    -------
+    buffer: bytes
+        The packed table.
+    """
+    # code point order is UTF-8 byte order, sorting the strings is cheaper than sorting their encoding
+    keys = sorted(mapping)
+    values = [mapping[key].encode("utf-8", "surrogatepass") for key in keys]
+    keys = [key.encode("utf-8", "surrogatepass") for key in keys]
+    key_offsets = array(_OFFSET, accumulate(map(len, keys), initial=0))
+    value_offsets = array(_OFFSET, accumulate(map(len, values), initial=0))
+
+    slots = [-1] * _slot_count(len(keys))
+    mask = len(slots) - 1
+    for index, digest in enumerate(map(zlib.crc32, keys)):
+        slot = digest & mask
+        while slots[slot] != -1:
+            slot = (slot + 1) & mask
+        slots[slot] = index
+    slots = array(_SLOT, slots)
+
+    keys, values = b"".join(keys), b"".join(values)
+    meta = json.dumps(metadata, ensure_ascii=False).encode("utf-8") if metadata else b""
+    header = _HEADER.pack(MAGIC, len(key_offsets) - 1, len(slots), len(keys), len(values), len(meta))
+    sections = [header, slots.tobytes(), key_offsets.tobytes(), value_offsets.tobytes(), keys, values, meta]
+
+    return b"".join(section + b"\0" * (_align(len(section)) - len(section)) for section in sections)
+
+
+class PackedTable(Mapping):
+    """
+    A read-only string to string lookup table packed into one contiguous buffer, meant to be shared by many processes instead of copied into each of them.
+
+    The buffer holds the keys and values as sorted UTF-8 blobs with offset arrays, plus an open addressing hash index, so a lookup is O(1) and reads the buffer in place without building any Python object per entry.
+    A table can live in `bytes`, in a memory-mapped file (`save` / `open`, the pages are shared through the OS page cache) or in a `multiprocessing.shared_memory` block (`to_shared_memory`).
+    Tables backed by a file or by shared memory pickle as a reference to their storage, so pool workers attach to the same memory instead of receiving a copy.
+    A bounded per-process cache of recent lookups keeps frequent tokens at `dict` speed.
+
+    Example
+    -------
+    >>> from tiketnlphub.preprocessing.lookup import PackedTable
+    >>> table = PackedTable.from_mapping({"yg": "yang", "bgt": "banget"}).to_shared_memory()
+    >>> table.get("yg")
+    yang
+    >>> table.unlink()  # once every process is done with it
+
+    Parameters
+    ----------
+    buffer: bytes-like
+        A buffer holding a table packed by `pack_mapping`.
+
+    cache_size: int
+        The maximum number of lookups cached per process. Default is `65536`, `0` disables the cache.
+    """
+
+    def __init__(self, buffer, cache_size: int = 65536):
+        self._buffer = buffer
+        self._path = None
+        self._shm = None
+        self.cache_size = cache_size
+        view = memoryview(buffer)
+        magic, self._count, slot_count, keys_size, values_size, meta_size = _HEADER.unpack_from(view)
+        if magic != MAGIC:
+            raise ValueError("Not a packed table buffer")
+
+        position = _align(_HEADER.size)
+        sections = []
+        for size in (slot_count * 8, (self._count + 1) * 8, (self._count + 1) * 8, keys_size, values_size, meta_size):
+            sections.append(view[position:position + size])
+            position += _align(size)
+        slots, key_offsets, value_offsets, self._keys, self._values, meta = sections
+        self._slots = slots.cast(_SLOT)
+        self._key_offsets = key_offsets.cast(_OFFSET)
+        self._value_offsets = value_offsets.cast(_OFFSET)
+        self._mask = slot_count - 1
+        self._nbytes = position
+        self.metadata = json.loads(bytes(meta)) if meta_size else {}
+        if cache_size:
+            self.get = lru_cache(maxsize=cache_size)(self._get)
+
+    @classmethod
+    def from_mapping(cls, mapping: Mapping, metadata: dict = None, cache_size: int = 65536) -> "PackedTable":
+        """
+        Pack a mapping into an in-process table, see `pack_mapping`.
+        """
+        return cls(pack_mapping(mapping, metadata), cache_size=cache_size)
+
+    @classmethod
+    def open(cls, path: str, cache_size: int = 65536) -> "PackedTable":
+        """
+        Memory-map a table file written by `save`. Every process opening the same file shares its pages.
+        """
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        table = cls(buffer, cache_size=cache_size)
+        table._path = path
+
+        return table
+
+    @classmethod
+    def attach(cls, name: str, cache_size: int = 65536) -> "PackedTable":
+        """
+        Attach to a table living in the shared memory block `name`, see `to_shared_memory`.
+        """
+        try:
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # Python < 3.13 registers attached blocks with the resource tracker, which pool workers share with the process that created the block
+            shm = shared_memory.SharedMemory(name=name)
+        table = cls(shm.buf, cache_size=cache_size)
+        table._shm = shm
+
+        return table
+
+    @staticmethod
+    def is_packed(path: str) -> bool:
+        """
+        Whether a file holds a packed table.
+        """
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+
+    def save(self, path: str):
+        """
+        Write the table to a file, to be memory-mapped with `open`.
+        """
+        with open(path, "wb") as f:
+            f.write(self._buffer[:self.nbytes])
+
+    def to_shared_memory(self, name: str = None) -> "PackedTable":
+        """
+        Copy the table into a new shared memory block and return the table backed by it.
+
+        The block outlives the processes using it: the process that created it must call `unlink` once the table is no longer needed.
+
+        Parameters
+        ----------
+        name: str
+            The name of the shared memory block. Default is `None`, a random name.
+
+        Returns
+        -------
+        table: PackedTable
+            The table backed by the shared memory block.
+        """
+        shm = shared_memory.SharedMemory(name=name, create=True, size=self.nbytes)
+        shm.buf[:self.nbytes] = self._buffer[:self.nbytes]
+        table = self.__class__(shm.buf, cache_size=self.cache_size)
+        table._shm = shm
+
+        return table
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The size of the packed table in bytes.
+        """
+        return self._nbytes
+
+    @property
+    def name(self) -> Optional[str]:
+        """
+        The name of the shared memory block backing the table, if any.
+        """
+        return self._shm.name if self._shm is not None else None
+
+    def _get(self, key: str, default=None):
+        encoded = key.encode("utf-8", "surrogatepass")
+        slots, key_offsets, keys = self._slots, self._key_offsets, self._keys
+        slot = zlib.crc32(encoded) & self._mask
+        while True:
+            index = slots[slot]
+            if index == -1:
+                return default
+            if keys[key_offsets[index]:key_offsets[index + 1]] == encoded:
+                return str(self._values[self._value_offsets[index]:self._value_offsets[index + 1]], "utf-8", "surrogatepass")
+            slot = (slot + 1) & self._mask
+
+    def get(self, key: str, default=None):
+        return self._get(key, default)
+
+    def __getitem__(self, key: str) -> str:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+
+        return value
+
+    def __contains__(self, key) -> bool:
+        return isinstance(key, str) and self.get(key, _MISSING) is not _MISSING
+
+    def __iter__(self) -> Iterator[str]:
+        # keys come out in their sorted packing order
+        offsets = self._key_offsets
+        for index in range(self._count):
+            yield str(self._keys[offsets[index]:offsets[index + 1]], "utf-8", "surrogatepass")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self):
+        """
+        Release the storage of the table in the current process. The table can not be used afterwards.
+        """
+        for view in (self._slots, self._key_offsets, self._value_offsets, self._keys, self._values):
+            view.release()
+        if self.cache_size:
+            self.get.cache_clear()
+        if self._shm is not None:
+            self._shm.close()
+        elif isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def unlink(self):
+        """
+        Close the table and destroy its shared memory block. Call it once, from the process that created the block.
+        """
+        shm = self._shm
+        self.close()
+        if shm is not None:
+            shm.unlink()
+
+    def __reduce__(self):
+        # shared and memory-mapped tables travel as a reference to their storage, the receiving process attaches to it
+        if self._shm is not None:
+            return self.__class__.attach, (self._shm.name, self.cache_size)
+        if self._path is not None:
+            return self.__class__.open, (self._path, self.cache_size)
+
+        return self.__class__, (bytes(self._buffer), self.cache_size)
+
+    def __repr__(self) -> str:
+        storage = f"shared_memory={self.name!r}" if self._shm is not None else f"path={self._path!r}" if self._path else "in-process"
+        return f"PackedTable({self._count} entries, {self.nbytes} bytes, {storage})"
+
+
+_MISSING = object()
+
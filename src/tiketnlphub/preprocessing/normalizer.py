@@ -1,8 +1,12 @@
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union
 import re
 import contractions
 import unicodedata
 
 from .re_pattern import RegexString, RegexReplacement
+from .lookup import PackedTable, file_signature
+from .slang import SlangDictionary
 
 
 def normalize_to_ascii_chars(text: str) -> str:
@@ -75,6 +79,93 @@ def normalize_punctuations(text: str, additional_punctuations: dict = None) -> s
     return text
 
 
+# blocks folded with their NFKC compatibility form: spaces, vertical and small punctuation forms, full-width and half-width forms
+_FULLWIDTH_BLOCKS = (range(0x2000, 0x200B), range(0x3000, 0x3001), range(0xFE10, 0xFE1A), range(0xFE30, 0xFE70), range(0xFF01, 0xFFEF))
+
+# the half-width voiced sound marks fold into combining marks, which are composed with the preceding kana (ｶﾞ becomes ガ)
+_COMBINING_KANA_MARKS = ("\u3099", "\u309a")
+
+
+@lru_cache(maxsize=32)
+def load_fullwidth_table(additional_chars: frozenset = frozenset(), punctuations: bool = True) -> dict:
+    """
+    Build (or fetch from the cache) the `str.translate` table of `normalize_fullwidth_chars`.
+
+    Every character of the full-width and half-width forms, the vertical and small punctuation forms and the typographic spaces is mapped to its NFKC compatibility form (Ａ to A, １ to 1, ！ to !, ｶ to カ, the ideographic space to a space).
+    Characters whose compatibility form is a space followed by a combining mark (￣, ﹉) are kept as they are.
+
+    Parameters
+    ----------
+    additional_chars: frozenset
+        Additional `(char, replacement)` pairs, overriding the built-in ones. A replacement of `None` deletes the character. Default is an empty set.
+
+    punctuations: bool
+        Whether to also fold the look-alike punctuations of tiketnlphub.preprocessing.re_pattern.RegexReplacement.FULLWIDTH_PUNCT (、 to a comma, 「」 to double quotes, ...). Default is `True`.
+
+    Returns
+    -------
+    table: dict
+        The translation table, keyed by code point.
+    """
+    table = {}
+    for block in _FULLWIDTH_BLOCKS:
+        for code_point in block:
+            char = chr(code_point)
+            folded = unicodedata.normalize("NFKC", char)
+            if folded != char and not (folded[0] == " " and len(folded) > 1):
+                table[code_point] = folded
+    if punctuations:
+        folds = RegexReplacement.FULLWIDTH_PUNCT
+        # the folded forms are folded again, so the half-width ｢ becomes 「 and then a double quote
+        table = {code_point: folds.get(folded, folded) for code_point, folded in table.items()}
+        table.update((ord(char), replacement) for char, replacement in folds.items())
+    for char, replacement in additional_chars:
+        if len(char) != 1:
+            raise ValueError(f"Only single characters can be folded, got {char!r}")
+        table[ord(char)] = replacement
+
+    return table
+
+
+def normalize_fullwidth_chars(text: str, additional_chars: dict = None, punctuations: bool = True) -> str:
+    """
+    Fold the full-width and half-width forms of Asian texts (ＡＢＣ１２３！？，) and the look-alike punctuations of CJK and typographic texts into their usual forms, in one `str.translate` pass.
+
+    Unlike tiketnlphub.preprocessing.normalizer.normalize_to_ascii_chars, letters of other scripts, accents and emojis are kept: only the compatibility forms and the punctuations are folded.
+    To see the whole translation table, refer to tiketnlphub.preprocessing.normalizer.load_fullwidth_table.
+
+    Example
+    -------
+    >>> from tiketnlphub.preprocessing.normalizer import normalize_fullwidth_chars
+    >>> text = normalize_fullwidth_chars("ホテルは最高でした！部屋は１２３号室、ＷｉＦｉも速い。")
+    >>> text
+    ホテルは最高でした!部屋は123号室,WiFiも速い.
+
+    Parameters
+    ----------
+    text: str
+        The text from which the characters to be folded
+
+    additional_chars: dict
+        Additional characters to be folded, as `{char: replacement}`. A replacement of `None` deletes the character. Default is `None`.
+
+    punctuations: bool
+        Whether to also fold the look-alike punctuations. Default is `True`.
+
+    Returns
+    -------
+    text: str
+        The folded input text.
+    """
+    if text.isascii() and not additional_chars:
+        return text
+    text = text.translate(load_fullwidth_table(frozenset((additional_chars or {}).items()), punctuations))
+    if any(mark in text for mark in _COMBINING_KANA_MARKS):
+        text = unicodedata.normalize("NFC", text)
+
+    return text
+
+
 def normalize_remunerations(text: str, additional_remunerations: dict = None) -> str:
     """
     Normalize remuneration in the input string.
@@ -109,6 +200,211 @@ def normalize_remunerations(text: str, additional_remunerations: dict = None) ->
     return text
 
 
+# the dictionaries of the additional slangs given as dicts, keyed by the identity of the dict, and the last loaded dictionary of every slang file
+_MERGED_SLANGS = {}
+
+_SLANG_FILES = {}
+
+_SLANG_CACHE_SIZE = 32
+
+
+@lru_cache(maxsize=_SLANG_CACHE_SIZE)
+def load_slang_dictionary(lang: str = "id", path: str = None, signature: Optional[Tuple[int, int]] = None) -> SlangDictionary:
+    """
+    Build (or fetch from the cache) the slang dictionary of a language, optionally extended with the entries of a mapping file.
+
+    The built-in entries are listed in tiketnlphub.preprocessing.re_pattern.RegexReplacement.SLANGS. See `SlangDictionary.from_file` for the supported file formats.
+    A packed dictionary file written by `SlangDictionary.save` is memory-mapped and used as is, so every process of a pool shares its pages: it replaces the built-in entries instead of extending them.
+    Pack a dictionary obtained from `get_slang_dictionary` to keep them, e.g. `get_slang_dictionary("id", "slangs.tsv").save("slangs.tbl")`.
+
+    Parameters
+    ----------
+    lang: str
+        The language of the built-in entries, `id` or `en`. Default is `id`.
+
+    path: str
+        The path of a JSON, CSV or TSV mapping file whose entries are added to (and override) the built-in entries, or of a packed dictionary file used instead of them. Default is `None`, built-in entries only.
+
+    signature: tuple
+        The size and modification time of the file (see `tiketnlphub.preprocessing.lookup.file_signature`), only part of the cache key so that a rewritten file is loaded again. Default is `None`.
+
+    Returns
+    -------
+    dictionary: tiketnlphub.preprocessing.slang.SlangDictionary
+        The slang dictionary. It is cached, do not update it in place.
+    """
+    if path and PackedTable.is_packed(path):
+        return SlangDictionary.open(path)
+
+    dictionary = SlangDictionary(RegexReplacement.SLANGS.get(lang, {}))
+    if path:
+        dictionary.update(dict(SlangDictionary.from_file(path).items()))
+
+    return dictionary
+
+
+def get_slang_dictionary(lang: str = "id", additional_slangs: Union[dict, str, SlangDictionary] = None) -> SlangDictionary:
+    """
+    Get the slang dictionary of a language extended with additional entries, given as a dict or as the path of a mapping file (a packed file replaces the built-in entries, see `load_slang_dictionary`).
+
+    Build the dictionary once and pass it to the per-text functions (`normalize_slangs`, `normalize_slangs_tokens`) as `additional_slangs`, a `SlangDictionary` is used as is.
+    A file is checked for changes on every call, and reloaded when its size or modification time changed. A dict is merged once and cached by identity, do not update it in place afterwards.
+    """
+    if isinstance(additional_slangs, SlangDictionary):
+        return additional_slangs
+    if additional_slangs is None:
+        return load_slang_dictionary(lang)
+    if isinstance(additional_slangs, str):
+        dictionary = load_slang_dictionary(lang, additional_slangs, file_signature(additional_slangs))
+        _cache_slangs(_SLANG_FILES, (lang, additional_slangs), dictionary)
+        return dictionary
+
+    key = (lang, id(additional_slangs))
+    cached = _MERGED_SLANGS.get(key)
+    # the dict is kept along, so its id is not reused by another dict while it is cached
+    if cached is None or cached[0] is not additional_slangs:
+        dictionary = SlangDictionary()
+        dictionary.update(RegexReplacement.SLANGS.get(lang, {}))
+        dictionary.update(additional_slangs)
+        cached = _cache_slangs(_MERGED_SLANGS, key, (additional_slangs, dictionary))
+
+    return cached[1]
+
+
+def _cache_slangs(cache: dict, key: tuple, value):
+    if key not in cache and len(cache) >= _SLANG_CACHE_SIZE:
+        cache.clear()
+    cache[key] = value
+
+    return value
+
+
+def _resolve_slang_dictionary(lang: str, additional_slangs: Union[dict, str, SlangDictionary]) -> SlangDictionary:
+    # the per-text functions read a file once, `get_slang_dictionary` checks it again
+    if isinstance(additional_slangs, str):
+        dictionary = _SLANG_FILES.get((lang, additional_slangs))
+        if dictionary is not None:
+            return dictionary
+
+    return get_slang_dictionary(lang, additional_slangs)
+
+
+def normalize_slangs(text: str, lang: str = "id", additional_slangs: Union[dict, str, SlangDictionary] = None) -> str:
+    """
+    Normalize informal spellings, slangs and abbreviations (e.g. yg, gk, bgt, tdk, krn, mantul) into their standard spelling.
+
+    Every token is looked up once in a dictionary, case-insensitively and without its surrounding punctuation. Entries may span several tokens (e.g. gak papa), the case of the matched token is preserved and the tokens are joined with a single space.
+    The built-in entries are listed in tiketnlphub.preprocessing.re_pattern.RegexReplacement.SLANGS. Large custom dictionaries can be loaded from a JSON, CSV or TSV file, see tiketnlphub.preprocessing.slang.SlangDictionary.
+    To normalize many texts with custom entries, build the dictionary once with `get_slang_dictionary` and pass it as `additional_slangs`.
+
+    Example
+    -------
+    >>> from tiketnlphub.preprocessing.normalizer import normalize_slangs
+    >>> text = normalize_slangs("Kamarnya bersih bgt, tp AC gk dingin krn rusak")
+    >>> text
+    Kamarnya bersih banget, tapi AC tidak dingin karena rusak
+
+    >>> text = normalize_slangs("Stafnya mantul, recommended bgt", additional_slangs={"recommended": "direkomendasikan"})
+    >>> text
+    Stafnya mantap betul, direkomendasikan banget
+
+    Parameters
+    ----------
+    text: str
+        The text from which the slangs to be normalized
+
+    lang: str
+        The language of the built-in dictionary, `id` or `en`. Default is `id`.
+
+    additional_slangs: dict, str or tiketnlphub.preprocessing.slang.SlangDictionary
+        Additional slang-replacement pairs, or the path of a mapping file holding them. They override the built-in entries. A packed dictionary file written by tiketnlphub.preprocessing.slang.SlangDictionary.save is memory-mapped and replaces the built-in entries.
+        A file is read once, call `get_slang_dictionary` to reload it after a change. A `SlangDictionary`, e.g. built by `get_slang_dictionary`, is used as is. Default is `None`.
+
+    Returns
+    -------
+    text: str
+        The normalized slangs input text.
+    """
+    return " ".join(normalize_slangs_tokens(text.split(), lang, additional_slangs))
+
+
+def normalize_slangs_tokens(tokens: List[str], lang: str = "id", additional_slangs: Union[dict, str, SlangDictionary] = None) -> List[str]:
+    """
+    Token-level variant of `normalize_slangs`, working on the tokens of `text.split()`.
+
+    Parameters
+    ----------
+    tokens: list
+        The whitespace separated tokens of the text.
+
+    Returns
+    -------
+    tokens: list
+        The normalized tokens.
+    """
+    return _resolve_slang_dictionary(lang, additional_slangs).normalize_tokens(tokens)
+
+
+@lru_cache(maxsize=None)
+def compile_slash_rules(lang: str = "en") -> tuple:
+    """
+    Compile the `normalize_slashes` rule chain of a language into a tuple of `(pattern, replacement)` pairs.
+
+    The general rules come first, followed by the language specific rules, which is the order `normalize_slashes` applies them. The result is cached per language, so the rule tables are only looked up and compiled once.
+
+    Example
+    -------
+    >>> from tiketnlphub.preprocessing.normalizer import compile_slash_rules
+    >>> rules = compile_slash_rules("id")
+    >>> rules[-1]
+    (re.compile('\\/', re.IGNORECASE), ' atau ')
+
+    Parameters
+    ----------
+    lang: str
+        The language of the rule chain, a key of tiketnlphub.preprocessing.re_pattern.RegexReplacement.SLASHES. Default is `en`.
+
+    Returns
+    -------
+    rules: tuple
+        The compiled `(pattern, replacement)` pairs.
+    """
+    return (
+        tuple((re.compile(pattern), value) for pattern, value in RegexReplacement.SLASHES["general"].items())
+        + tuple((re.compile(pattern, re.IGNORECASE), value) for pattern, value in RegexReplacement.SLASHES[lang].items())
+    )
+
+
+@lru_cache(maxsize=None)
+def compile_symbol_rules(lang: str = "en") -> tuple:
+    """
+    Compile the `normalize_symbols` rule chain of a language into a tuple of `(pattern, replacement)` pairs.
+
+    The general rules come first, followed by the language specific rules, which is the order `normalize_symbols` applies them. The result is cached per language, so the rule tables are only looked up and compiled once.
+
+    Example
+    -------
+    >>> from tiketnlphub.preprocessing.normalizer import compile_symbol_rules
+    >>> rules = compile_symbol_rules("en")
+    >>> rules[0]
+    (re.compile('€'), ' EUR ')
+
+    Parameters
+    ----------
+    lang: str
+        The language of the rule chain, a key of tiketnlphub.preprocessing.re_pattern.RegexReplacement.SYMBOLS. Default is `en`.
+
+    Returns
+    -------
+    rules: tuple
+        The compiled `(pattern, replacement)` pairs.
+    """
+    return (
+        tuple((re.compile(pattern), value) for pattern, value in RegexReplacement.SYMBOLS["general"].items())
+        + tuple((re.compile(pattern), value) for pattern, value in RegexReplacement.SYMBOLS[lang].items())
+    )
+
+
 def normalize_slashes(text: str, lang="en") -> str:
     """
     Normalize the use of slashes in the input string.
@@ -134,10 +430,8 @@ def normalize_slashes(text: str, lang="en") -> str:
     text: str
         The normalized slashes input text.
     """
-    for pattern, value in RegexReplacement.SLASHES["general"].items():
-        text = re.sub(pattern, value, text)
-    for pattern, value in RegexReplacement.SLASHES[lang].items():
-        text = re.sub(pattern, value, text, flags=re.IGNORECASE)
+    for pattern, value in compile_slash_rules(lang):
+        text = pattern.sub(value, text)
         
     return text
 
@@ -166,10 +460,8 @@ def normalize_symbols(text: str, lang="en", additional_symbols: dict = None) ->
     text: str
         The normalized symbols input text.
     """
-    for pattern, value in RegexReplacement.SYMBOLS["general"].items():
-        text = re.sub(pattern, value, text)
-    for pattern, value in RegexReplacement.SYMBOLS[lang].items():
-        text = re.sub(pattern, value, text)
+    for pattern, value in compile_symbol_rules(lang):
+        text = pattern.sub(value, text)
     if additional_symbols:
         for pattern, value in additional_symbols.items():
             text = re.sub(pattern, value, text)
@@ -227,13 +519,27 @@ def normalize_non_ascii_char_currencies(text: str) -> str:
     text: str
         The normalized punctuations input text.
     """
-    raw = text
-    text = (
-        unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("utf-8", "ignore")
-    )
+    return " ".join(normalize_non_ascii_char_currencies_tokens(text.split()))
+
+
+def normalize_non_ascii_char_currencies_tokens(tokens: List[str]) -> List[str]:
+    """
+    Token-level variant of `normalize_non_ascii_char_currencies`, working on the tokens of `text.split()`.
 
-    word_list = text.split()
-    raw_list = raw.split()
+    Parameters
+    ----------
+    tokens: list
+        The whitespace separated tokens of the text.
+
+    Returns
+    -------
+    tokens: list
+        The normalized tokens.
+    """
+    raw_list = tokens
+    word_list = (
+        unicodedata.normalize("NFKD", " ".join(tokens)).encode("ascii", "ignore").decode("utf-8", "ignore")
+    ).split()
 
     new_word_list = []
     for w, r in zip(word_list, raw_list):
@@ -241,9 +547,8 @@ def normalize_non_ascii_char_currencies(text: str) -> str:
             new_word_list.append(r)
         else:
             new_word_list.append(w)
-    text = " ".join(new_word_list)
-    
-    return text
+
+    return new_word_list
 
 
 def normalize_contractions(text: str, additional_contractions: dict=None) -> str:
@@ -0,0 +1,195 @@
+from array import array
+from itertools import accumulate
+from multiprocessing import Pool, shared_memory
+from typing import List, Sequence, Tuple
+import os
+import secrets
+import struct
+
+from .pipeline import Pipeline
+
+
+# number of texts and size of the UTF-8 data of a packed block, followed by the offsets and the data
+_BLOCK_HEADER = struct.Struct("<QQ")
+
+_OFFSET = "Q"
+
+
+def pack_texts(texts: Sequence[str]) -> Tuple[bytes, array]:
+    """
+    Pack texts into one contiguous UTF-8 buffer plus the offsets of every text.
+
+    The texts are joined and encoded with single C level calls. Offsets count code points, not bytes, so the receiving side decodes the whole buffer once and slices it, see `unpack_texts`.
+
+    Example
+    -------
+    >>> from tiketnlphub.preprocessing.parallel import pack_texts
+    >>> pack_texts(["kamar", "bersih"])
+    (b'kamarbersih', array('Q', [0, 5, 11]))
+
+    Parameters
+    ----------
+    texts: list
+        The texts to pack.
+
+    Returns
+    -------
+    packed: tuple
+        The UTF-8 encoded texts and the `len(texts) + 1` code point offsets delimiting them.
+    """
+    offsets = array(_OFFSET, accumulate(map(len, texts), initial=0))
+
+    return "".join(texts).encode("utf-8", "surrogatepass"), offsets
+
+
+def unpack_texts(data, offsets: Sequence[int]) -> List[str]:
+    """
+    Unpack texts packed by `pack_texts`. `data` can be any bytes-like object, such as a slice of a shared memory block.
+    """
+    joined = str(data, "utf-8", "surrogatepass")
+
+    return [joined[start:end] for start, end in zip(offsets, offsets[1:])]
+
+
+def _block_size(data: bytes, offsets: array) -> int:
+    return _BLOCK_HEADER.size + len(offsets) * offsets.itemsize + len(data)
+
+
+def _write_block(buffer, position: int, data: bytes, offsets: array):
+    _BLOCK_HEADER.pack_into(buffer, position, len(offsets) - 1, len(data))
+    position += _BLOCK_HEADER.size
+    buffer[position:position + len(offsets) * offsets.itemsize] = offsets.tobytes()
+    position += len(offsets) * offsets.itemsize
+    buffer[position:position + len(data)] = data
+
+
+def _read_block(buffer, position: int = 0) -> List[str]:
+    count, size = _BLOCK_HEADER.unpack_from(buffer, position)
+    position += _BLOCK_HEADER.size
+    offsets = array(_OFFSET)
+    offsets.frombytes(buffer[position:position + (count + 1) * offsets.itemsize])
+    position += (count + 1) * offsets.itemsize
+    # release the slice right away, a shared memory block can not be closed while views of it are alive
+    with buffer[position:position + size] as data:
+        return unpack_texts(data, offsets)
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 registers attached blocks with the resource tracker, which pool workers share with the process that created the block
+        return shared_memory.SharedMemory(name=name)
+
+
+def _unlink(name: str):
+    try:
+        block = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return
+    block.close()
+    block.unlink()
+
+
+# state of a pool worker, set once by `_init_worker`
+_worker = {}
+
+
+def _init_worker(pipeline: Pipeline, input_name: str, lang: str):
+    _worker["pipeline"] = pipeline
+    _worker["input"] = _attach(input_name)
+    _worker["lang"] = lang
+
+
+def _run_chunk(task: Tuple[int, int, str]) -> str:
+    position, size, name = task
+    with _worker["input"].buf[position:position + size] as view:
+        texts = _read_block(view)
+    data, offsets = pack_texts(_worker["pipeline"].run_batch(texts, langs=_worker["lang"]))
+
+    # the results go back through a new block owned by the parent from now on, only its name crosses the pipe
+    output = shared_memory.SharedMemory(name=name, create=True, size=max(_block_size(data, offsets), 1))
+    _write_block(output.buf, 0, data, offsets)
+    output.close()
+
+    return output.name
+
+
+def run_parallel(pipeline: Pipeline, texts: Sequence[str], lang: str = None, workers: int = None, chunk_size: int = 10_000) -> List[str]:
+    """
+    Run a pipeline over a large batch of texts with a pool of worker processes, without pickling the texts.
+
+    The texts are packed chunk by chunk into one shared memory block as UTF-8 data plus offsets (see `pack_texts`). Workers decode their chunk in place and write their results back into a shared memory block of their own,
+    so only `(offset, size)` descriptors and block names cross the pipes of the pool, instead of millions of pickled `str` objects. The pipeline itself is sent once per worker.
+
+    Example
+    -------
+    >>> from tiketnlphub.preprocessing.parallel import run_parallel
+    >>> from tiketnlphub.preprocessing.pipeline import Pipeline
+    >>> pipeline = Pipeline(["remove_urls", "remove_emojis_emoticons", "remove_white_spaces"], lang="id")
+    >>> cleaned = run_parallel(pipeline, reviews, workers=8)
+
+    Parameters
+    ----------
+    pipeline: tiketnlphub.preprocessing.pipeline.Pipeline
+        The pipeline to run over every text.
+
+    texts: list
+        The texts to process.
+
+    lang: str
+        The language of the pipeline plan. Default is `None`, use the pipeline language.
+
+    workers: int
+        The number of worker processes. Default is `None`, use `os.cpu_count()`.
+
+    chunk_size: int
+        The number of texts per task. Default is `10_000`.
+
+    Returns
+    -------
+    texts: list
+        The processed texts, in input order.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive number of texts")
+
+    chunks = [texts[start:start + chunk_size] for start in range(0, len(texts), chunk_size)]
+    workers = min(workers or os.cpu_count() or 1, max(len(chunks), 1))
+    if workers == 1:
+        return pipeline.run_batch(texts, langs=lang)
+
+    # the parent names the result blocks, so it can unlink the ones left behind when a task fails
+    prefix = f"tnh_{secrets.token_hex(6)}"
+    tasks = []
+    position = 0
+    packed = [pack_texts(chunk) for chunk in chunks]
+    for index, (data, offsets) in enumerate(packed):
+        tasks.append((position, _block_size(data, offsets), f"{prefix}_{index}"))
+        position += tasks[-1][1]
+
+    shm = shared_memory.SharedMemory(create=True, size=position)
+    done = 0
+    try:
+        for (position, _, _), (data, offsets) in zip(tasks, packed):
+            _write_block(shm.buf, position, data, offsets)
+        del packed
+
+        results = []
+        with Pool(workers, initializer=_init_worker, initargs=(pipeline, shm.name, lang)) as pool:
+            for name in pool.imap(_run_chunk, tasks):
+                output = _attach(name)
+                try:
+                    results.extend(_read_block(output.buf))
+                finally:
+                    output.close()
+                    output.unlink()
+                    done += 1
+    finally:
+        shm.close()
+        shm.unlink()
+        # the pool is terminated by now, no worker can create a block anymore
+        for _, _, name in tasks[done:]:
+            _unlink(name)
+
+    return results
@@ -0,0 +1,704 @@
+from functools import lru_cache, partial
+from itertools import groupby
+from operator import itemgetter
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple, Union
+import hashlib
+import inspect
+import json
+import re
+
+from .. import __version__
+from . import cleaner, normalizer, spelling, stemmer, temporal, truecase
+from .lookup import file_signature
+from .re_pattern import RegexReplacement, RegexString
+
+
+STEPS = {
+    "remove_digits": cleaner.remove_digits,
+    "remove_emojis_emoticons": cleaner.remove_emojis_emoticons,
+    "remove_hashtags": cleaner.remove_hashtags,
+    "remove_mentions": cleaner.remove_mentions,
+    "remove_urls": cleaner.remove_urls,
+    "remove_phone_numbers": cleaner.remove_phone_numbers,
+    "remove_numbering_bullets": cleaner.remove_numbering_bullets,
+    "remove_bullets": cleaner.remove_bullets,
+    "remove_html_tags": cleaner.remove_html_tags,
+    "remove_punctuations": cleaner.remove_punctuations,
+    "remove_white_spaces": cleaner.remove_white_spaces,
+    "remove_stopwords": cleaner.remove_stopwords,
+    "remove_repeated_chars": cleaner.remove_repeated_chars,
+    "remove_repeated_words": cleaner.remove_repeated_words,
+    "remove_repeated_puncts": cleaner.remove_repeated_puncts,
+    "collapse_repeats": cleaner.collapse_repeats,
+    "split_punct_and_word": cleaner.split_punct_and_word,
+    "upper_selected_word": cleaner.upper_selected_word,
+    "upper_i_word": cleaner.upper_i_word,
+    "lower_letter_sequence_caps": cleaner.lower_letter_sequence_caps,
+    "truecase": truecase.truecase,
+    "handle_time_format": cleaner.handle_time_format,
+    "normalize_times_dates": temporal.normalize_times_dates,
+    "normalize_to_ascii_chars": normalizer.normalize_to_ascii_chars,
+    "normalize_punctuations": normalizer.normalize_punctuations,
+    "normalize_fullwidth_chars": normalizer.normalize_fullwidth_chars,
+    "normalize_remunerations": normalizer.normalize_remunerations,
+    "normalize_slangs": normalizer.normalize_slangs,
+    "normalize_slashes": normalizer.normalize_slashes,
+    "normalize_symbols": normalizer.normalize_symbols,
+    "normalize_parentheses": normalizer.normalize_parentheses,
+    "normalize_non_ascii_char_currencies": normalizer.normalize_non_ascii_char_currencies,
+    "normalize_contractions": normalizer.normalize_contractions,
+    "normalize_fullstops": normalizer.normalize_fullstops,
+    "split_word_and_num": normalizer.split_word_and_num,
+    "stem_words": stemmer.stem_words,
+    "correct_spelling": spelling.correct_spelling,
+}
+
+
+Step = Union[str, Tuple[str, dict], Callable[[str], str]]
+
+
+class RuleChain:
+    """
+    A compiled chain of `(pattern, replacement)` rules applied one after another.
+
+    Consecutive regex rule based steps of a pipeline are flattened into a single chain, so a language plan walks one tuple instead of looking up the rule tables on every call.
+    """
+
+    __slots__ = ("rules",)
+
+    def __init__(self, rules: Iterable[tuple]):
+        self.rules = tuple(rules)
+
+    def __call__(self, text: str) -> str:
+        for pattern, value in self.rules:
+            text = pattern.sub(value, text)
+
+        return text
+
+    def __repr__(self) -> str:
+        return f"RuleChain({len(self.rules)} rules)"
+
+
+class TokenChain:
+    """
+    A chain of token-level steps sharing one token list.
+
+    The text is split once, every step transforms the same list of tokens, and the tokens are joined with a single space once at the end, instead of every step splitting and joining the text again.
+    """
+
+    __slots__ = ("steps",)
+
+    def __init__(self, steps: Iterable[Callable[[List[str]], List[str]]]):
+        self.steps = tuple(steps)
+
+    def __call__(self, text: str) -> str:
+        tokens = text.split()
+        for step in self.steps:
+            tokens = step(tokens)
+
+        return " ".join(tokens)
+
+    def __repr__(self) -> str:
+        return f"TokenChain({len(self.steps)} steps)"
+
+
+# token-level variants of steps that split the text on whitespace and join the tokens with a single space.
+# A token-level variant takes the list of tokens (plus the parameters of the step) and returns a list of tokens,
+# such that `" ".join(variant(text.split(), **params)) == step(text, **params)`.
+TOKEN_STEPS = {
+    "remove_white_spaces": cleaner.remove_white_spaces_tokens,
+    "remove_stopwords": cleaner.remove_stopwords_tokens,
+    "upper_i_word": cleaner.upper_i_word_tokens,
+    "normalize_non_ascii_char_currencies": normalizer.normalize_non_ascii_char_currencies_tokens,
+    "normalize_slangs": normalizer.normalize_slangs_tokens,
+    "stem_words": stemmer.stem_words_tokens,
+    "correct_spelling": spelling.correct_spelling_tokens,
+}
+
+
+def _compile_slangs(lang: str, additional_slangs=None) -> Callable[[List[str]], List[str]]:
+    return normalizer.get_slang_dictionary(lang, additional_slangs).normalize_tokens
+
+
+def _compile_stopwords(lang: str, extra=None, casefold: bool = False) -> Callable[[List[str]], List[str]]:
+    return partial(cleaner._filter_stopwords, stopwords=cleaner.get_stopwords(lang, extra, casefold), casefold=casefold)
+
+
+def _compile_spelling(lang: str, dictionary, max_distance: int = None) -> Callable[[List[str]], List[str]]:
+    return spelling.get_spelling_corrector(dictionary, max_distance).correct_tokens
+
+
+# token-level steps whose token callable can be built ahead of time, keyed by step name
+TOKEN_COMPILERS = {
+    "normalize_slangs": _compile_slangs,
+    "remove_stopwords": _compile_stopwords,
+    "correct_spelling": _compile_spelling,
+}
+
+
+def _compile_slashes(lang: str) -> tuple:
+    return normalizer.compile_slash_rules(lang)
+
+
+def _compile_symbols(lang: str, additional_symbols: dict = None) -> tuple:
+    rules = normalizer.compile_symbol_rules(lang)
+    if additional_symbols:
+        rules += tuple((re.compile(pattern), value) for pattern, value in additional_symbols.items())
+
+    return rules
+
+
+# steps whose rule chain can be compiled ahead of time, keyed by step name
+RULE_COMPILERS = {
+    "normalize_slashes": _compile_slashes,
+    "normalize_symbols": _compile_symbols,
+}
+
+
+def _import_yaml():
+    try:
+        import yaml
+    except ImportError as e:
+        raise ImportError("YAML pipeline specs require the optional `pyyaml` package: pip install pyyaml") from e
+
+    return yaml
+
+
+# steps that only delete the matches of a pattern, as `(pattern, flags)`
+DELETIONS = {
+    "remove_digits": (RegexString.DIGITS, 0),
+    "remove_hashtags": (RegexString.HASTAGS, 0),
+    "remove_mentions": (RegexString.MENTIONS, 0),
+    "remove_phone_numbers": (RegexString.PHONE_NUMBERS, re.IGNORECASE),
+    "remove_urls": (RegexString.URLS, re.IGNORECASE),
+}
+
+# ordered `(earlier, later)` pairs of deletion steps for which a single alternation pass gives exactly the output of running them one after another:
+# - `(X, "remove_digits")`: no match of X starts with a digit, so a digit run never swallows the start of an X match, and remove_digits deletes every digit left whatever X removed.
+# - hashtags and mentions: a match ends right before a non-word character and never contains the `#`/`@` starting the other, so deleting one never creates, extends or splits the other.
+# Phone numbers and URLs also match whitespace and `\S` runs, so deleting something next to them can extend their matches: they only fuse with a later remove_digits.
+FUSABLE_DELETIONS = {
+    ("remove_hashtags", "remove_digits"),
+    ("remove_mentions", "remove_digits"),
+    ("remove_phone_numbers", "remove_digits"),
+    ("remove_urls", "remove_digits"),
+    ("remove_hashtags", "remove_mentions"),
+    ("remove_mentions", "remove_hashtags"),
+}
+
+
+def group_deletions(names: Sequence[str]) -> List[List[str]]:
+    """
+    Split a run of consecutive deletion steps into the fewest groups that can each be fused into a single alternation pass.
+
+    A group only holds steps whose every `(earlier, later)` pair is listed in `FUSABLE_DELETIONS`, the other steps fall back to sequential execution.
+
+    Example
+    -------
+    >>> from tiketnlphub.preprocessing.pipeline import group_deletions
+    >>> group_deletions(["remove_urls", "remove_mentions", "remove_hashtags", "remove_phone_numbers", "remove_digits"])
+    [['remove_urls'], ['remove_mentions', 'remove_hashtags'], ['remove_phone_numbers', 'remove_digits']]
+
+    Parameters
+    ----------
+    names: list
+        The names of the deletion steps, in pipeline order.
+
+    Returns
+    -------
+    groups: list
+        The groups of step names, in pipeline order.
+    """
+    groups = []
+    for name in names:
+        if groups and all((earlier, name) in FUSABLE_DELETIONS for earlier in groups[-1]):
+            groups[-1].append(name)
+        else:
+            groups.append([name])
+
+    return groups
+
+
+def fuse_deletions(names: Sequence[str]) -> "re.Pattern":
+    """
+    Compile a group of deletion steps (see `group_deletions`) into one alternation pattern, to be substituted with an empty string.
+    """
+    alternatives = []
+    for name in names:
+        pattern, flags = DELETIONS[name]
+        alternatives.append(f"(?i:{pattern})" if flags & re.IGNORECASE else f"(?:{pattern})")
+
+    return re.compile("|".join(alternatives))
+
+
+# parameters of named steps holding the path of a file read by the step, whose size and modification time are part of the pipeline fingerprint
+FILE_PARAMS = {
+    "normalize_slangs": "additional_slangs",
+    "correct_spelling": "dictionary",
+}
+
+
+@lru_cache(maxsize=None)
+def rules_digest() -> str:
+    """
+    A digest of the pattern and replacement tables of tiketnlphub.preprocessing.re_pattern, part of the result cache keys so a persistent cache never serves the results of older rules.
+    """
+    tables = {f"{table.__name__}.{name}": value for table in (RegexString, RegexReplacement) for name, value in vars(table).items() if not name.startswith("_")}
+    payload = json.dumps(tables, sort_keys=True, ensure_ascii=False, default=sorted)
+
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _accepts_lang(func: Callable) -> bool:
+    try:
+        return "lang" in inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def _parse_step(step: Step) -> Tuple[str, Callable, dict]:
+    if isinstance(step, str):
+        name, params = step, {}
+    elif isinstance(step, tuple) and len(step) == 2 and isinstance(step[0], str):
+        name, params = step[0], dict(step[1] or {})
+    elif isinstance(step, dict) and "name" in step:
+        name, params = step["name"], dict(step.get("params") or {})
+    elif callable(step):
+        return getattr(step, "__name__", repr(step)), step, {}
+    else:
+        raise TypeError(f"Unsupported pipeline step: {step!r}")
+
+    if name not in STEPS:
+        raise ValueError(f"Unknown pipeline step '{name}'. Available steps: {', '.join(sorted(STEPS))}")
+
+    accepted = list(inspect.signature(STEPS[name]).parameters)[1:]
+    unknown = [param for param in params if param not in accepted]
+    if unknown:
+        raise ValueError(f"Unknown parameter(s) {', '.join(unknown)} for pipeline step '{name}'. Accepted parameters: {', '.join(accepted) or 'none'}")
+    if params.get("mode") == "extract":
+        raise ValueError(f"Pipeline step '{name}' cannot run with mode='extract', which returns the extracted values along with the text")
+
+    return name, STEPS[name], params
+
+
+# compiled plans of declarative pipelines, shared by every pipeline of the process with the same fingerprint
+_SHARED_PLANS = {}
+
+_SHARED_PLANS_SIZE = 128
+
+
+class Pipeline:
+    """
+    A chain of cleaning and normalization steps compiled into one execution plan per language.
+
+    Steps are given as a step name (see `STEPS`), a `(name, params)` tuple, a `{"name": ..., "params": ...}` dict or any callable taking and returning a string.
+    A pipeline made of named steps only is declarative: it can be saved to and loaded from a JSON/YAML spec (see `to_spec` and `from_spec`), its fingerprint is stable across processes and runs, and it pickles as its compact spec.
+    Language dependent steps such as `normalize_slashes` and `normalize_symbols` receive the language of the plan unless `lang` is set explicitly in their params.
+    Their rule chains are compiled once per language and consecutive rule chains are merged, so running a plan does not look up rule tables per call.
+    Runs of deletion steps (`remove_digits`, `remove_hashtags`, `remove_mentions`, `remove_phone_numbers`, `remove_urls`) are fused into single alternation passes wherever that provably gives the same output, see `group_deletions`.
+    Only their default `remove` mode is fused, a deletion step with `mode="mask"` runs on its own.
+    Runs of token-level steps (see `TOKEN_STEPS`) share one token list, so the text is split and joined once per run.
+    Dictionary based token-level steps such as `normalize_slangs`, `remove_stopwords` and `correct_spelling` build their dictionary, stopword set or spelling index once per plan.
+
+    Example
+    -------
+    >>> from tiketnlphub.preprocessing.pipeline import Pipeline
+    >>> pipeline = Pipeline(["normalize_slashes", "normalize_symbols", "remove_white_spaces"], lang="id")
+    >>> pipeline("Kolam renang/pantai & sarapan ½ porsi")
+    Kolam renang atau pantai dan sarapan setengah porsi
+
+    >>> pipeline.run_batch(["Pool/beach ½ price", "Kolam/pantai"], langs=["en", "id"])
+    ['Pool or beach half price', 'Kolam atau pantai']
+
+    Parameters
+    ----------
+    steps: list
+        The steps to run, in order.
+
+    lang: str
+        The default language of the pipeline. Default is `en`.
+    """
+
+    def __init__(self, steps: Sequence[Step], lang: str = "en"):
+        self.steps = [_parse_step(step) for step in steps]
+        self.lang = lang
+        self._plans = {}
+        self._description = None
+        self._fingerprint = None
+        # the signatures of the files read by the steps when the plans were compiled, `None` until then
+        self._signatures = None
+
+    @property
+    def declarative(self) -> bool:
+        """
+        Whether the pipeline only has named steps, and can therefore be described by a spec.
+        """
+        return all(func is STEPS.get(name) for name, func, _ in self.steps)
+
+    def to_spec(self) -> dict:
+        """
+        Describe the pipeline as a JSON/YAML serializable spec.
+
+        Example
+        -------
+        >>> from tiketnlphub.preprocessing.pipeline import Pipeline
+        >>> Pipeline(["remove_urls", ("normalize_symbols", {"additional_symbols": {"Rp.": "IDR"}})], lang="id").to_spec()
+        {'lang': 'id', 'steps': ['remove_urls', {'name': 'normalize_symbols', 'params': {'additional_symbols': {'Rp.': 'IDR'}}}]}
+
+        Returns
+        -------
+        spec: dict
+            The pipeline language and its steps, each step being a step name or a `{"name": ..., "params": ...}` dict.
+        """
+        if not self.declarative:
+            callables = [name for name, func, _ in self.steps if func is not STEPS.get(name)]
+            raise ValueError(f"Pipeline steps {', '.join(callables)} are plain callables and cannot be described by a spec, use named steps instead")
+
+        return {
+            "lang": self.lang,
+            "steps": [{"name": name, "params": dict(params)} if params else name for name, _, params in self.steps],
+        }
+
+    @classmethod
+    def from_spec(cls, spec: dict) -> "Pipeline":
+        """
+        Build a pipeline from a spec, see `to_spec`.
+
+        Parameters
+        ----------
+        spec: dict
+            The pipeline spec. `lang` is optional and defaults to `en`.
+
+        Returns
+        -------
+        pipeline: Pipeline
+            The pipeline described by the spec.
+        """
+        unknown = [key for key in spec if key not in ("lang", "steps")]
+        if unknown:
+            raise ValueError(f"Unknown pipeline spec key(s): {', '.join(unknown)}")
+
+        return cls(spec.get("steps", []), lang=spec.get("lang", "en"))
+
+    def to_json(self, **kwargs) -> str:
+        """
+        Serialize the spec of the pipeline to JSON. Keyword arguments are passed to `json.dumps`.
+        """
+        return json.dumps(self.to_spec(), ensure_ascii=False, **kwargs)
+
+    @classmethod
+    def from_json(cls, text: str) -> "Pipeline":
+        """
+        Build a pipeline from a JSON spec, see `to_json`.
+        """
+        return cls.from_spec(json.loads(text))
+
+    def to_yaml(self) -> str:
+        """
+        Serialize the spec of the pipeline to YAML. Requires the optional `pyyaml` package.
+        """
+        return _import_yaml().safe_dump(self.to_spec(), allow_unicode=True, sort_keys=False)
+
+    @classmethod
+    def from_yaml(cls, text: str) -> "Pipeline":
+        """
+        Build a pipeline from a YAML spec, see `to_yaml`. Requires the optional `pyyaml` package.
+        """
+        return cls.from_spec(_import_yaml().safe_load(text))
+
+    def save(self, path: str):
+        """
+        Save the spec of the pipeline to a `.json`, `.yaml` or `.yml` file.
+        """
+        text = self.to_yaml() if path.endswith((".yaml", ".yml")) else self.to_json(indent=2)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    @classmethod
+    def load(cls, path: str) -> "Pipeline":
+        """
+        Load a pipeline from a `.json`, `.yaml` or `.yml` spec file.
+        """
+        with open(path, encoding="utf-8") as f:
+            text = f.read()
+
+        return cls.from_yaml(text) if path.endswith((".yaml", ".yml")) else cls.from_json(text)
+
+    def compile(self, lang: str = None) -> tuple:
+        """
+        Compile (or fetch from the plan cache) the execution plan of a language.
+
+        Parameters
+        ----------
+        lang: str
+            The language of the plan. Default is `None`, use the pipeline language.
+
+        Returns
+        -------
+        plan: tuple
+            The callables to apply, in order.
+        """
+        lang = lang or self.lang
+        plan = self._plans.get(lang)
+        if plan is None:
+            if self._signatures is None:
+                self._check_files()
+            fingerprint = self._fingerprint
+            if fingerprint is not None:
+                key = (fingerprint, lang)
+                plan = _SHARED_PLANS.get(key)
+                if plan is None:
+                    if len(_SHARED_PLANS) >= _SHARED_PLANS_SIZE:
+                        _SHARED_PLANS.pop(next(iter(_SHARED_PLANS)))
+                    plan = _SHARED_PLANS[key] = self._build_plan(lang)
+            else:
+                plan = self._build_plan(lang)
+            self._plans[lang] = plan
+
+        return plan
+
+    def _build_plan(self, lang: str) -> tuple:
+        # first turn every step into an operation, then merge the runs of operations of the same kind
+        operations = []
+        for name, func, params in self.steps:
+            named = func is STEPS.get(name)
+            params = dict(params)
+            step_lang = params.pop("lang", lang)
+            if named and name in DELETIONS and params.get("mode", "remove") == "remove" and set(params) <= {"mode"}:
+                operations.append(("deletion", name))
+            elif named and name in RULE_COMPILERS:
+                operations.append(("rules", RULE_COMPILERS[name](step_lang, **params)))
+            elif named and name in TOKEN_COMPILERS:
+                operations.append(("tokens", TOKEN_COMPILERS[name](step_lang, **params)))
+            else:
+                if named and name in TOKEN_STEPS:
+                    kind, func = "tokens", TOKEN_STEPS[name]
+                else:
+                    kind = "text"
+                if _accepts_lang(func):
+                    params["lang"] = step_lang
+                operations.append((kind, partial(func, **params) if params else func))
+
+        fused = []
+        for kind, run in groupby(operations, key=itemgetter(0)):
+            payloads = [payload for _, payload in run]
+            if kind == "deletion":
+                fused.append(("rules", [(fuse_deletions(group), "") for group in group_deletions(payloads)]))
+            elif kind == "rules":
+                fused.append(("rules", [rule for rules in payloads for rule in rules]))
+            else:
+                fused.append((kind, payloads))
+
+        plan = []
+        for kind, run in groupby(fused, key=itemgetter(0)):
+            payloads = [payload for _, payload in run]
+            if kind == "rules":
+                plan.append(RuleChain(rule for rules in payloads for rule in rules))
+            elif kind == "tokens":
+                plan.append(TokenChain(step for steps in payloads for step in steps))
+            else:
+                plan.extend(step for steps in payloads for step in steps)
+
+        return tuple(plan)
+
+    @property
+    def fingerprint(self) -> Optional[str]:
+        """
+        A deterministic fingerprint of the pipeline configuration: its steps, their parameters and the pipeline language.
+
+        Two pipelines with the same fingerprint produce the same output, so it can be used as a version of a preprocessing setup, to tag checkpoints and as a cache key.
+        The fingerprint of a declarative pipeline only depends on its spec, so it is stable across processes, runs and machines, and on the size and modification time of the files its steps read (see `FILE_PARAMS`).
+        Pipelines whose output can not be told from a description, with plain callable steps or with parameters that are not JSON serializable (e.g. a `SlangDictionary` object), have no fingerprint:
+        it is `None`, and they are neither resumed from checkpoints nor cached.
+
+        The files are checked again on every access and once per `run_batch` or `transform_column` call, a changed file rebuilds the plans. Calling the pipeline on a single text never touches the file system.
+        """
+        return self._check_files()
+
+    def _check_files(self) -> Optional[str]:
+        # the files read by the steps are checked once per batch, not once per text: when one changed, the plans are rebuilt and the fingerprint computed again
+        signatures = tuple(
+            (str(index), file_signature(params[FILE_PARAMS[name]]))
+            for index, (name, _, params) in enumerate(self.steps)
+            if isinstance(params.get(FILE_PARAMS.get(name)), str)
+        )
+        if signatures != self._signatures:
+            self._signatures = signatures
+            self._plans = {}
+            self._fingerprint = self._compute_fingerprint(signatures)
+
+        return self._fingerprint
+
+    def _compute_fingerprint(self, signatures: tuple) -> Optional[str]:
+        if self._description is None:
+            if not self.declarative:
+                return None
+            description = {
+                "lang": self.lang,
+                "steps": [{"name": name, "params": params} for name, _, params in self.steps],
+            }
+            try:
+                self._description = json.dumps(description, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+            except TypeError:
+                return None
+
+        payload = self._description
+        if signatures:
+            payload += json.dumps(dict(signatures), sort_keys=True, separators=(",", ":"))
+
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def __reduce__(self):
+        # pickle the compact step description only, compiled plans and pattern tables are rebuilt in the receiving process
+        steps = [(name, params) if func is STEPS.get(name) else func for name, func, params in self.steps]
+
+        return self.__class__, (steps, self.lang)
+
+    def __call__(self, text: str, lang: str = None) -> str:
+        for step in self.compile(lang):
+            text = step(text)
+
+        return text
+
+    def run_batch(self, texts: Sequence[str], langs: Union[str, Sequence[str]] = None, cache=None) -> List[str]:
+        """
+        Run the pipeline over a batch of texts.
+
+        Texts are grouped by their language tag and each group runs through its own precompiled plan, so plans are never mixed inside the hot loop. The output keeps the input order.
+
+        Parameters
+        ----------
+        texts: list
+            The texts to process.
+
+        langs: str or list
+            A single language for the whole batch, or one language tag per text. Default is `None`, use the pipeline language.
+
+        cache: tiketnlphub.preprocessing.cache.ResultCache
+            A persistent result cache. Cached texts are not processed again and the results of new texts are added to the cache. Default is `None`, no cache.
+            Results are keyed by the pipeline fingerprint, the language, the package version and the rule tables, a pipeline without a fingerprint can not be cached.
+
+        Returns
+        -------
+        texts: list
+            The processed texts.
+        """
+        if self._check_files() is None and cache is not None:
+            raise ValueError("Cannot cache the results of a pipeline without a fingerprint, use named steps with JSON serializable parameters")
+
+        texts = list(texts)
+        if langs is None or isinstance(langs, str):
+            results = self._run_cached_group(texts, langs or self.lang, cache)
+        else:
+            langs = list(langs)
+            if len(langs) != len(texts):
+                raise ValueError(f"Got {len(texts)} texts but {len(langs)} language tags")
+
+            groups = {}
+            for index, lang in enumerate(langs):
+                groups.setdefault(lang or self.lang, []).append(index)
+
+            results = [None] * len(texts)
+            for lang, indices in groups.items():
+                outputs = self._run_cached_group([texts[i] for i in indices], lang, cache)
+                for index, output in zip(indices, outputs):
+                    results[index] = output
+
+        # the hits of the batch are marked as recently used now, pool workers never close their copy of the cache
+        if cache is not None:
+            cache.flush()
+
+        return results
+
+    def transform_column(self, column, lang: str = None):
+        """
+        Run the whole pipeline over a pandas Series or a NumPy array of strings in a single pass.
+
+        Each element goes through every step of the plan before the next element is processed, so no intermediate column is built per step the way chained `Series.apply` calls do.
+        Elements that no step changed (and missing values) are reused as-is instead of being copied into the new column.
+
+        Example
+        -------
+        >>> import pandas as pd
+        >>> from tiketnlphub.preprocessing.pipeline import Pipeline
+        >>> pipeline = Pipeline(["remove_urls", "normalize_symbols", "remove_white_spaces"])
+        >>> pipeline.transform_column(pd.Series(["visit https://example.com  now", "all good"]))
+        0    visit now
+        1     all good
+        dtype: object
+
+        Parameters
+        ----------
+        column: pandas.Series or numpy.ndarray
+            The column of texts to process. pandas and NumPy are optional dependencies and only needed for their own column type.
+
+        lang: str
+            The language of the plan. Default is `None`, use the pipeline language.
+
+        Returns
+        -------
+        column: pandas.Series or numpy.ndarray
+            A new column of the same type, index and name holding the processed texts.
+        """
+        self._check_files()
+        plan = self.compile(lang)
+        module = type(column).__module__.split(".")[0]
+        if module == "pandas":
+            values = column.tolist()
+        elif module == "numpy":
+            values = column.ravel().tolist()
+        else:
+            raise TypeError(f"Expected a pandas Series or a NumPy array, got {type(column).__name__}")
+
+        results = []
+        for value in values:
+            if isinstance(value, str):
+                output = value
+                for step in plan:
+                    output = step(output)
+                if output == value:
+                    output = value
+                results.append(output)
+            else:
+                results.append(value)
+
+        if module == "pandas":
+            import pandas as pd
+
+            return pd.Series(results, index=column.index, name=column.name, dtype=column.dtype)
+
+        import numpy as np
+
+        if column.dtype.kind == "O":
+            array = np.empty(len(results), dtype=object)
+            array[:] = results
+        else:
+            array = np.array(results, dtype=column.dtype.kind)
+
+        return array.reshape(column.shape)
+
+    def _run_cached_group(self, texts: List[str], lang: str, cache) -> List[str]:
+        plan = self.compile(lang)
+        if cache is None:
+            return self._run_group(texts, plan)
+
+        # the same pipeline gives different results per language, and with the steps and rule tables of another release
+        key = f"{self._fingerprint}:{lang}:{__version__}:{rules_digest()[:16]}"
+        results = cache.get_many(key, texts)
+        missing = list(dict.fromkeys(text for text, result in zip(texts, results) if result is None))
+        if missing:
+            outputs = dict(zip(missing, self._run_group(missing, plan)))
+            cache.put_many(key, missing, [outputs[text] for text in missing])
+            results = [outputs[text] if result is None else result for text, result in zip(texts, results)]
+
+        return results
+
+    @staticmethod
+    def _run_group(texts: List[str], plan: tuple) -> List[str]:
+        for step in plan:
+            texts = [step(text) for text in texts]
+
+        return texts
+
+    def __repr__(self) -> str:
+        return f"Pipeline({[name for name, _, _ in self.steps]!r}, lang={self.lang!r})"
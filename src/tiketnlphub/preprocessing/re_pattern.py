@@ -18,6 +18,18 @@ class RegexString:
     SYMBOLS = r"[_–—\=\*\|¬#@\\\\]"
 
     TIME_FORMAT = r"(\d{1,}\:\d{1,}\s?)"
+
+    # TIME_FORMAT with the hours and the minutes in separate groups, for a template replacement
+    TIME_FORMAT_PARTS = r"(\d{1,})\:(\d{1,}\s?)"
+
+    # words and suffixes of time expressions, see tiketnlphub.preprocessing.temporal
+    TIME_CUES = r"jam|pukul|pkl"
+
+    AM_PM = r"a\.m\.|p\.m\.|am|pm"
+
+    DAY_PERIODS = r"pagi|siang|sore|malam"
+
+    TIME_ZONES = r"wita|wib|wit"
     
     UNITS = r"(malam)|(hari)|(mlm)|(night)|(day)"
     
@@ -27,6 +39,15 @@ class RegexString:
     
     REPEAT_WORDS = r"\b(\w+)\b(?:\s+\1\b)+"
 
+    # REPEAT_PUNCTS then REPEAT_CHARS in one pass, keeping the last punctuation of a run or the repeated character
+    REPEAT_CHARS_PUNCTS = r"[\?\.\!]+([\?\.\!])|(\D)\2{2,}"
+
+    LEADING_WORD = r"\w+"
+
+    TRAILING_WORD = r"\w+\Z"
+
+    WHITE_SPACES = r"(\s+)"
+
     REPEAT_CAPS = r"([A-Z]{2,})"
 
     WORD_NUMBER = r"([a-zA-Z]+)([0-9]+)"
@@ -35,7 +56,31 @@ class RegexString:
 
     PUNCT_WORD = r"([.!?;,]+)(\w)"
 
-    UPPER_SELECTED_WORD = r"(^|[.?!])\s*([a-zA-Z])"
+    # the first letter after a punctuation, with the punctuation and the white spaces in a single group, for `re.split`
+    SENTENCE_START = r"([.?!]\s*)([a-zA-Z])"
+
+    # the former pattern of tiketnlphub.preprocessing.cleaner.upper_selected_word, kept as an alias for existing imports
+    UPPER_SELECTED_WORD = SENTENCE_START
+
+    # a dot after these words (any case) does not end a sentence, see tiketnlphub.preprocessing.sentences.SentenceSplitter.
+    # Abbreviations that often end a sentence (dll., etc.) are left out
+    ABBREVIATIONS = frozenset("""
+        rp jl jln no tgl yth bpk sdr kab kec kel prov gg rt rw tlp telp pkl ir
+        mr mrs ms dr st vs approx min max hr hrs mins tel ext jr sr prof inc ltd co e.g i.e a.m p.m u.s
+    """.split())
+
+    # the closing quotes and brackets that stay with the punctuation ending a sentence
+    SENTENCE_CLOSERS = r"[\"'”’)\]]*"
+
+    # the opening quotes and brackets before the first word of a sentence
+    SENTENCE_OPENERS = r"[\"'“‘(\[]*"
+
+    # every word, with the sentence boundary before it when it starts a sentence. A dot ends a sentence only before a white space and not after an abbreviation (No. kamar, i.e. this).
+    # Dotted single letters are one word (i.e, a.m), not the pronoun i
+    SENTENCE_WORDS = (
+        r"((?:^|[.?!](?<!\.(?!" + SENTENCE_CLOSERS + r"\s))" + "".join(rf"(?<!\b(?i:{re.escape(word)})\.)" for word in sorted(ABBREVIATIONS)) + ")"
+        + SENTENCE_CLOSERS + r"\s*" + SENTENCE_OPENERS + r")?(\w+(?:\.\w(?!\w))*)"
+    )
 
     URLS = r"""(https?:\/\/)(\s)*(www\.)?(\s)*((\w|\s)+\.)*([\w\-\s]+\/)*([\w\-]+)((\?)?[\w\s]*=\s*[\w\%&]*)*|www\S+"""
 
@@ -100,9 +145,43 @@ class RegexString:
             "(Y)",
         ]
 
+    # negations (tidak, bukan, belum, not, no, ...) are left out on purpose, removing them flips the sentiment of a review
+    STOPWORDS = {
+        "id": frozenset("""
+            adalah adanya agar akan akankah akhirnya aku akulah amat anda andalah antar antara apa apakah apalagi atas atau
+            ataukah ataupun bagai bagaimana bagi bahkan bahwa beberapa begini begitu beliau berapa bersama
+            betapa bila bilamana bisa boleh dahulu dalam dan dapat dari daripada demi dengan di dia dialah dini diri dulu
+            guna hal hampir hanya hanyalah harus hendak hingga ia ialah ini inilah itu itulah jadi jika jikalau juga justru kala
+            kalau kalian kami kamilah kamu kamulah kan kapan karena ke kecuali kemudian kenapa kepada ketika kini kita
+            kitalah lagi lah lain lainnya lalu maka malah mana manakah masih maupun melainkan melalui memang mengapa mereka
+            merekalah meski meskipun mungkin namun nanti nah oleh pada padahal para pasti per pernah pula pun saat saja saling
+            sambil sampai sana sang satu saya sayalah se sebab sebagai sebagaimana sebelum sebuah secara sedang sedangkan
+            sehingga sejak sekali sekalipun sekarang selagi selalu selama semua semuanya sendiri seorang seperti sering serta
+            sesudah setelah setiap si sini situ suatu sudah supaya telah tentang tentu terhadap tersebut tetapi toh untuk
+            walau walaupun yaitu yakni yang
+        """.split()),
+        "en": frozenset("""
+            a about above after again all am an and any are as at be because been before being below between both but by
+            can could did do does doing down during each few for from further had has have having he her here hers herself
+            him himself his how i if in into is it its itself just me more most my myself of off on once only or other our
+            ours ourselves out over own same she should so some such than that the their theirs them themselves then there
+            these they this those through to too under until up very was we were what when where which while who whom why
+            will with would you your yours yourself yourselves
+        """.split()),
+    }
+
 
 class RegexReplacement:
 
+    # default placeholders of the removal steps run with `mode="mask"`
+    PLACEHOLDERS = {
+        "digits": "<NUMBER>",
+        "hashtags": "<HASHTAG>",
+        "mentions": "<MENTION>",
+        "phone_numbers": "<PHONE>",
+        "urls": "<URL>",
+    }
+
     BULLETS = {
         f"^{RegexString.BULLETS}": "",
         f"(?<=\s){RegexString.BULLETS}": ". ",
@@ -141,6 +220,57 @@ class RegexReplacement:
             "\u200b": " ",
     }
     
+    # look-alike punctuation of CJK texts and typography that Unicode compatibility folding leaves as it is
+    FULLWIDTH_PUNCT = {
+            "、": ",",
+            "。": ".",
+            "〃": '"',
+            "「": '"',
+            "」": '"',
+            "『": '"',
+            "』": '"',
+            "〝": '"',
+            "〞": '"',
+            "〟": '"',
+            "《": '"',
+            "》": '"',
+            "«": '"',
+            "»": '"',
+            "〈": "<",
+            "〉": ">",
+            "【": "(",
+            "】": ")",
+            "〔": "(",
+            "〕": ")",
+            "〖": "(",
+            "〗": ")",
+            "〘": "(",
+            "〙": ")",
+            "〚": "(",
+            "〛": ")",
+            "〜": "~",
+            "〰": "~",
+            "・": "·",
+            "‧": "·",
+            "‐": "-",
+            "‑": "-",
+            "‒": "-",
+            "–": "-",
+            "—": "-",
+            "―": "-",
+            "−": "-",
+            "‘": "'",
+            "’": "'",
+            "‚": "'",
+            "‛": "'",
+            "“": '"',
+            "”": '"',
+            "„": '"',
+            "‟": '"',
+            "′": "'",
+            "″": '"',
+    }
+
     SLASHES = {
         "general": {
             f"(?<=\d)\/(?=({RegexString.UNITS}))": " per ",
@@ -205,3 +335,233 @@ class RegexReplacement:
         "(?<=\s)se ": "se", 
         " nya(?![a-z\-])": "nya"
     }
+
+    SLANGS = {
+        "id": {
+            "yg": "yang",
+            "gk": "tidak",
+            "gak": "tidak",
+            "ga": "tidak",
+            "nggak": "tidak",
+            "ngga": "tidak",
+            "engga": "tidak",
+            "enggak": "tidak",
+            "tdk": "tidak",
+            "bgt": "banget",
+            "bngt": "banget",
+            "krn": "karena",
+            "karna": "karena",
+            "mantul": "mantap betul",
+            "dgn": "dengan",
+            "dg": "dengan",
+            "utk": "untuk",
+            "tp": "tapi",
+            "tpi": "tapi",
+            "sdh": "sudah",
+            "udh": "sudah",
+            "udah": "sudah",
+            "blm": "belum",
+            "sy": "saya",
+            "gw": "saya",
+            "gue": "saya",
+            "kmr": "kamar",
+            "kmar": "kamar",
+            "jg": "juga",
+            "jga": "juga",
+            "lg": "lagi",
+            "lgi": "lagi",
+            "bs": "bisa",
+            "bsa": "bisa",
+            "dri": "dari",
+            "sm": "sama",
+            "aja": "saja",
+            "aj": "saja",
+            "sj": "saja",
+            "bkn": "bukan",
+            "msh": "masih",
+            "masi": "masih",
+            "hrs": "harus",
+            "krg": "kurang",
+            "trs": "terus",
+            "trus": "terus",
+            "bnyk": "banyak",
+            "byk": "banyak",
+            "org": "orang",
+            "sgt": "sangat",
+            "bgs": "bagus",
+            "bgus": "bagus",
+            "dpt": "dapat",
+            "dapet": "dapat",
+            "pke": "pakai",
+            "pake": "pakai",
+            "gmn": "bagaimana",
+            "gimana": "bagaimana",
+            "knp": "kenapa",
+            "kalo": "kalau",
+            "klo": "kalau",
+            "trims": "terima kasih",
+            "makasih": "terima kasih",
+            "mksh": "terima kasih",
+            "tq": "terima kasih",
+            "mnt": "menit",
+            "tgl": "tanggal",
+            "thn": "tahun",
+            "bln": "bulan",
+            "jt": "juta",
+            "deket": "dekat",
+            "dket": "dekat",
+            "bener": "benar",
+            "bnr": "benar",
+            "emg": "memang",
+            "emang": "memang",
+            "dikit": "sedikit",
+            "sdikit": "sedikit",
+            "sblm": "sebelum",
+            "stlh": "setelah",
+            "spt": "seperti",
+            "kyk": "seperti",
+            "kayak": "seperti",
+            "cuma": "hanya",
+            "bikin": "membuat",
+            "gede": "besar",
+            "ortu": "orang tua",
+            "gpp": "tidak apa-apa",
+            "gak papa": "tidak apa-apa",
+            "ga papa": "tidak apa-apa",
+            "nggak papa": "tidak apa-apa",
+            "gk papa": "tidak apa-apa",
+            "ga ada": "tidak ada",
+            "gak ada": "tidak ada",
+        },
+        "en": {
+            "u": "you",
+            "ur": "your",
+            "pls": "please",
+            "plz": "please",
+            "thx": "thanks",
+            "tks": "thanks",
+            "btw": "by the way",
+            "idk": "I do not know",
+            "omg": "oh my god",
+            "b4": "before",
+            "gr8": "great",
+            "asap": "as soon as possible",
+            "bc": "because",
+            "cuz": "because",
+            "abt": "about",
+            "ppl": "people",
+            "tho": "though",
+            "rly": "really",
+            "recs": "recommendations",
+        },
+    }
+
+    # usual form of the acronyms, brands and places of hotel reviews, restored by tiketnlphub.preprocessing.truecase.truecase
+    TRUECASE = {
+        "general": {
+            "ac": "AC",
+            "tv": "TV",
+            "wifi": "WiFi",
+            "atm": "ATM",
+            "usd": "USD",
+            "idr": "IDR",
+            "rp": "Rp",
+            "covid": "COVID",
+            "indonesia": "Indonesia",
+            "jakarta": "Jakarta",
+            "bali": "Bali",
+            "bandung": "Bandung",
+            "surabaya": "Surabaya",
+            "yogyakarta": "Yogyakarta",
+            "jogja": "Jogja",
+            "lombok": "Lombok",
+            "ubud": "Ubud",
+            "kuta": "Kuta",
+            "seminyak": "Seminyak",
+        },
+        "id": {
+            "wib": "WIB",
+            "wita": "WITA",
+            "wit": "WIT",
+        },
+        "en": {
+            # the word `I` of `I'm` or `I've` as well, words do not span apostrophes
+            "i": "I",
+            "monday": "Monday",
+            "tuesday": "Tuesday",
+            "wednesday": "Wednesday",
+            "thursday": "Thursday",
+            "friday": "Friday",
+            "saturday": "Saturday",
+            "sunday": "Sunday",
+        },
+    }
+
+    # ISO 4217 codes of the currency symbols and words of prices, see tiketnlphub.feature_extraction.prices. `rm` is left out, it is also short for room
+    CURRENCIES = {
+        "rp": "IDR",
+        "rp.": "IDR",
+        "idr": "IDR",
+        "rupiah": "IDR",
+        "$": "USD",
+        "us$": "USD",
+        "usd": "USD",
+        "dollar": "USD",
+        "dollars": "USD",
+        "s$": "SGD",
+        "sgd": "SGD",
+        "myr": "MYR",
+        "ringgit": "MYR",
+        "€": "EUR",
+        "eur": "EUR",
+        "euro": "EUR",
+        "euros": "EUR",
+        "£": "GBP",
+        "gbp": "GBP",
+        "¥": "JPY",
+        "jpy": "JPY",
+        "yen": "JPY",
+    }
+
+    PRICE_MULTIPLIERS = {
+        "k": 1e3,
+        "rb": 1e3,
+        "rbu": 1e3,
+        "ribu": 1e3,
+        "jt": 1e6,
+        "jta": 1e6,
+        "juta": 1e6,
+    }
+
+    # canonical units of the prices per unit (Rp. 252,000/night, 500rb semalam, $50 a night)
+    PRICE_UNITS = {
+        "night": "night",
+        "nite": "night",
+        "malam": "night",
+        "mlm": "night",
+        "day": "day",
+        "hari": "day",
+        "pax": "person",
+        "person": "person",
+        "orang": "person",
+        "org": "person",
+        "room": "room",
+        "kamar": "room",
+        "kmr": "room",
+    }
+
+    # month names and abbreviations, Indonesian and English
+    MONTHS = {
+        "jan": 1, "januari": 1, "january": 1,
+        "feb": 2, "peb": 2, "februari": 2, "pebruari": 2, "february": 2,
+        "mar": 3, "maret": 3, "march": 3,
+        "apr": 4, "april": 4,
+        "mei": 5, "may": 5,
+        "jun": 6, "juni": 6, "june": 6,
+        "jul": 7, "juli": 7, "july": 7,
+        "agu": 8, "agt": 8, "ags": 8, "agus": 8, "agustus": 8, "aug": 8, "august": 8,
+        "sep": 9, "sept": 9, "september": 9,
+        "okt": 10, "oktober": 10, "oct": 10, "october": 10,
+        "nov": 11, "nopember": 11, "november": 11,
+        "des": 12, "desember": 12, "dec": 12, "december": 12,
+    }
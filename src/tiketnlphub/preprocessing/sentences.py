@@ -0,0 +1,208 @@
+from array import array
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Tuple
+import re
+
+from .re_pattern import RegexString
+
+
+# text index, start and end of every sentence of a batch, see `SentenceSplitter.spans_batch`
+_SPAN = "Q"
+
+# a list item marker: 1. 2) - • *
+_BULLET = r"\d+[.)]|[-•*]"
+
+
+def _compile_boundaries(abbreviations: frozenset, newlines: bool) -> "re.Pattern":
+    # a single dot ends a sentence unless it follows an abbreviation, or a one or two digits number bullet (1. close to the airport 2. good food).
+    # Each exception is a fixed width lookbehind evaluated only once a dot is matched
+    exceptions = "".join(f"(?<!\\b(?i:{re.escape(word)})\\.)" for word in sorted(abbreviations))
+    # a number at the start of the text or of a line, or after a colon, is a bullet. Within a line (nilai 9. Recommended) it is one only when a lowercase word follows it
+    bullets = (
+        r"(?<!^\d\.)(?<![\n:]\d\.)(?<!:\s\d\.)(?<!^\d\d\.)(?<![\n:]\d\d\.)(?<!:\s\d\d\.)"
+        r"(?:(?<!\s\d\.)(?<!\s\d\d\.)|(?=\s+[^\s\w]*[A-Z]))"
+    )
+    closers = RegexString.SENTENCE_CLOSERS
+    punctuation = (
+        # a question or exclamation mark, with the punctuations after it (?!, !!!, ?...)
+        r"[?!][.?!…]*"
+        # an ellipsis only when a capitalized word, a number or the end of the text follows, `bagus... tapi` goes on
+        rf"|(?:\.\.+|…)[.?!…]*(?={closers}(?:\s+[^\s\w]*[A-Z0-9]|\s*\Z))"
+        rf"|\.(?<![.…]\.){exceptions}{bullets}"
+    )
+    # the bullet marker starting the next sentence is part of the boundary, so its own dot is never taken for the end of a sentence
+    pattern = rf"((?:{punctuation}){closers})(?:\s+(?:({_BULLET})\s+)?|\Z)"
+    if newlines:
+        # the alternatives start with a definite character, so the regex engine skips ahead to the candidate characters
+        pattern += r"|[^\S\n]+\n\s*|\n\s*"
+
+    return re.compile(pattern)
+
+
+class SentenceSplitter:
+    """
+    A rule based sentence splitter for reviews, returning the `(start, end)` spans of the sentences of a text so no substring is copied until it is requested.
+
+    A sentence ends with a punctuation (`.`, `?`, `!`, `…` and their runs, with the closing quotes and brackets after them) followed by a white space or the end of the text, or with a line break. It does not end with:
+    - the dot of an abbreviation such as `Rp.`, `Jl.`, `No.` or `Mr.` (tiketnlphub.preprocessing.re_pattern.RegexString.ABBREVIATIONS, case-insensitive),
+    - the dot of a decimal number or a time (`4.5`, `14.00`), never followed by a white space,
+    - the dot of a number bullet (`1. close to the airport 2. good food`): a one or two digits number at the start of the text or of a line, after a colon or after the end of a sentence (`Oke. 1. Dekat bandara`), or followed by a lowercase word,
+    - an ellipsis followed by a lowercase word (`bagus... tapi mahal`).
+
+    The boundaries of a whole text are found by a single compiled regex, whose exceptions are lookbehinds evaluated only at dots, and sentences are stripped of their surrounding white spaces.
+
+    Example
+    -------
+    >>> from tiketnlphub.preprocessing.sentences import SentenceSplitter
+    >>> splitter = SentenceSplitter()
+    >>> text = "Hotel di Jl. Sudirman No. 5, harga Rp. 450.000/malam. Kamar bersih... tapi AC rusak! Overall 4.5/5"
+    >>> splitter.spans(text)
+    [(0, 53), (54, 84), (85, 98)]
+    >>> splitter.split(text)
+    ['Hotel di Jl. Sudirman No. 5, harga Rp. 450.000/malam.', 'Kamar bersih... tapi AC rusak!', 'Overall 4.5/5']
+
+    Parameters
+    ----------
+    abbreviations: iterable
+        Additional words whose dot does not end a sentence, with or without the dot. Default is `None`, the built-in ones only.
+
+    newlines: bool
+        Whether a line break ends a sentence too. Default is `True`.
+    """
+
+    def __init__(self, abbreviations: Iterable[str] = None, newlines: bool = True):
+        self.abbreviations = RegexString.ABBREVIATIONS.union(word.lower().rstrip(".") for word in abbreviations or ())
+        self.newlines = newlines
+        self._boundaries = _compile_boundaries(self.abbreviations, newlines)
+
+    def iter_spans(self, text: str) -> Iterator[Tuple[int, int]]:
+        """
+        Lazily find the `(start, end)` spans of the sentences of a text, `text[start:end]` being a sentence.
+        """
+        start = len(text) - len(text.lstrip())
+        for match in self._boundaries.finditer(text, start):
+            # the punctuation ending the sentence, or the line break right after it
+            end = match.end(1)
+            if end < 0:
+                end = match.start()
+            if end > start:
+                yield start, end
+            # a bullet marker after the boundary starts the next sentence
+            start = match.start(2) if match.start(2) >= 0 else match.end()
+
+        end = len(text.rstrip())
+        if end > start:
+            yield start, end
+
+    def spans(self, text: str) -> List[Tuple[int, int]]:
+        """
+        The `(start, end)` spans of the sentences of a text.
+        """
+        return list(self.iter_spans(text))
+
+    def split(self, text: str) -> List[str]:
+        """
+        The sentences of a text.
+        """
+        return [text[start:end] for start, end in self.iter_spans(text)]
+
+    def iter_split(self, texts: Iterable[str]) -> Iterator[List[str]]:
+        """
+        Lazily split a stream of texts, yielding the list of sentences of every text.
+        """
+        for text in texts:
+            yield self.split(text)
+
+    def spans_batch(self, texts: Iterable[str]) -> Tuple[array, array, array]:
+        """
+        The spans of the sentences of a batch of texts as three flat arrays, instead of millions of tuples.
+
+        Parameters
+        ----------
+        texts: list
+            The texts to split.
+
+        Returns
+        -------
+        spans: tuple
+            The index of the text, the start and the end of every sentence, as `array('Q')`. Sentence `i` is `texts[index[i]][start[i]:end[i]]`.
+        """
+        indices, starts, ends = array(_SPAN), array(_SPAN), array(_SPAN)
+        for index, text in enumerate(texts):
+            for start, end in self.iter_spans(text):
+                indices.append(index)
+                starts.append(start)
+                ends.append(end)
+
+        return indices, starts, ends
+
+    def __repr__(self) -> str:
+        return f"SentenceSplitter({len(self.abbreviations)} abbreviations, newlines={self.newlines})"
+
+
+@lru_cache(maxsize=None)
+def get_sentence_splitter() -> SentenceSplitter:
+    """
+    Get the shared default sentence splitter, whose regex is compiled once.
+    """
+    return SentenceSplitter()
+
+
+def sentence_spans(text: str) -> List[Tuple[int, int]]:
+    """
+    The `(start, end)` spans of the sentences of the input text, see tiketnlphub.preprocessing.sentences.SentenceSplitter.
+
+    Example
+    -------
+    >>> from tiketnlphub.preprocessing.sentences import sentence_spans
+    >>> sentence_spans("Lokasi strategis. Harga Rp. 300rb sudah termasuk sarapan")
+    [(0, 17), (18, 56)]
+
+    Parameters
+    ----------
+    text: str
+        The text to split.
+
+    Returns
+    -------
+    spans: list
+        The `(start, end)` span of every sentence, `text[start:end]` being a sentence.
+    """
+    return get_sentence_splitter().spans(text)
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    Split the input text into sentences, see tiketnlphub.preprocessing.sentences.SentenceSplitter.
+
+    Example
+    -------
+    >>> from tiketnlphub.preprocessing.sentences import split_sentences
+    >>> split_sentences("Kamar bersih... tapi kecil. Staf ramah!! Sarapan jam 7.30 s/d 10.00")
+    ['Kamar bersih... tapi kecil.', 'Staf ramah!!', 'Sarapan jam 7.30 s/d 10.00']
+
+    Parameters
+    ----------
+    text: str
+        The text to split.
+
+    Returns
+    -------
+    sentences: list
+        The sentences of the text, stripped of their surrounding white spaces.
+    """
+    return get_sentence_splitter().split(text)
+
+
+def iter_sentences(texts: Iterable[str]) -> Iterator[List[str]]:
+    """
+    Generator variant of `split_sentences`, lazily yielding the sentences of every text of a stream.
+    """
+    return get_sentence_splitter().iter_split(texts)
+
+
+def sentence_spans_batch(texts: Iterable[str]) -> Tuple[array, array, array]:
+    """
+    Batch variant of `sentence_spans`, returning the text index, start and end of every sentence of a batch as three flat arrays, see `SentenceSplitter.spans_batch`.
+    """
+    return get_sentence_splitter().spans_batch(texts)
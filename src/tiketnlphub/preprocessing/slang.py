@@ -0,0 +1,260 @@
+from typing import Dict, Iterator, List, Tuple
+import json
+import string
+
+from .lookup import PackedTable
+
+
+# punctuation stripped from both ends of a token before the dictionary lookup, and put back around the replacement
+EDGE_PUNCTUATIONS = string.punctuation
+
+
+def _case_variants(key: str, value: str) -> Iterator[Tuple[str, str]]:
+    # the capitalized variant comes last, so a single letter key such as `U` is capitalized rather than uppercased.
+    # Keys without cased characters (e.g. `b4` uppercased is not `b4`, but `2` is `2`) keep their value as-is
+    yield key, value
+    for variant, replacement in ((key.upper(), value.upper()), (key[:1].upper() + key[1:], value[:1].upper() + value[1:])):
+        if variant != key:
+            yield variant, replacement
+
+
+class SlangDictionary:
+    """
+    A dictionary of informal spellings (slangs, abbreviations, typos) and their normalized form, applied to a list of tokens in a single pass.
+
+    Entries are matched on the lowercase, uppercase or capitalized form of a token, stripped from its leading and trailing punctuation, and the replacement gets the same case (`yg`, `YG` and `Yg` become `yang`, `YANG` and `Yang`).
+    Every case variant of an entry is stored in one lookup table, so the tokens without punctuation are all looked up with a single C level `map` call and only the tokens with punctuation go through Python code.
+    Keys may span several tokens (e.g. `gak papa`), the longest entry starting at a token wins. The stripped punctuation is put back around the replacement, a replacement of several words is split into several tokens and an empty replacement deletes the token.
+
+    A large dictionary can be packed into a read-only `tiketnlphub.preprocessing.lookup.PackedTable` (see `to_table`, `save` and `open`), so the processes of a pool attach to one copy of it living in shared memory or in a memory-mapped file instead of holding their own.
+
+    Example
+    -------
+    >>> from tiketnlphub.preprocessing.slang import SlangDictionary
+    >>> slangs = SlangDictionary({"yg": "yang", "bgt": "banget", "gak papa": "tidak apa-apa"})
+    >>> slangs.normalize("Kamarnya bersih BGT, yg lain gak papa!")
+    Kamarnya bersih BANGET, yang lain tidak apa-apa!
+
+    Parameters
+    ----------
+    mapping: dict
+        The informal spellings and their normalized form. Default is `None`, an empty dictionary.
+    """
+
+    def __init__(self, mapping: Dict[str, str] = None):
+        self.multi = {}
+        self.max_length = 1
+        self._lookup = {}
+        self._heads = set()
+        if mapping:
+            self.update(mapping)
+
+    @classmethod
+    def from_file(cls, path: str, sep: str = None) -> "SlangDictionary":
+        """
+        Load a dictionary from a JSON object file, or from a text file with one `slang<sep>replacement` entry per line.
+        Files written by `save` are memory-mapped instead, see `open`.
+
+        The whole file is read and split at once, so files of hundreds of thousands of entries load in a fraction of a second. Empty lines and lines starting with `#` are skipped.
+
+        Parameters
+        ----------
+        path: str
+            The path of the `.json`, `.csv` or tab separated (any other extension) file.
+
+        sep: str
+            The separator between a slang and its replacement. Default is `None`, a comma for `.csv` files and a tab otherwise.
+
+        Returns
+        -------
+        dictionary: SlangDictionary
+            The loaded dictionary.
+        """
+        if PackedTable.is_packed(path):
+            return cls.open(path)
+
+        with open(path, encoding="utf-8") as f:
+            if path.endswith(".json"):
+                return cls(json.load(f))
+            lines = f.read().splitlines()
+
+        if sep is None:
+            sep = "," if path.endswith(".csv") else "\t"
+
+        entries = [line.split(sep, 1) for line in lines if line and not line.startswith("#")]
+        invalid = [entry[0] for entry in entries if len(entry) != 2]
+        if invalid:
+            raise ValueError(f"Invalid slang entries in '{path}', expected 'slang{sep}replacement': {', '.join(map(repr, invalid[:5]))}")
+
+        return cls(dict(entries))
+
+    def update(self, mapping: Dict[str, str]):
+        """
+        Add entries to the dictionary, replacing the existing entries with the same key.
+        """
+        if isinstance(self._lookup, PackedTable):
+            raise TypeError("A dictionary backed by a packed table is read-only")
+
+        for key, value in mapping.items():
+            words = key.lower().split()
+            if not words:
+                continue
+            key, value = " ".join(words), " ".join(value.split())
+            if len(words) == 1:
+                self._lookup.update(_case_variants(key, value))
+            else:
+                self.multi[tuple(words)] = value
+                self._heads.update(head for head, _ in _case_variants(words[0], ""))
+                self.max_length = max(self.max_length, len(words))
+
+    def items(self) -> Iterator[Tuple[str, str]]:
+        """
+        Iterate over the `(slang, replacement)` entries, multi-token slangs being joined with a single space.
+        """
+        # the lowercase variant of a single token entry is the entry itself
+        for key, value in self._lookup.items():
+            if key == key.lower():
+                yield key, value
+        for words, value in self.multi.items():
+            yield " ".join(words), value
+
+    def to_table(self) -> PackedTable:
+        """
+        Pack the dictionary into a read-only table, see `from_table`.
+
+        The case variants of the single token entries are packed as they are looked up, and the multi-token entries travel in the metadata of the table.
+
+        Example
+        -------
+        >>> from tiketnlphub.preprocessing.slang import SlangDictionary
+        >>> table = SlangDictionary({"yg": "yang", "gak papa": "tidak apa-apa"}).to_table().to_shared_memory()
+        >>> slangs = SlangDictionary.from_table(table)  # pickles as the name of the shared memory block
+        >>> slangs.normalize("Yg penting gak papa")
+        Yang penting tidak apa-apa
+        >>> table.unlink()
+
+        Returns
+        -------
+        table: tiketnlphub.preprocessing.lookup.PackedTable
+            The packed dictionary, held in process memory until it is saved or moved to shared memory.
+        """
+        multi = [[" ".join(words), value] for words, value in self.multi.items()]
+
+        return PackedTable.from_mapping(self._lookup, metadata={"slangs": {"multi": multi}})
+
+    @classmethod
+    def from_table(cls, table: PackedTable) -> "SlangDictionary":
+        """
+        Build a read-only dictionary backed by a table packed by `to_table`. The table is used in place, not copied.
+        """
+        dictionary = cls()
+        dictionary.update(dict(table.metadata.get("slangs", {}).get("multi", [])))
+        dictionary._lookup = table
+
+        return dictionary
+
+    def save(self, path: str):
+        """
+        Save the dictionary as a packed table file, to be memory-mapped with `open`.
+        """
+        self.to_table().save(path)
+
+    @classmethod
+    def open(cls, path: str) -> "SlangDictionary":
+        """
+        Memory-map a dictionary file written by `save`. Every process opening the same file shares its pages, and the dictionary pickles as its path.
+        """
+        return cls.from_table(PackedTable.open(path))
+
+    def normalize_tokens(self, tokens: List[str]) -> List[str]:
+        """
+        Normalize the informal spellings of a list of tokens.
+
+        Parameters
+        ----------
+        tokens: list
+            The tokens, without whitespace.
+
+        Returns
+        -------
+        tokens: list
+            The normalized tokens.
+        """
+        # multi-word and empty replacements are split into tokens or dropped here
+        return " ".join(self._replace(tokens)).split()
+
+    def normalize(self, text: str) -> str:
+        """
+        Normalize the informal spellings of a text split on whitespace, the tokens are joined back with a single space.
+        """
+        return " ".join(filter(None, self._replace(text.split())))
+
+    def _replace(self, tokens: List[str]) -> List[str]:
+        # the replacement of every token, possibly empty or made of several words
+        lookup, heads = self._lookup, self._heads
+        pieces = list(map(lookup.get, tokens, tokens))
+        # only the tokens with punctuation and the possible starts of multi-token entries go through the Python loop below
+        candidates = [position for position, token in enumerate(tokens) if not token.isalnum() or token in heads]
+
+        end = 0
+        for position in candidates:
+            if position < end:
+                # already consumed by a multi-token entry
+                continue
+            token = tokens[position]
+            if heads and token.lstrip(EDGE_PUNCTUATIONS) in heads:
+                end = self._match(tokens, position, pieces)
+                if end > position:
+                    continue
+            end = position + 1
+            core = token.strip(EDGE_PUNCTUATIONS)
+            replacement = lookup.get(core) if core != token else None
+            if replacement is not None:
+                start = token.find(core)
+                pieces[position] = token[:start] + replacement + token[start + len(core):]
+
+        return pieces
+
+    def _match(self, tokens: List[str], position: int, pieces: List[str]) -> int:
+        # replace the longest multi-token entry starting at `position` and return the position right after it,
+        # only the first token may have leading and the last token trailing punctuation
+        first = tokens[position].lstrip(EDGE_PUNCTUATIONS)
+        words = [first.lower()]
+        for token in tokens[position + 1:position + self.max_length]:
+            word = token.lower()
+            words.append(word.rstrip(EDGE_PUNCTUATIONS))
+            if word.strip(EDGE_PUNCTUATIONS) != word:
+                # nothing can match past a token with punctuation
+                break
+
+        for length in range(len(words), 1, -1):
+            replacement = self.multi.get(tuple(words[:length]))
+            if replacement is not None:
+                break
+        else:
+            return position
+
+        end = position + length
+        if len(first) > 1 and first.isupper():
+            replacement = replacement.upper()
+        elif first[:1].isupper():
+            replacement = replacement[:1].upper() + replacement[1:]
+        last = tokens[end - 1]
+        prefix = tokens[position][:len(tokens[position]) - len(first)]
+        pieces[position] = prefix + replacement + last[len(last.rstrip(EDGE_PUNCTUATIONS)):]
+        pieces[position + 1:end] = [""] * (length - 1)
+
+        return end
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.items())
+
+    def __contains__(self, key: str) -> bool:
+        words = key.lower().split()
+        if len(words) == 1:
+            return words[0] in self._lookup
+
+        return tuple(words) in self.multi
+
+    def __repr__(self) -> str:
+        return f"SlangDictionary({len(self)} entries)"
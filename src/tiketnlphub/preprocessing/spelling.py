@@ -0,0 +1,482 @@
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+from .lookup import PackedTable, file_signature
+from .slang import EDGE_PUNCTUATIONS
+
+
+def _deletes(word: str, max_distance: int) -> Iterator[Tuple[str, int]]:
+    # every distinct string obtained by deleting up to `max_distance` characters of a word, with the number of deleted characters, fewest first
+    seen = {word}
+    level = [word]
+    for distance in range(1, max_distance + 1):
+        following = []
+        for current in level:
+            for position in range(len(current)):
+                deleted = current[:position] + current[position + 1:]
+                if deleted not in seen:
+                    seen.add(deleted)
+                    following.append(deleted)
+                    yield deleted, distance
+        level = following
+
+
+def _distance(source: str, target: str, max_distance: int) -> int:
+    # the optimal string alignment distance (Damerau-Levenshtein without editing a substring twice), or `max_distance + 1` as soon as it is known to be larger
+    if abs(len(source) - len(target)) > max_distance:
+        return max_distance + 1
+
+    previous2, previous = None, list(range(len(target) + 1))
+    for i, char in enumerate(source, 1):
+        current = [i]
+        for j, other in enumerate(target, 1):
+            cost = current[j - 1] + 1
+            if previous[j] + 1 < cost:
+                cost = previous[j] + 1
+            if previous[j - 1] + (char != other) < cost:
+                cost = previous[j - 1] + (char != other)
+            if i > 1 and j > 1 and char == target[j - 2] and source[i - 2] == other and previous2[j - 2] + 1 < cost:
+                cost = previous2[j - 2] + 1
+            current.append(cost)
+        # a transposition reaches back two rows, so both rows must be past the bound
+        if min(current) > max_distance and min(previous) > max_distance:
+            return max_distance + 1
+        previous2, previous = previous, current
+
+    return min(previous[-1], max_distance + 1)
+
+
+def build_index(frequencies: Mapping[str, int], max_distance: int = 2, prefix_length: int = 7) -> Dict[str, str]:
+    """
+    Build the symmetric delete index of a frequency dictionary, to be packed into a `tiketnlphub.preprocessing.lookup.PackedTable`.
+
+    Every key is a word or a deletion of up to `max_distance` characters of the first `prefix_length` characters of a word. Its value is the frequency of the key as a word (`0` when it is not one)
+    followed by the words it is a deletion of, most frequent first, separated by single spaces: `{"kamar": "9000", "kmar": "0 kamar", ...}`.
+    A key and its candidates thus come with one lookup, and a word is known when its own frequency is positive.
+
+    Parameters
+    ----------
+    frequencies: dict
+        The lowercase words and their frequency.
+
+    max_distance: int
+        The maximum edit distance of a correction. Default is `2`.
+
+    prefix_length: int
+        The number of leading characters of a word whose deletions are indexed. Default is `7`.
+
+    Returns
+    -------
+    index: dict
+        The index, as a string to string mapping.
+    """
+    counts = {}
+    candidates = {}
+    for word, count in frequencies.items():
+        word = word.lower()
+        if not word or any(char.isspace() for char in word) or int(count) <= 0:
+            continue
+        counts[word] = counts.get(word, 0) + int(count)
+
+    # the words are indexed most frequent first, so the candidates of every key come out sorted
+    for word in sorted(counts, key=lambda word: (-counts[word], word)):
+        prefix = word[:prefix_length]
+        if prefix != word:
+            candidates.setdefault(prefix, []).append(word)
+        for deleted, _ in _deletes(prefix, max_distance):
+            candidates.setdefault(deleted, []).append(word)
+
+    index = {word: str(count) for word, count in counts.items()}
+    for key, words in candidates.items():
+        index[key] = f"{counts.get(key, 0)} {' '.join(words)}"
+
+    return index
+
+
+class SpellingCorrector:
+    """
+    A spelling corrector for typos (`bersi`, `kamr`, `breakfats`) based on the symmetric delete algorithm of SymSpell, using a frequency dictionary of correctly spelled words.
+
+    Instead of generating every edit of a token, the deletions of every dictionary word are indexed ahead of time (see `build_index`), so correcting a token only looks up its own deletions and
+    computes the edit distance of the few words they point to. The closest word wins, then the most frequent one. The edit distance counts insertions, deletions, substitutions and transpositions of adjacent characters.
+    Only the first `prefix_length` characters of the words are indexed, which keeps the index small without missing corrections of long words, their typos being spread over their whole length.
+
+    The index is packed into a read-only `tiketnlphub.preprocessing.lookup.PackedTable` (see `save` and `open`), a compact buffer that can be memory-mapped or moved to shared memory, so the processes of a pool share one copy of it.
+    Reviews repeat the same typos over and over, so corrections are memoized in a bounded cache and `correct_batch` corrects every distinct out-of-vocabulary token of a batch once.
+
+    Tokens are corrected lowercase, without their surrounding punctuation, and the correction gets the case of the token. Known words, tokens shorter than `min_length` and tokens with non-letters are kept as they are, as are tokens without any correction within `max_distance`.
+
+    Example
+    -------
+    >>> from tiketnlphub.preprocessing.spelling import SpellingCorrector
+    >>> corrector = SpellingCorrector({"kamar": 900, "bersih": 700, "breakfast": 300, "dan": 2000, "enak": 500})
+    >>> corrector.correct("Kamr bersi dan breakfats enak!")
+    Kamar bersih dan breakfast enak!
+
+    Parameters
+    ----------
+    frequencies: dict
+        The correctly spelled words and their frequency in a reference corpus. Default is `None`, an empty dictionary.
+
+    max_distance: int
+        The maximum edit distance of a correction. Default is `2`.
+
+    prefix_length: int
+        The number of leading characters of a word whose deletions are indexed. Default is `7`.
+
+    min_length: int
+        The minimum length of a corrected token, shorter tokens are too ambiguous. Default is `3`.
+
+    cache_size: int
+        The maximum number of memoized corrections, the cache is emptied once it holds more. Default is `65536`.
+    """
+
+    def __init__(self, frequencies: Mapping[str, int] = None, max_distance: int = 2, prefix_length: int = 7, min_length: int = 3, cache_size: int = 65536):
+        self._configure(max_distance, prefix_length, min_length, cache_size)
+        metadata = {"spelling": {"max_distance": max_distance, "prefix_length": prefix_length}}
+        self._index = PackedTable.from_mapping(build_index(frequencies or {}, max_distance, prefix_length), metadata=metadata, cache_size=cache_size)
+
+    def _configure(self, max_distance: int, prefix_length: int, min_length: int, cache_size: int):
+        if max_distance < 0 or prefix_length <= max_distance:
+            raise ValueError(f"Expected 0 <= max_distance < prefix_length, got max_distance={max_distance} and prefix_length={prefix_length}")
+
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.min_length = min_length
+        self.cache_size = cache_size
+        # the correction of every memoized token
+        self._corrections = {}
+
+    @classmethod
+    def from_file(cls, path: str, sep: str = None, **kwargs) -> "SpellingCorrector":
+        """
+        Load a corrector from a frequency dictionary file with one `word<sep>count` entry per line, the count defaulting to 1. Index files written by `save` are memory-mapped instead, see `open`.
+        An index keeps the `max_distance` and `prefix_length` it was built with, passing other values raises a `ValueError`.
+
+        Empty lines and lines starting with `#` are skipped.
+
+        Parameters
+        ----------
+        path: str
+            The path of the frequency dictionary.
+
+        sep: str
+            The separator between a word and its count. Default is `None`, any white space.
+
+        Returns
+        -------
+        corrector: SpellingCorrector
+            The loaded corrector.
+        """
+        if PackedTable.is_packed(path):
+            corrector = cls.open(path, min_length=kwargs.get("min_length", 3), cache_size=kwargs.get("cache_size", 65536))
+            for name in ("max_distance", "prefix_length"):
+                if kwargs.get(name, getattr(corrector, name)) != getattr(corrector, name):
+                    raise ValueError(f"The index '{path}' was built with {name}={getattr(corrector, name)}, got {name}={kwargs[name]}")
+            return corrector
+
+        with open(path, encoding="utf-8") as f:
+            entries = [line.split(sep) for line in f.read().splitlines() if line.strip() and not line.startswith("#")]
+
+        invalid = [entry[0] for entry in entries if len(entry) > 2 or (len(entry) == 2 and not entry[1].strip().isdigit())]
+        if invalid:
+            raise ValueError(f"Invalid frequency entries in '{path}', expected 'word{sep or ' '}count': {', '.join(map(repr, invalid[:5]))}")
+
+        frequencies = {}
+        for entry in entries:
+            word = entry[0].strip().lower()
+            frequencies[word] = frequencies.get(word, 0) + (int(entry[1]) if len(entry) == 2 else 1)
+
+        return cls(frequencies, **kwargs)
+
+    @classmethod
+    def from_table(cls, table: PackedTable, min_length: int = 3) -> "SpellingCorrector":
+        """
+        Build a corrector backed by an index packed by `build_index`, such as `to_table` returns. The table is used in place, not copied.
+        """
+        settings = table.metadata.get("spelling")
+        if settings is None:
+            raise ValueError("Not a spelling index table")
+
+        # no index is built only to be replaced
+        corrector = cls.__new__(cls)
+        corrector._configure(settings["max_distance"], settings["prefix_length"], min_length, table.cache_size)
+        corrector._index = table
+
+        return corrector
+
+    def to_table(self) -> PackedTable:
+        """
+        The packed index of the corrector, held in process memory until it is saved or moved to shared memory, see `from_table`.
+        """
+        return self._index
+
+    def save(self, path: str):
+        """
+        Save the index as a packed table file, to be memory-mapped with `open`.
+        """
+        self._index.save(path)
+
+    @classmethod
+    def open(cls, path: str, min_length: int = 3, cache_size: int = 65536) -> "SpellingCorrector":
+        """
+        Memory-map an index file written by `save`. Every process opening the same file shares its pages, and the corrector pickles as its path.
+        """
+        return cls.from_table(PackedTable.open(path, cache_size=cache_size), min_length=min_length)
+
+    def frequency(self, word: str) -> int:
+        """
+        The frequency of a lowercase word, `0` when it is not in the dictionary.
+        """
+        entry = self._index.get(word)
+        return int(entry.split(" ", 1)[0]) if entry else 0
+
+    def lookup(self, word: str) -> Optional[Tuple[str, int, int]]:
+        """
+        Find the best correction of a lowercase word.
+
+        Parameters
+        ----------
+        word: str
+            The word to correct.
+
+        Returns
+        -------
+        suggestion: tuple
+            The closest and then most frequent dictionary word with its edit distance and frequency, as `(word, distance, frequency)`, or `None` when no word is within `max_distance`.
+            A known word is its own suggestion, at distance 0.
+        """
+        get, max_distance = self._index.get, self.max_distance
+        entry = get(word)
+        if entry is not None and not entry.startswith("0 "):
+            return word, 0, int(entry.split(" ", 1)[0])
+
+        best, best_distance, best_count = None, max_distance, 0
+        prefix = word[:self.prefix_length]
+        seen = {word}
+        deletes = chain([(prefix, 0)], _deletes(prefix, max_distance))
+        for key, deleted in deletes:
+            # deleting more characters than the best distance can not give a closer word
+            if deleted > best_distance:
+                break
+            entry = get(key) if key != word else entry
+            if entry is None:
+                continue
+            count, *words = entry.split(" ")
+            if count != "0":
+                words.append(key)
+            for candidate in words:
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                distance = _distance(word, candidate, best_distance)
+                if distance > best_distance:
+                    continue
+                count = self.frequency(candidate)
+                if best is None or distance < best_distance or count > best_count or (count == best_count and candidate < best):
+                    best, best_distance, best_count = candidate, distance, count
+
+        return (best, best_distance, best_count) if best is not None else None
+
+    def correct_token(self, token: str) -> str:
+        """
+        Correct a single whitespace free token, keeping its surrounding punctuation and its case.
+        """
+        correction = self._corrections.get(token)
+        if correction is not None:
+            return correction
+
+        if len(self._corrections) > self.cache_size:
+            self._corrections.clear()
+        correction = self._corrections[token] = self._correct(token)
+
+        return correction
+
+    def _correct(self, token: str) -> str:
+        core = token.strip(EDGE_PUNCTUATIONS)
+        if len(core) < self.min_length or not core.isalpha():
+            return token
+
+        lowered = core.lower()
+        suggestion = self.lookup(lowered)
+        if suggestion is None or suggestion[0] == lowered:
+            return token
+
+        replacement = suggestion[0]
+        if len(core) > 1 and core.isupper():
+            replacement = replacement.upper()
+        elif core[0].isupper():
+            replacement = replacement[0].upper() + replacement[1:]
+        start = token.find(core)
+
+        return token[:start] + replacement + token[start + len(core):]
+
+    def correct_tokens(self, tokens: List[str]) -> List[str]:
+        """
+        Correct a list of tokens.
+        """
+        return list(map(self.correct_token, tokens))
+
+    def correct(self, text: str) -> str:
+        """
+        Correct the tokens of a text split on whitespace, the tokens are joined back with a single space.
+        """
+        return " ".join(map(self.correct_token, text.split()))
+
+    def correct_batch(self, texts: Iterable[str]) -> List[str]:
+        """
+        Correct the whitespace separated tokens of a batch of texts, the tokens are joined with a single space.
+
+        The distinct tokens of the batch are checked once, only the out-of-vocabulary ones are looked up in the index, and every token is then replaced with a single dictionary lookup.
+
+        Parameters
+        ----------
+        texts: list
+            The texts to correct.
+
+        Returns
+        -------
+        texts: list
+            The corrected texts.
+        """
+        tokenized = [text.split() for text in texts]
+        vocabulary = set(chain.from_iterable(tokenized))
+        corrections = dict(zip(vocabulary, map(self.correct_token, vocabulary))).__getitem__
+
+        return [" ".join(map(corrections, tokens)) for tokens in tokenized]
+
+    def __contains__(self, word: str) -> bool:
+        return self.frequency(word.lower()) > 0
+
+    def __repr__(self) -> str:
+        return f"SpellingCorrector({len(self._index)} index entries, {self._index.nbytes} bytes, max_distance={self.max_distance}, prefix_length={self.prefix_length})"
+
+
+# the correctors of the dictionaries given as mappings, keyed by the identity of the mapping, and the last loaded corrector of every file
+_BUILT_CORRECTORS = {}
+
+_CORRECTOR_FILES = {}
+
+_CORRECTOR_CACHE_SIZE = 8
+
+
+@lru_cache(maxsize=_CORRECTOR_CACHE_SIZE)
+def load_spelling_corrector(path: str, max_distance: int = None, signature: Optional[Tuple[int, int]] = None) -> SpellingCorrector:
+    """
+    Load (or fetch from the cache) the corrector of a frequency dictionary file or of an index file written by `SpellingCorrector.save`, see `SpellingCorrector.from_file`.
+
+    `max_distance` defaults to `2` for a frequency dictionary, an index file is memory-mapped and keeps the `max_distance` it was built with.
+    The `signature` of the file (see `tiketnlphub.preprocessing.lookup.file_signature`) is only part of the cache key, so that a rewritten file is loaded again.
+    """
+    return SpellingCorrector.from_file(path, **({} if max_distance is None else {"max_distance": max_distance}))
+
+
+def get_spelling_corrector(dictionary: Union[str, Mapping[str, int], SpellingCorrector], max_distance: int = None) -> SpellingCorrector:
+    """
+    Get the corrector of a frequency dictionary, given as a `word: count` mapping or as the path of a frequency dictionary or index file. A `SpellingCorrector` is used as is.
+
+    Build the corrector once and pass it to the per-text functions (`correct_spelling`, `correct_spelling_tokens`, `correct_spelling_batch`) as `dictionary`.
+    A file is checked for changes on every call, and loaded again when its size or modification time changed. A mapping is indexed once and cached by identity, do not update it in place afterwards.
+    `max_distance` defaults to `2`, or to the value an index file was built with.
+    """
+    if isinstance(dictionary, SpellingCorrector):
+        return dictionary
+    if isinstance(dictionary, str):
+        corrector = load_spelling_corrector(dictionary, max_distance, file_signature(dictionary))
+        _cache_corrector(_CORRECTOR_FILES, (dictionary, max_distance), corrector)
+        return corrector
+
+    key = (id(dictionary), max_distance)
+    cached = _BUILT_CORRECTORS.get(key)
+    # the mapping is kept along, so its id is not reused by another mapping while it is cached
+    if cached is None or cached[0] is not dictionary:
+        corrector = SpellingCorrector(dictionary, max_distance=2 if max_distance is None else max_distance)
+        cached = _cache_corrector(_BUILT_CORRECTORS, key, (dictionary, corrector))
+
+    return cached[1]
+
+
+def _cache_corrector(cache: dict, key: tuple, value):
+    if key not in cache and len(cache) >= _CORRECTOR_CACHE_SIZE:
+        cache.clear()
+    cache[key] = value
+
+    return value
+
+
+def _resolve_spelling_corrector(dictionary: Union[str, Mapping[str, int], SpellingCorrector], max_distance: int = None) -> SpellingCorrector:
+    # the per-text functions read a file once, `get_spelling_corrector` checks it again
+    if isinstance(dictionary, str):
+        corrector = _CORRECTOR_FILES.get((dictionary, max_distance))
+        if corrector is not None:
+            return corrector
+
+    return get_spelling_corrector(dictionary, max_distance)
+
+
+def correct_spelling(text: str, dictionary: Union[str, Mapping[str, int], SpellingCorrector], max_distance: int = None) -> str:
+    """
+    Correct the typos of the input text (e.g. bersi, kamr, breakfats) with the closest and most frequent word of a frequency dictionary, see tiketnlphub.preprocessing.spelling.SpellingCorrector.
+
+    Unlike tiketnlphub.preprocessing.cleaner.remove_repeated_chars, which collapses elongations (bagusss), any misspelling within `max_distance` edits is corrected. The tokens are joined with a single space.
+
+    Example
+    -------
+    >>> from tiketnlphub.preprocessing.spelling import correct_spelling
+    >>> text = correct_spelling("Kamr bersi, breakfats enak", {"kamar": 900, "bersih": 700, "breakfast": 300, "enak": 500})
+    >>> text
+    Kamar bersih, breakfast enak
+
+    Parameters
+    ----------
+    text: str
+        The text whose typos are to be corrected.
+
+    dictionary: dict or str
+        The correctly spelled words and their frequency, a tiketnlphub.preprocessing.spelling.SpellingCorrector, or the path of a `word count` per line file or of an index file written by tiketnlphub.preprocessing.spelling.SpellingCorrector.save.
+        Files are loaded and indexed once per process, call `get_spelling_corrector` to load a file again after a change. To correct many texts, build the corrector once with `get_spelling_corrector` and pass it instead.
+
+    max_distance: int
+        The maximum edit distance of a correction. Default is `None`, `2` or the value an index file was built with.
+
+    Returns
+    -------
+    text: str
+        The input text with its typos corrected.
+    """
+    return _resolve_spelling_corrector(dictionary, max_distance).correct(text)
+
+
+def correct_spelling_tokens(tokens: List[str], dictionary: Union[str, Mapping[str, int], SpellingCorrector], max_distance: int = None) -> List[str]:
+    """
+    Token-level variant of `correct_spelling`, working on the tokens of `text.split()`.
+
+    Parameters
+    ----------
+    tokens: list
+        The whitespace separated tokens of the text.
+
+    Returns
+    -------
+    tokens: list
+        The corrected tokens.
+    """
+    return _resolve_spelling_corrector(dictionary, max_distance).correct_tokens(tokens)
+
+
+def correct_spelling_batch(texts: Iterable[str], dictionary: Union[str, Mapping[str, int], SpellingCorrector], max_distance: int = None) -> List[str]:
+    """
+    Batch variant of `correct_spelling`, correcting every distinct out-of-vocabulary token of the batch once.
+
+    Parameters
+    ----------
+    texts: list
+        The texts whose typos are to be corrected.
+
+    Returns
+    -------
+    texts: list
+        The input texts with their typos corrected.
+    """
+    return _resolve_spelling_corrector(dictionary, max_distance).correct_batch(texts)
@@ -0,0 +1,284 @@
+from functools import lru_cache
+from itertools import chain
+from typing import Iterable, List, Tuple
+
+
+# inflectional suffixes, removed first: particles, then possessive pronouns
+PARTICLES = ("kah", "lah", "tah", "pun")
+
+POSSESSIVES = ("ku", "mu", "nya")
+
+# derivational suffixes. `-i` is only removed together with a prefix (e.g. me-i, di-i) and after a consonant, too many roots end with an `i` (pakai, sampai)
+SUFFIXES = ("kan", "an", "i")
+
+# first order prefixes, longest first, with the letters the nasal prefixes may have replaced (meN- + pakai = memakai).
+# The first alternative is the default, the others are tried against the known roots
+FIRST_PREFIXES = (
+    ("meng", ("", "k", "ng")),
+    ("meny", ("s", "ny")),
+    ("men", ("t", "n")),
+    ("mem", ("p", "m")),
+    ("me", ("",)),
+    ("peng", ("", "k", "ng")),
+    ("peny", ("s", "ny")),
+    ("pen", ("t", "n")),
+    ("pem", ("p", "m")),
+    ("di", ("",)),
+    ("ter", ("",)),
+    ("ke", ("",)),
+    ("se", ("",)),
+)
+
+# second order prefixes, `be-` only before a consonant followed by `er` (bekerja, beternak)
+SECOND_PREFIXES = ("ber", "per", "be", "pe")
+
+# variants of the second order prefixes, only removed when they leave a known root: `ber-` and `per-` drop their `r`
+# before a root starting with it (berenang) and become `bel-` and `pel-` before `ajar` (belajar, pelajaran)
+SECOND_PREFIX_VARIANTS = (("ber", ("", "r")), ("per", ("", "r")), ("bel", ("",)), ("pel", ("",)))
+
+VOWELS = "aiueo"
+
+# frequent review words that look affixed but are roots, or whose stripping gives another word, and frequent roots whose
+# first letter a nasal prefix replaces (menikmati, mengatakan). They are known roots of every stemmer
+EXCEPTIONS = frozenset("""
+    pelajar sebelah setelah sekolah masalah seperti selalu selesai sekitar segera sarapan pertama mereka ketika kemarin
+    kembali keluarga kereta kecewa sendiri sedikit sebentar sekarang semalam pemandian perempuan pengantin keliling kemudian
+    kata kenal kira kirim kunjung makan masak milik minta minum naik nikmat nilai punya suka selamat lumayan ada ajar renang
+""".split())
+
+
+def _syllables(word: str) -> int:
+    return sum(map(word.count, VOWELS))
+
+
+def _acceptable(stem: str, min_length: int = 4) -> bool:
+    # a stem keeps at least 4 letters and 2 syllables, so `makan` is not stripped to `mak` nor `dingin` to `ngin`
+    return len(stem) >= min_length and _syllables(stem) >= 2
+
+
+def _remove_suffix(word: str, suffixes: Tuple[str, ...], known: frozenset, min_length: int = 4) -> str:
+    # a suffix leaving a known root wins, otherwise the first one leaving an acceptable stem
+    for suffix in suffixes:
+        if word.endswith(suffix) and word[:-len(suffix)] in known:
+            return word[:-len(suffix)]
+    for suffix in suffixes:
+        if word.endswith(suffix) and _acceptable(word[:-len(suffix)], min_length) and not (suffix == "i" and word[-2] in VOWELS):
+            return word[:-len(suffix)]
+
+    return word
+
+
+class IndonesianStemmer:
+    """
+    A rule based Indonesian stemmer, removing inflectional suffixes (-lah, -kah, -pun, -ku, -mu, -nya), derivational suffixes (-kan, -an, -i) and prefixes (meN-, peN-, di-, ter-, ke-, se-, ber-, per-) with their confixes (ke-an, per-an, me-kan, di-i, ...).
+
+    It follows the affix removal order of the Tala stemmer and needs no dictionary: an affix is removed only when what is left has at least 4 letters and 2 syllables, and frequent words that only look affixed are listed as exceptions.
+    Stripping stops as soon as a known root (an exception or one of `roots`) is reached. The letter replaced by a nasal prefix is recovered with a default rule (menulis becomes tulis, memakai becomes pakai), or by the alternative that gives a known root (menikmati becomes nikmat once `nikmat` is a root).
+    Tokens are stemmed lowercase. Reduplicated tokens (anak-anak, berlari-lari) give the stem of their halves when both halves have the same stem, other tokens with non-letters are returned unchanged.
+
+    Reviews are made of a small vocabulary repeated over and over, so stems are memoized in a bounded per-stemmer cache and `stem_batch` stems every distinct token of a batch once.
+
+    Example
+    -------
+    >>> from tiketnlphub.preprocessing.stemmer import IndonesianStemmer
+    >>> stemmer = IndonesianStemmer()
+    >>> stemmer.stem_tokens(["Pelayanannya", "sangat", "memuaskan", "dan", "kamarnya", "bersih"])
+    ['layan', 'sangat', 'puas', 'dan', 'kamar', 'bersih']
+
+    Parameters
+    ----------
+    roots: iterable
+        Known root words. Default is `None`, rules only.
+
+    exceptions: iterable
+        Words never stemmed, on top of the built-in ones. Like `roots`, they also stop the stripping of longer words. Default is `None`.
+
+    cache_size: int
+        The maximum number of memoized stems. Default is `65536`, `0` disables the cache.
+    """
+
+    def __init__(self, roots: Iterable[str] = None, exceptions: Iterable[str] = None, cache_size: int = 65536):
+        self.roots = frozenset(word.lower() for word in roots or ())
+        self.exceptions = EXCEPTIONS.union(word.lower() for word in exceptions or ())
+        self._known = self.roots | self.exceptions
+        self.cache_size = cache_size
+        if cache_size:
+            self.stem = lru_cache(maxsize=cache_size)(self._stem)
+
+    def stem(self, word: str) -> str:
+        """
+        Stem a single token.
+        """
+        return self._stem(word)
+
+    def stem_tokens(self, tokens: List[str]) -> List[str]:
+        """
+        Stem a list of tokens.
+        """
+        return list(map(self.stem, tokens))
+
+    def stem_batch(self, texts: Iterable[str]) -> List[str]:
+        """
+        Stem the whitespace separated tokens of a batch of texts, the tokens are joined with a single space.
+
+        The distinct tokens of the batch are stemmed once, every token is then replaced with a single dictionary lookup.
+
+        Parameters
+        ----------
+        texts: list
+            The texts to stem.
+
+        Returns
+        -------
+        texts: list
+            The stemmed texts.
+        """
+        tokenized = [text.split() for text in texts]
+        vocabulary = set(chain.from_iterable(tokenized))
+        stems = dict(zip(vocabulary, map(self.stem, vocabulary))).__getitem__
+
+        return [" ".join(map(stems, tokens)) for tokens in tokenized]
+
+    def _stem(self, word: str) -> str:
+        lowered = word.lower()
+        if lowered.isalpha():
+            return self._strip(lowered)
+
+        halves = lowered.split("-")
+        if len(halves) == 2 and halves[0].isalpha() and halves[1].isalpha():
+            # the second half of a reduplication may carry the suffixes (sayur-sayuran) and the first the prefix (berlari-lari)
+            first, second = self._strip(halves[0]), self._strip(halves[1])
+            return first if first == second else f"{first}-{second}"
+
+        return word
+
+    def _strip(self, word: str) -> str:
+        known = self._known
+        if word in known:
+            return word
+
+        # particles leave at least 5 letters, too many roots end with `lah` or `kah` (sebelah, menikah)
+        for suffixes, min_length in ((PARTICLES, 5), (POSSESSIVES, 4)):
+            word = _remove_suffix(word, suffixes, known, min_length)
+            if word in known:
+                return word
+
+        for prefix, replacements in FIRST_PREFIXES:
+            if word.startswith(prefix) and _acceptable(word[len(prefix):]):
+                rest = word[len(prefix):]
+                # a vowel after a nasal prefix means the first letter of the root was replaced by it
+                if rest[0] not in VOWELS:
+                    replacements = ("",)
+                candidates = [self._strip_confix(replacement + rest) for replacement in replacements]
+                for stem in candidates:
+                    if stem in known:
+                        return stem
+                return candidates[0]
+
+        stripped = self._remove_second_prefix(word)
+        if stripped != word:
+            return stripped if stripped in known else _remove_suffix(stripped, SUFFIXES, known)
+
+        return _remove_suffix(word, SUFFIXES[:-1], known)
+
+    def _strip_confix(self, word: str) -> str:
+        # what is left once a first order prefix is removed: a derivational suffix, then a second order prefix
+        if word in self._known:
+            return word
+        word = _remove_suffix(word, SUFFIXES, self._known)
+        if word in self._known:
+            return word
+
+        return self._remove_second_prefix(word)
+
+    def _remove_second_prefix(self, word: str) -> str:
+        known = self._known
+        for prefix, replacements in SECOND_PREFIX_VARIANTS:
+            if not word.startswith(prefix):
+                continue
+            for replacement in replacements:
+                rest = replacement + word[len(prefix):]
+                if rest in known or _remove_suffix(rest, SUFFIXES, known) in known:
+                    return rest
+
+        for prefix in SECOND_PREFIXES:
+            if not word.startswith(prefix):
+                continue
+            rest = word[len(prefix):]
+            if prefix == "be" and (rest[:1] in VOWELS or rest[1:3] != "er"):
+                continue
+            if _acceptable(rest):
+                return rest
+
+        return word
+
+    def __repr__(self) -> str:
+        return f"IndonesianStemmer({len(self.roots)} roots, {len(self.exceptions)} exceptions, cache_size={self.cache_size})"
+
+
+@lru_cache(maxsize=None)
+def get_stemmer() -> IndonesianStemmer:
+    """
+    Get the shared default stemmer, whose cache is reused by every call of `stem_words`.
+    """
+    return IndonesianStemmer()
+
+
+def stem_words(text: str) -> str:
+    """
+    Stem the Indonesian words of the input text, see tiketnlphub.preprocessing.stemmer.IndonesianStemmer.
+
+    Words and reduplications (sayur-sayuran) are lowercased, other tokens (digits, punctuation attached) are kept as they are, and the tokens are joined with a single space. Remove or split the punctuations first.
+
+    Example
+    -------
+    >>> from tiketnlphub.preprocessing.stemmer import stem_words
+    >>> text = stem_words("Kebersihan kamarnya kurang, tetapi pelayanannya memuaskan")
+    >>> text
+    bersih kamar kurang, tetapi layan puas
+
+    Parameters
+    ----------
+    text: str
+        The text whose words are to be stemmed.
+
+    Returns
+    -------
+    text: str
+        The input text with all words stemmed.
+    """
+    return " ".join(get_stemmer().stem_tokens(text.split()))
+
+
+def stem_words_tokens(tokens: List[str]) -> List[str]:
+    """
+    Token-level variant of `stem_words`, working on the tokens of `text.split()`.
+
+    Parameters
+    ----------
+    tokens: list
+        The whitespace separated tokens of the text.
+
+    Returns
+    -------
+    tokens: list
+        The stemmed tokens.
+    """
+    return get_stemmer().stem_tokens(tokens)
+
+
+def stem_words_batch(texts: Iterable[str]) -> List[str]:
+    """
+    Batch variant of `stem_words`, stemming every distinct token of the batch once.
+
+    Parameters
+    ----------
+    texts: list
+        The texts whose words are to be stemmed.
+
+    Returns
+    -------
+    texts: list
+        The input texts with all words stemmed.
+    """
+    return get_stemmer().stem_batch(texts)
@@ -0,0 +1,299 @@
+from functools import lru_cache
+from itertools import groupby
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+import re
+
+from .re_pattern import RegexReplacement, RegexString
+
+
+_DAY = r"(?:3[01]|[12]\d|0?[1-9])"
+
+_MONTH = r"(?:1[0-2]|0?[1-9])"
+
+_HOUR = r"(?:2[0-3]|[01]?\d)"
+
+_HOUR_12 = r"(?:1[0-2]|0?[1-9])"
+
+_MINUTE = r"[0-5]\d"
+
+_ORDINAL = r"(?:st|nd|rd|th)?"
+
+_WORD_END = r"(?![a-z])"
+
+# not followed by more digits nor by a decimal part, `14.30` is not the start of `14.300`
+_NUMBER_END = r"(?!\d|[.,:]\d)"
+
+_DIGITS = re.compile(r"\d+")
+
+_LETTERS = re.compile(r"[a-z]+")
+
+# the last day of every month, of a leap year when the year is unknown
+_MONTH_DAYS = (31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _alternation(words: Iterable[str]) -> str:
+    # longest first, so `agustus` wins over `agu`
+    return "|".join(map(re.escape, sorted(words, key=len, reverse=True)))
+
+
+def _lookbehinds(words: Iterable[str], suffix: str) -> str:
+    # a lookbehind has a fixed width, so one per length of the words
+    return "|".join(rf"(?<=(?<![a-z])(?:{_alternation(group)}){suffix})" for _, group in groupby(sorted(words, key=len), key=len))
+
+
+def _formats(months: str) -> Tuple[str, ...]:
+    # the regex of every format, named after it
+    zones = RegexString.TIME_ZONES
+    # `may` is a modal verb too (you may 5 times): a date only capitalized, or followed by an ordinal or a year
+    month_words = [word for word in RegexReplacement.MONTHS if word != "may"]
+    month_before = (
+        _lookbehinds(month_words, r"\s") + "|" + _lookbehinds(month_words, r"\.\s")
+        + rf"|(?<=(?<![a-z])(?-i:May|MAY)\s)|(?<=(?<![a-z])may\s)(?={_DAY}(?:st|nd|rd|th|,?\s\d{{4}}))"
+    )
+    cue_before = _lookbehinds(RegexString.TIME_CUES.split("|"), r"\s")
+
+    return (
+        # 2023-08-17
+        rf"(?P<iso_date>\d{{4}}-{_MONTH}-{_DAY})(?!\d)",
+        # 17/08/2023, 17-08-23, 17.08.2023
+        rf"(?P<numeric_date>{_DAY}(?P<separator>[/.-]){_MONTH}(?P=separator)(?:\d{{4}}|\d\d))(?!\d)",
+        # 17 Agustus 2023, 17 Aug, 17th August
+        rf"(?P<day_month_date>{_DAY}{_ORDINAL}\s(?:{months})\.?(?:\s\d{{4}}(?!\d))?){_WORD_END}",
+        # Aug 17, 2023, May 5th, Agustus 17: the month before the day is found again after the match, see `TimeDateRecognizer.recognize`
+        rf"(?:{month_before})(?P<month_day_date>{_DAY}{_ORDINAL}(?:,?\s\d{{4}})?)(?![\da-z])",
+        # 2pm, 6:00 am, 9.30 p.m.
+        rf"(?P<am_pm>{_HOUR_12}(?:[.:]{_MINUTE})?\s?(?:{RegexString.AM_PM})){_WORD_END}",
+        # 14:30, 14:30 WIB
+        rf"(?P<clock>{_HOUR}:{_MINUTE}{_NUMBER_END}(?:\s?(?:{zones}){_WORD_END})?)",
+        # 14.30 WIB, a dotted time without a zone or a cue is too often a rating or a decimal number
+        rf"(?P<zoned>{_HOUR}\.{_MINUTE}\s?(?:{zones})){_WORD_END}",
+        # jam 3 sore, pukul 14.30, jam 7
+        rf"(?:{cue_before})(?P<cued>{_HOUR}(?:[.:]{_MINUTE})?{_NUMBER_END}(?:\s(?:{RegexString.DAY_PERIODS}|{zones}){_WORD_END})?)",
+        # at 14.30
+        rf"(?<=(?<![a-z])at\s)(?P<dotted>{_HOUR}\.{_MINUTE}{_NUMBER_END})",
+    )
+
+
+def _compile_temporal() -> Tuple["re.Pattern", "re.Pattern"]:
+    months = _alternation(RegexReplacement.MONTHS)
+    # every format is an alternative of a single regex, whose name is the last group of a match
+    formats = "|".join(_formats(months))
+    # an expression starts a number, `1.250.000` holds no time nor date
+    pattern = re.compile(rf"(?<![\w.,:/])(?:{formats})", re.IGNORECASE)
+    # searched right before a month_day_date, up to its day
+    month = re.compile(rf"(?<![a-z])(?:{months})\.?\s\Z", re.IGNORECASE)
+
+    return pattern, month
+
+
+def _time(hour: int, minute: int, zone: str = None) -> str:
+    return f"{hour:02d}.{minute:02d} {zone.upper()}" if zone else f"{hour:02d}.{minute:02d}"
+
+
+def _date(year: Optional[int], month: int, day: int) -> Optional[str]:
+    if day > _MONTH_DAYS[month - 1] or (year is not None and month == 2 and day == 29 and (year % 4 or (year % 100 == 0 and year % 400))):
+        return None
+
+    # ISO 8601 leaves the unknown year out
+    return f"{year:04d}-{month:02d}-{day:02d}" if year is not None else f"--{month:02d}-{day:02d}"
+
+
+def _day_period(hour: int, period: str) -> int:
+    # jam 3 sore is 15.00, jam 11 siang is 11.00 but jam 1 siang is 13.00, jam 9 malam is 21.00 but jam 2 malam is 02.00
+    if hour > 12:
+        return hour
+    if period == "pagi":
+        return hour % 12
+    if period == "siang":
+        return hour + 12 if hour < 11 else hour
+    if period == "sore":
+        return hour + 12 if hour < 12 else hour
+
+    return hour + 12 if 6 <= hour < 12 else hour % 12
+
+
+class TimeDate(NamedTuple):
+    """
+    A time or a date found in a text: its kind (`time` or `date`), its canonical value (`14.30`, `14.30 WIB`, `2023-08-17`, or `--08-17` when the year is unknown) and the `(start, end)` span of the expression in the text.
+    """
+
+    kind: str
+    value: str
+    span: Tuple[int, int]
+
+
+class TimeDateRecognizer:
+    """
+    Recognizes the times and dates of reviews, Indonesian and English, and normalizes them into a canonical form:
+    - times become 24 hours `HH.MM`, the format of tiketnlphub.preprocessing.cleaner.handle_time_format, followed by their time zone if any: `6:00 am` and `jam 6 pagi` become `06.00`, `2pm` and `jam 2 siang` become `14.00`, `14.30 WIB` stays `14.30 WIB`,
+    - dates become ISO 8601 `YYYY-MM-DD`, or `--MM-DD` without a year: `17/08/2023`, `17 Agustus 2023` and `Aug 17, 2023` become `2023-08-17`, `17 Agt` becomes `--08-17`.
+
+    A dotted time (`14.30`) is only recognized with a time zone or after a cue word (`jam`, `pukul`, `pkl`, `at`), a bare hour only after `jam`, `pukul` or `pkl`, so ratings, prices and durations (`4.50`, `Rp. 14.500`, `3 malam`) are left alone.
+    Every format is an alternative of a single compiled regex, so a text is scanned once whatever the number of formats, and the canonical value of every distinct expression is memoized in a bounded cache.
+
+    Example
+    -------
+    >>> from tiketnlphub.preprocessing.temporal import TimeDateRecognizer
+    >>> recognizer = TimeDateRecognizer()
+    >>> recognizer.normalize("Check-in 2pm tapi kamar baru siap jam 3 sore, tgl 17 Agustus 2023")
+    Check-in 14.00 tapi kamar baru siap jam 15.00, tgl 2023-08-17
+    >>> recognizer.recognize("Sarapan sampai 10:30 WIB")
+    [TimeDate(kind='time', value='10.30 WIB', span=(15, 24))]
+
+    Parameters
+    ----------
+    cache_size: int
+        The maximum number of memoized expressions, the cache is emptied once it holds more. Default is `65536`.
+    """
+
+    def __init__(self, cache_size: int = 65536):
+        self.cache_size = cache_size
+        self._pattern, self._month_before = _compile_temporal()
+        self._month_length = max(map(len, RegexReplacement.MONTHS)) + 2
+        # the kind and canonical value of every memoized expression, `None` for the impossible dates
+        self._parsed = {}
+
+    def _parse(self, format: str, expression: str) -> Optional[Tuple[str, str]]:
+        numbers = list(map(int, _DIGITS.findall(expression)))
+        words = _LETTERS.findall(expression.lower())
+        if format == "iso_date":
+            value = _date(numbers[0], numbers[1], numbers[2])
+        elif format == "numeric_date":
+            year = numbers[2] + 2000 if numbers[2] < 100 else numbers[2]
+            value = _date(year, numbers[1], numbers[0])
+        elif format in ("day_month_date", "month_day_date"):
+            month = next(filter(RegexReplacement.MONTHS.__contains__, words))
+            value = _date(numbers[1] if len(numbers) > 1 else None, RegexReplacement.MONTHS[month], numbers[0])
+        elif format == "am_pm":
+            value = _time(numbers[0] % 12 + (12 if words[0][0] == "p" else 0), numbers[1] if len(numbers) > 1 else 0)
+        else:
+            hour, minute = numbers[0], numbers[1] if len(numbers) > 1 else 0
+            zone = None
+            if words and words[0] in RegexString.DAY_PERIODS.split("|"):
+                hour = _day_period(hour, words[0])
+            elif words:
+                zone = words[0]
+            value = _time(hour, minute, zone)
+
+        parsed = None if value is None else ("date" if format.endswith("date") else "time", value)
+        self._parsed[format, expression] = parsed
+
+        return parsed
+
+    def recognize(self, text: str) -> List[TimeDate]:
+        """
+        Recognize the times and dates of a text.
+
+        Parameters
+        ----------
+        text: str
+            The text to recognize the times and dates of.
+
+        Returns
+        -------
+        expressions: list
+            The times and dates of the text, in order.
+        """
+        if len(self._parsed) > self.cache_size:
+            self._parsed.clear()
+
+        expressions = []
+        for match in self._pattern.finditer(text):
+            format = match.lastgroup
+            start, end = match.span()
+            if format == "month_day_date":
+                start = self._month_before.search(text, max(start - self._month_length, 0), start).start()
+            expression = text[start:end]
+            key = (format, expression)
+            parsed = self._parsed[key] if key in self._parsed else self._parse(format, expression)
+            if parsed is not None:
+                expressions.append(TimeDate(*parsed, (start, end)))
+
+        return expressions
+
+    def normalize(self, text: str) -> str:
+        """
+        Replace the times and dates of a text with their canonical value.
+        """
+        parts = []
+        last = 0
+        for _, value, (start, end) in self.recognize(text):
+            parts.append(text[last:start])
+            parts.append(value)
+            last = end
+        if not parts:
+            return text
+        parts.append(text[last:])
+
+        return "".join(parts)
+
+    def normalize_batch(self, texts: Iterable[str]) -> List[str]:
+        """
+        Normalize the times and dates of a batch of texts.
+        """
+        return list(map(self.normalize, texts))
+
+    def __repr__(self) -> str:
+        return f"TimeDateRecognizer(cache_size={self.cache_size})"
+
+
+@lru_cache(maxsize=None)
+def get_time_date_recognizer() -> TimeDateRecognizer:
+    """
+    Get the shared default recognizer, whose regex is compiled once and whose cache is reused by every call of `normalize_times_dates`.
+    """
+    return TimeDateRecognizer()
+
+
+def normalize_times_dates(text: str) -> str:
+    """
+    Normalize the times and dates of the input text into a canonical form, see tiketnlphub.preprocessing.temporal.TimeDateRecognizer.
+
+    Example
+    -------
+    >>> from tiketnlphub.preprocessing.temporal import normalize_times_dates
+    >>> text = normalize_times_dates("Arrived on Aug 17, 2023 at 6:00 am, check-in jam 14.00 WIB")
+    >>> text
+    Arrived on 2023-08-17 at 06.00, check-in jam 14.00 WIB
+
+    Parameters
+    ----------
+    text: str
+        The text whose times and dates are to be normalized.
+
+    Returns
+    -------
+    text: str
+        The input text with every time as `HH.MM` and every date as `YYYY-MM-DD` (`--MM-DD` without a year).
+    """
+    return get_time_date_recognizer().normalize(text)
+
+
+def normalize_times_dates_batch(texts: Iterable[str]) -> List[str]:
+    """
+    Batch variant of `normalize_times_dates`.
+    """
+    return get_time_date_recognizer().normalize_batch(texts)
+
+
+def recognize_times_dates(text: str) -> List[TimeDate]:
+    """
+    The structured times and dates of the input text, with their canonical value and their span, see tiketnlphub.preprocessing.temporal.TimeDateRecognizer.
+
+    Example
+    -------
+    >>> from tiketnlphub.preprocessing.temporal import recognize_times_dates
+    >>> recognize_times_dates("Menginap 17-08-2023, check-out pukul 12")
+    [TimeDate(kind='date', value='2023-08-17', span=(9, 19)), TimeDate(kind='time', value='12.00', span=(37, 39))]
+
+    Parameters
+    ----------
+    text: str
+        The text to recognize the times and dates of.
+
+    Returns
+    -------
+    expressions: list
+        The times and dates of the text, in order.
+    """
+    return get_time_date_recognizer().recognize(text)
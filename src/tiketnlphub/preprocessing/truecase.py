@@ -0,0 +1,237 @@
+from collections import Counter
+from functools import lru_cache
+from itertools import compress, count, repeat
+from operator import is_, is_not
+from typing import Dict, Iterable, List, Union
+import json
+import re
+
+from .re_pattern import RegexReplacement, RegexString
+
+
+_SENTENCE_WORDS = re.compile(RegexString.SENTENCE_WORDS)
+
+
+def _split_words(text: str) -> tuple:
+    # the words of a text at every third position of `parts`, the sentence boundary before a word (`None` inside a sentence) just before it
+    parts = _SENTENCE_WORDS.split(text)
+
+    return parts, parts[2::3], parts[1::3]
+
+
+class TrueCaser:
+    """
+    Restores the usual case of the words of shouty or carelessly cased texts (`KAMAR DI JAKARTA AC RUSAK` becomes `Kamar di Jakarta AC rusak`) with a precomputed table of the usual form of every word.
+
+    A text is lowercased, split once into words and sentence boundaries, and every word is replaced with its usual form with one C level `map` over the table, without a Python callback per word.
+    Words missing from the table stay lowercase, except the first word of every sentence which is capitalized.
+
+    The table can be given, loaded from a JSON file (see `save` and `from_file`) or counted from a corpus of well cased texts with `fit`.
+
+    Example
+    -------
+    >>> from tiketnlphub.preprocessing.truecase import TrueCaser
+    >>> truecaser = TrueCaser({"jakarta": "Jakarta", "ac": "AC"})
+    >>> truecaser.truecase("KAMAR DI JAKARTA BAGUS. TAPI AC RUSAK!!")
+    Kamar di Jakarta bagus. Tapi AC rusak!!
+
+    Parameters
+    ----------
+    table: dict
+        The usual form of words, keyed by any of their forms. Default is `None`, an empty table.
+    """
+
+    def __init__(self, table: Dict[str, str] = None):
+        self.table = {}
+        if table:
+            self.update(table)
+
+    @classmethod
+    def fit(cls, texts: Iterable[str], min_count: int = 2, min_ratio: float = 0.5) -> "TrueCaser":
+        """
+        Count the forms of every word in a corpus of well cased texts and keep the most frequent one, whenever it is not the lowercase form.
+
+        The first word of a sentence is capitalized whatever its usual form, so it is not counted.
+
+        Parameters
+        ----------
+        texts: iterable
+            The texts to count.
+
+        min_count: int
+            The minimum number of occurrences of a form to be kept. Default is `2`.
+
+        min_ratio: float
+            The minimum share of the occurrences of a word its most frequent form must have, so the words of a few shouty texts do not make it to the table. Default is `0.5`.
+
+        Returns
+        -------
+        truecaser: TrueCaser
+            The truecaser of the counted table.
+        """
+        forms = Counter()
+        for text in texts:
+            _, words, boundaries = _split_words(text)
+            forms.update(compress(words, map(is_, boundaries, repeat(None))))
+
+        totals = Counter()
+        best = {}
+        for form, occurrences in forms.items():
+            word = form.lower()
+            totals[word] += occurrences
+            if occurrences > forms.get(best.get(word), 0):
+                best[word] = form
+
+        return cls({word: form for word, form in best.items() if form != word and forms[form] >= min_count and forms[form] >= min_ratio * totals[word]})
+
+    @classmethod
+    def from_file(cls, path: str) -> "TrueCaser":
+        """
+        Load a table saved by `save`, a JSON object of the usual form of words keyed by their lowercase form.
+        """
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def save(self, path: str):
+        """
+        Save the table as a JSON object.
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.table, f, ensure_ascii=False, indent=0, sort_keys=True)
+
+    def update(self, table: Dict[str, str]):
+        """
+        Add words to the table, replacing the usual form of the words already in it.
+        """
+        self.table.update((word.lower(), form) for word, form in table.items())
+
+    def truecase(self, text: str) -> str:
+        """
+        Truecase a text.
+
+        Parameters
+        ----------
+        text: str
+            The text to truecase.
+
+        Returns
+        -------
+        text: str
+            The truecased text.
+        """
+        parts, words, boundaries = _split_words(text.lower())
+        cased = list(map(self.table.get, words, words))
+        # only the sentence starts left lowercase by the table go through Python code
+        for position in compress(count(), map(is_not, boundaries, repeat(None))):
+            if cased[position] == words[position]:
+                cased[position] = words[position][:1].upper() + words[position][1:]
+        parts[2::3] = cased
+
+        # the boundaries inside sentences are `None`, words are never empty
+        return "".join(filter(None, parts))
+
+    def truecase_batch(self, texts: Iterable[str]) -> List[str]:
+        """
+        Truecase a batch of texts.
+        """
+        return list(map(self.truecase, texts))
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def __contains__(self, word: str) -> bool:
+        return word.lower() in self.table
+
+    def __repr__(self) -> str:
+        return f"TrueCaser({len(self.table)} words)"
+
+
+@lru_cache(maxsize=None)
+def load_truecaser(lang: str = "id", path: str = None) -> TrueCaser:
+    """
+    Build (or fetch from the cache) the truecaser of a language, optionally extended with the table of a JSON file (see `TrueCaser.save`).
+
+    The built-in table is listed in tiketnlphub.preprocessing.re_pattern.RegexReplacement.TRUECASE.
+
+    Parameters
+    ----------
+    lang: str
+        The language of the built-in table, `id` or `en`. Default is `id`.
+
+    path: str
+        The path of a JSON table whose words are added to (and override) the built-in ones. Default is `None`, built-in table only.
+
+    Returns
+    -------
+    truecaser: TrueCaser
+        The truecaser. It is cached, do not update it in place.
+    """
+    truecaser = TrueCaser(RegexReplacement.TRUECASE["general"])
+    truecaser.update(RegexReplacement.TRUECASE.get(lang, {}))
+    if path:
+        truecaser.update(TrueCaser.from_file(path).table)
+
+    return truecaser
+
+
+def get_truecaser(lang: str = "id", additional_words: Union[dict, str] = None) -> TrueCaser:
+    """
+    Get the truecaser of a language extended with additional words, given as a dict or as the path of a JSON table.
+    """
+    if additional_words is None or isinstance(additional_words, str):
+        return load_truecaser(lang, additional_words)
+
+    truecaser = TrueCaser(load_truecaser(lang).table)
+    truecaser.update(additional_words)
+
+    return truecaser
+
+
+def truecase(text: str, lang: str = "id", additional_words: Union[dict, str] = None) -> str:
+    """
+    Restore the usual case of the words of the input text, see tiketnlphub.preprocessing.truecase.TrueCaser.
+
+    The text is lowercased, the acronyms, brands and places of the table get their usual form back and the first word of every sentence is capitalized.
+    Unlike tiketnlphub.preprocessing.cleaner.upper_selected_word, known words such as `AC` or `Jakarta` keep their case.
+
+    Example
+    -------
+    >>> from tiketnlphub.preprocessing.truecase import truecase
+    >>> text = truecase("HOTEL DI JAKARTA INI BAGUS BANGET. AC DINGIN DAN WIFI KENCANG")
+    >>> text
+    Hotel di Jakarta ini bagus banget. AC dingin dan WiFi kencang
+
+    Parameters
+    ----------
+    text: str
+        The text to be truecased.
+
+    lang: str
+        The language of the built-in table, `id` or `en`. Default is `id`.
+
+    additional_words: dict or str
+        Additional words and their usual form, or the path of a JSON table. Default is `None`.
+
+    Returns
+    -------
+    text: str
+        The truecased input text.
+    """
+    return get_truecaser(lang, additional_words).truecase(text)
+
+
+def truecase_batch(texts: Iterable[str], lang: str = "id", additional_words: Union[dict, str] = None) -> List[str]:
+    """
+    Batch variant of `truecase`, resolving the truecaser once for the whole batch.
+
+    Parameters
+    ----------
+    texts: list
+        The texts to be truecased.
+
+    Returns
+    -------
+    texts: list
+        The truecased input texts.
+    """
+    return get_truecaser(lang, additional_words).truecase_batch(texts)
@@ -0,0 +1,15 @@
+import pytest
+
+
+@pytest.fixture
+def feature_patterns():
+    # a pattern found in every review once the rate of its feature is 1
+    return {
+        "urls": r"https?://|www\.",
+        "mentions": r"@\w",
+        "hashtags": r"#\w",
+        "html": r"<|&nbsp;",
+        "prices": r"Rp|IDR|rb|k/night|jt|\$|€",
+        "times": r"\d[.:/]\d|\dpm|sore|\d{4}",
+        "phone_numbers": r"\+62 8\d\d \d{4} \d{4}",
+    }
@@ -0,0 +1,12 @@
+import pytest
+
+
+@pytest.fixture
+def hashing_texts():
+    return [
+        "Kamar bersih, kamar luas",
+        "",
+        "KAMAR   bersih,",
+        "Great location great staff great breakfast",
+        "café 正本 😊",
+    ]
@@ -0,0 +1,12 @@
+import pytest
+
+
+@pytest.fixture
+def ngram_texts():
+    return [
+        "Kamar bersih, kamar luas",
+        "kamar bersih, staf ramah",
+        "",
+        "STAF RAMAH sekali",
+        "café 正本 café",
+    ] * 3
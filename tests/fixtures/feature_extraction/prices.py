@@ -0,0 +1,16 @@
+import pytest
+
+
+@pytest.fixture
+def extract_prices_test_cases():
+    # input text, then the `(amount, currency, per_unit, price string)` of every price
+    return [
+        ("This is a normal text", []),
+        ("Got a promo for Rp. 252,000/night nett", [(252000.0, "IDR", "night", "Rp. 252,000/night")]),
+        ("Harga 1,5jt per malam, biasanya 500rb", [(1500000.0, "IDR", "night", "1,5jt per malam"), (500000.0, "IDR", None, "500rb")]),
+        ("Paid €200 and $50 a night", [(200.0, "EUR", None, "€200"), (50.0, "USD", "night", "$50 a night")]),
+        ("Rp 450.000,- semalam, IDR 1.250.000,50", [(450000.0, "IDR", "night", "Rp 450.000,- semalam"), (1250000.5, "IDR", None, "IDR 1.250.000,50")]),  # Thousands and decimal separators
+        ("Sarapan 50k/pax, parkir 10 ribu rupiah", [(50000.0, "IDR", "person", "50k/pax"), (10000.0, "IDR", None, "10 ribu rupiah")]),
+        ("100 euro per person, S$40/room, US$ 30.5", [(100.0, "EUR", "person", "100 euro per person"), (40.0, "SGD", "room", "S$40/room"), (30.5, "USD", None, "US$ 30.5")]),
+        ("Check-in jam 14.00, 2 orang, 5 kamar, room 203, rm 5", []),  # Numbers without a currency or a multiplier are not prices
+    ]
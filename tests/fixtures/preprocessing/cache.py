@@ -0,0 +1,13 @@
+import pytest
+
+
+@pytest.fixture
+def cache_texts():
+    return [
+        "This is a normal text",
+        "Visit  https://www.example.com/promo  for the deal",
+        "Kolam renang/pantai & sarapan ½ porsi",
+        "正本さんのおかげで素晴らしい滞在ができました. Thank you!",
+        "",
+        "Visit  https://www.example.com/promo  for the deal",
+    ]
@@ -86,6 +86,20 @@ def remove_phone_numbers_test_cases():
     ]
 
 
+@pytest.fixture
+def removal_modes_test_cases():
+    # step, input text, masked text, extracted values
+    return [
+        ("remove_urls", "Visit https://example.com/promo now", "Visit <URL> now", ["https://example.com/promo"]),
+        ("remove_urls", "This is a normal text", "This is a normal text", []),
+        ("remove_mentions", "kudos to @martin and @dewi!", "kudos to <MENTION> and <MENTION>!", ["@martin", "@dewi"]),
+        ("remove_hashtags", "#staycation di #Bali", "<HASHTAG> di <HASHTAG>", ["#staycation", "#Bali"]),
+        ("remove_phone_numbers", "Call +62 812 3456 789 or +1234567890", "Call <PHONE> or <PHONE>", ["+62 812 3456 789", "+1234567890"]),  # White spaces matched after a number are kept after its placeholder
+        ("remove_digits", "2 nights for 1500000", "<NUMBER> nights for <NUMBER>", ["2", "1500000"]),
+        ("remove_digits", "", "", []),
+    ]
+
+
 @pytest.fixture
 def remove_numbering_bullets_test_cases():
     return [
@@ -148,6 +162,26 @@ def remove_white_spaces_test_cases():
     ]
 
 
+@pytest.fixture
+def remove_stopwords_id_test_cases():
+    return [
+        ("Kamar yang saya pesan di lantai 5 tidak ada jendela", "Kamar pesan lantai 5 tidak ada jendela"),
+        ("Yang PALING saya suka adalah sarapannya", "PALING suka sarapannya"),  # Lowercase, uppercase and capitalized stopwords are removed
+        ("YANG bagus ITU kolamnya", "bagus kolamnya"),
+        ("lokasi dekat dengan stasiun, dan   bandara", "lokasi dekat stasiun, bandara"),  # Tokens with punctuation attached are kept
+        ("", ""),
+    ]
+
+
+@pytest.fixture
+def remove_stopwords_en_test_cases():
+    return [
+        ("The room was great but the pool was closed", "room great pool closed"),
+        ("I would NOT stay here again", "NOT stay"),  # Negations are kept
+        ("This is THE best hotel in Bali", "best hotel Bali"),
+    ]
+
+
 @pytest.fixture
 def remove_repeated_chars_test_cases():
     return [
@@ -177,6 +211,19 @@ def remove_repeated_puncts_test_cases():
     ]
 
 
+@pytest.fixture
+def collapse_repeats_test_cases():
+    return [
+        ("This is a normal text", "This is a normal text"),
+        ("Hotelnya bagusss bangettt!!!!! sangat sangat puas.....", "Hotelnya bagus banget! sangat puas."),
+        ("bagusss bagus, kamarnya bersih bersih bersihhh", "bagus, kamarnya bersih"),  # Words repeated once de-elongated
+        ("Harga Rp. 1500000 ok ok???", "Harga Rp. 1500000 ok?"),  # Digits kept, punctuation glued after the collapsed word
+        ("(mantap mantap) the theory", "(mantap) the theory"),  # Only whole words are collapsed
+        ("sepi   sepi\n\n\n\nsepi", "sepi"),  # Any white spaces between repeated words
+        ("wow!?!? wow", "wow? wow"),
+    ]
+
+
 @pytest.fixture
 def split_punct_and_word_test_cases():
     return [
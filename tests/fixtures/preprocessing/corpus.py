@@ -0,0 +1,22 @@
+import pytest
+
+
+@pytest.fixture
+def corpus_lines():
+    lines = [
+        "Hotelnya bagus  bangettt!!! kamar/kolam bersih",
+        "Great stay at #JWMarriott, thanks @budi :)",
+        "",
+        "Harga Rp. 450,000/malam & sarapan ½ porsi",
+        "正本さんのおかげで素晴らしい滞在ができました. Thank you!",
+        "   I  booked this hotel cheaper at            €50   last weekend.   ",
+    ]
+    return [f"{line} {i}" if line else line for i in range(40) for line in lines]
+
+
+@pytest.fixture
+def corpus_file(tmp_path, corpus_lines):
+    path = tmp_path / "reviews.txt"
+    # no trailing newline on the last line on purpose
+    path.write_bytes("\n".join(corpus_lines).encode("utf-8"))
+    return str(path)
@@ -0,0 +1,21 @@
+import pytest
+
+
+@pytest.fixture
+def dedup_texts():
+    return [
+        "Kamar bersih, staf ramah sekali dan sarapan enak!",
+        "Lokasi strategis dekat stasiun, tapi AC kurang dingin",
+        "kamar bersih,  staf ramah sekali dan sarapan enak!!",
+        "Pelayanan check-in lambat, antri hampir satu jam",
+        "Lokasi strategis dekat stasiun, tapi AC kurang dingin.",
+        "Great location, friendly staff, would stay again",
+        "",
+        "Kamar bersih, staf ramah sekali dan sarapan enak!",
+    ]
+
+
+@pytest.fixture
+def dedup_clusters():
+    # the number of the first text of the cluster of every text of `dedup_texts`
+    return [0, 1, 0, 3, 1, 5, 6, 0]
@@ -0,0 +1,15 @@
+import pytest
+
+
+@pytest.fixture
+def lookup_mapping():
+    return {
+        "yg": "yang",
+        "bgt": "banget",
+        "mantul": "mantap betul",
+        "gak papa": "tidak apa-apa",
+        "sih": "",
+        "café": "kafe",
+        "正本": "Masamoto",
+        "😊": ":)",
+    }
@@ -56,6 +56,33 @@ def normalize_punctuations_with_additional_punctuations_test_cases():
     ]
 
 
+@pytest.fixture
+def normalize_fullwidth_chars_test_cases():
+    return [
+        ("This is a normal text", "This is a normal text"),
+        ("ＡＢＣ１２３！？，", "ABC123!?,"),  # Full-width letters, digits and punctuations folded
+        ("ホテルは最高でした！部屋は１２３号室、ＷｉＦｉも速い。", "ホテルは最高でした!部屋は123号室,WiFiも速い."),  # Japanese kept
+        ("ｶﾞｲﾄﾞ ｢ﾎﾃﾙ｣", 'ガイド "ホテル"'),  # Half-width katakana folded and composed
+        ("ﾌﾛﾝﾄ　ｽﾀｯﾌ", "フロント スタッフ"),  # Ideographic space folded
+        ("방이 깨끗해요！ＧＯＯＤ", "방이 깨끗해요!GOOD"),  # Korean kept
+        ("【特价】房间很干净～", '(特价)房间很干净~'),  # Chinese kept, brackets folded
+        ("Привет ＡＢＣ – “x” 😊 café", 'Привет ABC - "x" 😊 café'),  # Other scripts, emojis and accents kept
+        ("Harga ￥５００ «murah»", 'Harga ¥500 "murah"'),  # Full-width currency signs folded
+        ("﹙small﹚ ︐vertical", "(small) ,vertical"),  # Small and vertical forms folded
+    ]
+
+
+@pytest.fixture
+def normalize_fullwidth_chars_with_options_test_cases():
+    return [
+        # (input, additional_chars, punctuations, expected)
+        ("ＯＫ、「ｂａｇｕｓ」", None, False, "OK、「bagus」"),
+        ("ＯＫ、「ｂａｇｕｓ」", {"「": "", "」": ""}, True, "OK,bagus"),
+        ("ok ★★★★ 😊", {"★": "*", "😊": None}, True, "ok **** "),
+        ("plain ascii!", {"!": "."}, True, "plain ascii."),
+    ]
+
+
 @pytest.fixture
 def normalize_remunerations_test_cases():
     return [
@@ -240,3 +267,23 @@ def normalize_split_word_and_num_test_cases():
 
 
 
+
+
+@pytest.fixture
+def normalize_slangs_id_test_cases():
+    return [
+        ("This is a normal text", "This is a normal text"),
+        ("Kamarnya bersih bgt, tp AC gk dingin krn rusak", "Kamarnya bersih banget, tapi AC tidak dingin karena rusak"),
+        ("Stafnya MANTUL", "Stafnya MANTAP BETUL"),
+        ("Gak papa, yg penting dkt bandara", "Tidak apa-apa, yang penting dkt bandara"),
+        ("Makasih   ya", "Terima kasih ya"),
+    ]
+
+
+@pytest.fixture
+def normalize_slangs_en_test_cases():
+    return [
+        ("This is a normal text", "This is a normal text"),
+        ("thx, u r gr8", "thanks, you r great"),
+        ("Pls clean the room asap", "Please clean the room as soon as possible"),
+    ]
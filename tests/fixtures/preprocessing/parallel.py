@@ -0,0 +1,14 @@
+import pytest
+
+
+@pytest.fixture
+def parallel_texts():
+    return [
+        "This is a normal text",
+        "",
+        "Visit  https://www.example.com/promo  for the deal",
+        "Kolam renang/pantai & sarapan ½ porsi\nbaris kedua",
+        "正本さんのおかげで素晴らしい滞在ができました. Thank you! 😊",
+        "   ",
+        "lone surrogate \udcff kept as-is",
+    ] * 7
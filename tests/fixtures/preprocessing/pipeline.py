@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+
+@pytest.fixture
+def pipeline_texts():
+    return [
+        "This is a normal text",
+        "Got a promo for Rp. 252,000/night nett",
+        "Swimming pool/private pool, breakfast ++ & wifi",
+        "Kolam renang/pantai & sarapan ½ porsi",
+        "Harga 500rb/malam +/- 10 menit dari bandara",
+        "Rating ⅘ , price < $50; room > expectation\nwill come again",
+        "   I  booked this hotel cheaper at            €50   last weekend.   ",
+    ]
+
+
+@pytest.fixture
+def pipeline_mixed_language_batch():
+    return (
+        ["Pool/beach ½ price", "Kolam/pantai", "A & B", "A & B"],
+        ["en", "id", "id", "en"],
+        ["Pool or beach half price", "Kolam atau pantai", "A dan B", "A and B"],
+    )
+
+
+@pytest.fixture
+def pipeline_spec():
+    return {
+        "lang": "id",
+        "steps": [
+            "remove_urls",
+            {"name": "remove_emojis_emoticons", "params": {"additional_emoticons": ["=D"]}},
+            {"name": "remove_punctuations", "params": {"punct_to_remove": "#@"}},
+            "normalize_slashes",
+            {"name": "normalize_symbols", "params": {"lang": "en", "additional_symbols": {"Rp.": "IDR"}}},
+            "remove_white_spaces",
+        ],
+    }
+
+
+@pytest.fixture
+def deletion_texts():
+    # adversarial texts where deletions touch each other, plus seeded random mixes of the characters the deletion patterns care about
+    texts = [
+        "Thanks @budi for #JWMarriott2023 call +62 812 3456 7890 or visit https://www.example.com/promo?id=12",
+        "#12 @34 +123456789 www.example.com/#about @#tag #@mention",
+        "h@2& bwwww.+62 812345/@@p",
+        "\n./+62 812345#hps @",
+        "https://www.th#t.--https://www.%",
+        "#::2#+62 812345b+62 812345:+= ",
+    ]
+    rng = random.Random(2024)
+    alphabet = list("#@+1 2ab.w/:ht_ps-?=&%\n") + ["www.", "http://", "https://", "+62 812345", ".com/"]
+    texts += ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 16))) for _ in range(3000)]
+    return texts
@@ -0,0 +1,24 @@
+import pytest
+
+
+@pytest.fixture
+def split_sentences_test_cases():
+    return [
+        ("Kamar bersih. Staf ramah", ["Kamar bersih.", "Staf ramah"]),
+        ("Hotel di Jl. Sudirman No. 12A. Mr. Budi sangat membantu", ["Hotel di Jl. Sudirman No. 12A.", "Mr. Budi sangat membantu"]),  # Abbreviations
+        ("Harga RP. 450.000 per malam. Rating 4.5 dari 5", ["Harga RP. 450.000 per malam.", "Rating 4.5 dari 5"]),  # Decimals and case-insensitive abbreviations
+        ("Check-in jam 14.00. Check-out jam 12.00.", ["Check-in jam 14.00.", "Check-out jam 12.00."]),
+        ("Bagus... tapi mahal... Overall oke", ["Bagus... tapi mahal...", "Overall oke"]),  # Ellipsis before a lowercase word
+        ("Plus: 1. dekat bandara 2. sarapan enak", ["Plus: 1. dekat bandara 2. sarapan enak"]),  # Number bullets
+        ("Kelebihan: 1. Dekat bandara 2. sarapan enak\n3. Parkir luas", ["Kelebihan: 1. Dekat bandara 2. sarapan enak", "3. Parkir luas"]),
+        ("Oke. 1. Dekat bandara. 2) Sarapan enak! - Parkir luas", ["Oke.", "1. Dekat bandara.", "2) Sarapan enak!", "- Parkir luas"]),  # Bullet markers after a sentence end
+        ("Saya kasih nilai 9. Recommended banget", ["Saya kasih nilai 9.", "Recommended banget"]),  # Numbers ending a sentence
+        ("Kami menginap di lantai 12. Kamarnya luas", ["Kami menginap di lantai 12.", "Kamarnya luas"]),
+        ("Rating 5. Mantap!", ["Rating 5.", "Mantap!"]),
+        ("Jl. Sudirman No. 5. Dekat", ["Jl. Sudirman No. 5.", "Dekat"]),
+        ("Serius?! Kamarnya kotor!!! \"Tidak akan kembali.\" (Sangat kecewa.) Oke", ["Serius?!", "Kamarnya kotor!!!", "\"Tidak akan kembali.\"", "(Sangat kecewa.)", "Oke"]),
+        ("Lokasi strategis\nSarapan enak\n\n  Parkir luas  ", ["Lokasi strategis", "Sarapan enak", "Parkir luas"]),  # Line breaks
+        ("www.tiket.com oke", ["www.tiket.com oke"]),
+        ("   ", []),
+        ("", []),
+    ]
@@ -0,0 +1,31 @@
+import pytest
+
+
+@pytest.fixture
+def slang_mapping():
+    return {
+        "yg": "yang",
+        "bgt": "banget",
+        "mantul": "mantap betul",
+        "gak papa": "tidak apa-apa",
+        "gak": "tidak",
+        "sih": "",
+    }
+
+
+@pytest.fixture
+def slang_test_cases():
+    return [
+        ("This is a normal text", "This is a normal text"),
+        ("", ""),
+        ("kamarnya bersih bgt", "kamarnya bersih banget"),  # single token entry
+        ("Yg ini BGT", "Yang ini BANGET"),  # case preserved
+        ("Staf ramah, mantul!", "Staf ramah, mantap betul!"),  # multi-word replacement and punctuation kept
+        ("(yg) bgt...", "(yang) banget..."),  # leading and trailing punctuation kept
+        ("gak papa kok", "tidak apa-apa kok"),  # multi-token entry
+        ("Gak papa, gak masalah", "Tidak apa-apa, tidak masalah"),  # longest entry wins
+        ("gak, papa", "tidak, papa"),  # no multi-token match across punctuation
+        ("bagus sih", "bagus"),  # empty replacement deletes the token
+        ("bagus sih!", "bagus !"),
+        ("yang  bgtbgt   ygg", "yang bgtbgt ygg"),  # whole tokens only
+    ]
@@ -0,0 +1,45 @@
+import pytest
+
+
+@pytest.fixture
+def spelling_frequencies():
+    return {
+        "kamar": 900,
+        "bersih": 700,
+        "breakfast": 300,
+        "sarapan": 400,
+        "enak": 500,
+        "dan": 2000,
+        "tapi": 1500,
+        "pelayanan": 350,
+        "ramah": 450,
+        "lokasi": 600,
+        "strategis": 250,
+        "makan": 800,
+        "makam": 5,
+        "the": 5000,
+        "room": 1200,
+        "was": 3000,
+        "clean": 900,
+    }
+
+
+@pytest.fixture
+def spelling_test_cases():
+    return [
+        ("Hotel dekat pantai", "Hotel dekat pantai"),
+        ("", ""),
+        ("kamar bersih", "kamar bersih"),  # Known words
+        ("kamr bersi", "kamar bersih"),  # Insertions
+        ("breakfats enak", "breakfast enak"),  # Transposition
+        ("pelayann ramha", "pelayanan ramah"),
+        ("lokkasi strategsi", "lokasi strategis"),  # Words longer than the indexed prefix
+        ("makn", "makan"),  # The most frequent word wins a tie
+        ("Kamr BERSI Breakfats", "Kamar BERSIH Breakfast"),  # Case is preserved
+        ("(kamr), bersi!", "(kamar), bersih!"),  # Surrounding punctuation is kept
+        ("teh rooom wsa clen", "the room was clean"),
+        ("kmr", "kamar"),  # Two insertions
+        ("an AC", "an AC"),  # Shorter than min_length
+        ("kamr123 bersi-bersi", "kamr123 bersi-bersi"),  # Non-letters
+        ("xyzzy", "xyzzy"),  # No word within max_distance
+    ]
@@ -0,0 +1,39 @@
+import pytest
+
+
+@pytest.fixture
+def stem_test_cases():
+    return [
+        ("kamarnya", "kamar"),  # Possessive pronoun
+        ("sebaiknya", "baik"),  # se- and -nya, as joined by normalize_remunerations
+        ("Pelayanannya", "layan"),  # pe-an confix, tokens are stemmed lowercase
+        ("kebersihan", "bersih"),  # ke-an confix
+        ("menginap", "inap"),
+        ("penginapan", "inap"),
+        ("memuaskan", "puas"),  # meN- replaces the first letter of the root
+        ("menyenangkan", "senang"),
+        ("menulis", "tulis"),
+        ("mengecewakan", "kecewa"),  # The replaced letter is recovered from a known root
+        ("memperbaiki", "baik"),  # memper-i confix
+        ("bersama", "sama"),
+        ("bekerja", "kerja"),
+        ("terletak", "letak"),
+        ("perjalanan", "jalan"),
+        ("makanan", "makan"),
+        ("makan", "makan"),  # Stems keep at least 4 letters and 2 syllables
+        ("dingin", "dingin"),
+        ("sendiri", "sendiri"),  # -i is only removed together with a prefix
+        ("memakai", "pakai"),  # and never after a vowel
+        ("seperti", "seperti"),  # Exceptions
+        ("sarapannya", "sarapan"),
+        ("selamat", "selamat"),
+        ("lumayan", "lumayan"),
+        ("keadaan", "ada"),  # ke-an confix around a short known root
+        ("berenang", "renang"),  # ber- drops its r before a root starting with r
+        ("pelajaran", "ajar"),  # pel- before ajar
+        ("anak-anak", "anak"),  # Reduplication
+        ("sayur-sayuran", "sayur"),
+        ("bolak-balik", "bolak-balik"),
+        ("2x", "2x"),  # Tokens with non-letters are kept
+        ("kurang,", "kurang,"),
+    ]
@@ -0,0 +1,19 @@
+import pytest
+
+
+@pytest.fixture
+def normalize_times_dates_test_cases():
+    return [
+        ("This is a normal text", "This is a normal text"),
+        ("Check-in 2pm, check-out 11 a.m.", "Check-in 14.00, check-out 11.00"),
+        ("Arrived at 6:00 am, left at 12 am", "Arrived at 06.00, left at 00.00"),
+        ("Kamar baru siap jam 3 sore, sarapan pukul 7 pagi", "Kamar baru siap jam 15.00, sarapan pukul 07.00"),
+        ("jam 9 malam, jam 2 malam, jam 1 siang, jam 11 siang", "jam 21.00, jam 02.00, jam 13.00, jam 11.00"),  # Day periods
+        ("Sarapan 06:30-10:00, check-in 14.30 WIB", "Sarapan 06.30-10.00, check-in 14.30 WIB"),
+        ("Menginap 17/08/2023 sampai 2023-08-20", "Menginap 2023-08-17 sampai 2023-08-20"),
+        ("Tgl 17 Agustus 2023, 1 Jan, Aug 17, 2023 dan May 5th", "Tgl 2023-08-17, --01-01, 2023-08-17 dan --05-05"),
+        ("You may 5 times, may 5th, may 5, 2023, MAY 5", "You may 5 times, --05-05, 2023-05-05, --05-05"),  # The modal verb may
+        ("Rating 4.50, harga Rp. 14.500 untuk 3 malam, 2 orang", "Rating 4.50, harga Rp. 14.500 untuk 3 malam, 2 orang"),  # Ratings, prices and durations are left alone
+        ("31 Feb, 29/02/2023, 25:00", "31 Feb, 29/02/2023, 25:00"),  # Impossible dates and times
+        ("", ""),
+    ]
@@ -0,0 +1,23 @@
+import pytest
+
+
+@pytest.fixture
+def truecase_id_test_cases():
+    return [
+        ("Kamar bersih", "Kamar bersih"),
+        ("HOTEL DI JAKARTA INI BAGUS BANGET. AC DINGIN DAN WIFI KENCANG", "Hotel di Jakarta ini bagus banget. AC dingin dan WiFi kencang"),
+        ("kamar oke!!! staf ramah?ya", "Kamar oke!!! Staf ramah?Ya"),  # Every sentence start is capitalized
+        ("  check-in JAM 14.00 wib", "  Check-in jam 14.00 WIB"),  # White spaces and numbers kept
+        ("\"HOTEL\" BAGUS. (KAMAR) BERSIH! \"STAF\" RAMAH", "\"Hotel\" bagus. (Kamar) bersih! \"Staf\" ramah"),  # Quotes and brackets before a sentence start
+        ("KAMAR NO. 12 DI JL. SUDIRMAN", "Kamar no. 12 di jl. sudirman"),  # Abbreviations do not end a sentence
+        ("", ""),
+    ]
+
+
+@pytest.fixture
+def truecase_en_test_cases():
+    return [
+        ("i'M SO HAPPY WITH THIS HOTEL IN BALI, i WILL BE BACK ON FRIDAY", "I'm so happy with this hotel in Bali, I will be back on Friday"),
+        ("the tv was broken. wifi too", "The TV was broken. WiFi too"),
+        ("GOOD VIEW, i.e. THIS HOTEL IS GREAT. \"WOW.\" THANKS", "Good view, i.e. this hotel is great. \"Wow.\" Thanks"),
+    ]
@@ -0,0 +1,63 @@
+import re
+
+import pytest
+
+from src.tiketnlphub.datasets.synthetic import (
+    ADVERSARIAL,
+    DEFAULT_RATES,
+    NOUNS,
+    SyntheticReviews,
+    iter_synthetic_reviews,
+    synthetic_reviews,
+)
+from tests.fixtures.datasets.synthetic import (
+    feature_patterns,
+)
+
+
+def test_synthetic_reviews_are_deterministic():
+    texts = synthetic_reviews(500, seed=7)
+    assert texts == list(iter_synthetic_reviews(500, seed=7))
+    assert texts != synthetic_reviews(500, seed=8)
+
+    # review `i` does not depend on the reviews generated before it
+    reviews = SyntheticReviews(seed=7)
+    assert texts[100:300] == reviews.generate(200, start=100)
+    assert texts[250] == reviews.review(250)
+    assert texts == [text for batch in reviews.iter_batches(500, batch_size=64) for text in batch]
+    assert all(text and "\n" not in text for text in texts)
+
+
+@pytest.mark.parametrize("lang, other", [("id", "en"), ("en", "id")])
+def test_synthetic_reviews_language(lang, other):
+    rates = {feature: 0 for feature in DEFAULT_RATES}
+    texts = synthetic_reviews(200, lang=lang, rates=rates)
+    words = set(" ".join(texts).lower().split())
+    assert words & set(NOUNS[lang])
+    assert not words & (set(NOUNS[other]) - set(NOUNS[lang]))
+
+    words = set(" ".join(synthetic_reviews(200, rates=rates)).lower().split())
+    assert words & set(NOUNS["id"]) and words & set(NOUNS["en"])
+
+
+def test_synthetic_reviews_rates(feature_patterns):
+    for feature, pattern in feature_patterns.items():
+        rates = {name: float(name == feature) for name in DEFAULT_RATES}
+        texts = synthetic_reviews(200, lang="en", rates=rates)
+        assert all(re.search(pattern, text) for text in texts), feature
+
+        rates[feature] = 0
+        texts = synthetic_reviews(200, lang="en", rates=rates)
+        assert not any(re.search(pattern, text) for text in texts), feature
+
+    with pytest.raises(ValueError, match="typos"):
+        SyntheticReviews(rates={"typos": 0.5})
+    with pytest.raises(ValueError, match="jv"):
+        SyntheticReviews(lang="jv")
+
+
+def test_synthetic_reviews_adversarial():
+    texts = synthetic_reviews(200, adversarial=True, run_length=100)
+    assert all(max(map(len, text.split())) >= 40 for text in texts)
+    assert min(map(len, texts)) > min(map(len, synthetic_reviews(200)))
+    assert "a" * 100 in " ".join(texts) and len(ADVERSARIAL) > 10
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from src.tiketnlphub.feature_extraction.hashing import HashingVectorizer, token_hashes
+from src.tiketnlphub.preprocessing.pipeline import Pipeline
+from tests.fixtures.feature_extraction.hashing import (
+    hashing_texts,
+)
+
+
+def test_token_hashes():
+    hashes = token_hashes(["kamar", "bersih", "kamar", "café", "cafe", "a"])
+    assert np.uint64 == hashes.dtype
+    assert hashes[0] == hashes[2]
+    assert 5 == len(set(hashes.tolist()))
+    assert hashes[1:4].tolist() == token_hashes(["bersih", "kamar", "café"]).tolist()
+    assert 0 == len(token_hashes([]))
+
+
+def test_hashing_vectorizer_counts(hashing_texts):
+    vectorizer = HashingVectorizer(n_features=2 ** 20, ngram_range=(1, 2), alternate_sign=False, norm=None)
+    chunk = vectorizer.transform(hashing_texts)
+    assert (len(hashing_texts), 2 ** 20) == chunk.shape
+    assert len(hashing_texts) + 1 == len(chunk.indptr)
+    for row, text in enumerate(hashing_texts):
+        tokens = text.split()
+        values = chunk.data[chunk.indptr[row]:chunk.indptr[row + 1]]
+        columns = chunk.indices[chunk.indptr[row]:chunk.indptr[row + 1]]
+        # unigrams plus bigrams, bigrams never cross the boundary of a text
+        assert len(tokens) + max(len(tokens) - 1, 0) == values.sum()
+        assert (np.diff(columns) > 0).all()
+    # `kamar` twice, the other unigrams and bigrams once
+    assert [2.0, 1.0, 1.0, 1.0, 1.0, 1.0] == sorted(chunk.data[chunk.indptr[0]:chunk.indptr[1]].tolist(), reverse=True)
+    assert set(chunk.toarray()[2].nonzero()[0]) < set(chunk.toarray()[0].nonzero()[0])
+
+
+def test_hashing_vectorizer_options(hashing_texts):
+    unigrams = HashingVectorizer(n_features=64).transform(hashing_texts).toarray()
+    assert np.allclose([1, 0, 1, 1, 1], np.linalg.norm(unigrams, axis=1))
+    assert (unigrams < 0).any()
+
+    l1 = HashingVectorizer(n_features=64, ngram_range=(2, 3), norm="l1").transform(hashing_texts).toarray()
+    assert np.allclose([1, 0, 1, 1, 1], np.abs(l1).sum(axis=1))
+
+    cased = HashingVectorizer(n_features=2 ** 20, lowercase=False).transform(["Kamar", "kamar"]).toarray()
+    assert not np.array_equal(cased[0], cased[1])
+
+    with pytest.raises(ValueError):
+        HashingVectorizer(ngram_range=(2, 1))
+    with pytest.raises(ValueError):
+        HashingVectorizer(norm="max")
+
+
+def test_hashing_vectorizer_stream(hashing_texts):
+    vectorizer = HashingVectorizer(n_features=1024, ngram_range=(1, 3))
+    expected = vectorizer.transform(hashing_texts).toarray()
+    chunks = list(vectorizer.transform_stream(iter(hashing_texts), chunk_size=2))
+    assert [2, 2, 1] == [chunk.shape[0] for chunk in chunks]
+    assert np.array_equal(expected, np.vstack([chunk.toarray() for chunk in chunks]))
+
+
+def test_hashing_vectorizer_pipeline(hashing_texts):
+    pipeline = Pipeline(["remove_punctuations", "remove_white_spaces"])
+    fused = HashingVectorizer(n_features=1024, pipeline=pipeline).transform(hashing_texts).toarray()
+    separate = HashingVectorizer(n_features=1024).transform(pipeline.run_batch(hashing_texts)).toarray()
+    assert np.array_equal(fused, separate)
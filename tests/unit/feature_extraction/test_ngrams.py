@@ -0,0 +1,81 @@
+from collections import Counter
+
+import pytest
+
+from src.tiketnlphub.feature_extraction import ngrams as ngrams_module
+from src.tiketnlphub.feature_extraction.ngrams import CountMinSketch, NgramCounter, count_ngrams
+from src.tiketnlphub.preprocessing.pipeline import Pipeline
+from tests.fixtures.feature_extraction.ngrams import (
+    ngram_texts,
+)
+
+
+def _expected(texts, ngram_range):
+    counts = Counter()
+    for text in texts:
+        tokens = text.lower().split()
+        for n in range(ngram_range[0], ngram_range[1] + 1):
+            counts.update(" ".join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+    return sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+
+
+@pytest.mark.parametrize("ngram_range", [(1, 1), (1, 3), (2, 2)])
+def test_ngram_counter(ngram_texts, ngram_range):
+    counter = NgramCounter(ngram_range=ngram_range)
+    counter.update_stream(ngram_texts, chunk_size=2)
+    expected = _expected(ngram_texts, ngram_range)
+    assert expected == counter.most_common()
+    assert len(expected) == len(counter)
+    assert expected[:4] == counter.most_common(4)
+    assert [item for item in expected if item[1] >= 6] == counter.most_common(min_count=6)
+
+
+def test_ngram_counter_interns_by_block(ngram_texts, monkeypatch):
+    # a chunk is tokenized a few texts at a time, n-grams never cross the texts of two blocks
+    monkeypatch.setattr(ngrams_module, "_INTERN_BLOCK_SIZE", 3)
+    counter = NgramCounter(ngram_range=(1, 3))
+    counter.update(ngram_texts)
+    assert _expected(ngram_texts, (1, 3)) == counter.most_common()
+
+
+def test_ngram_counter_orders_and_ids(ngram_texts):
+    counter = NgramCounter(ngram_range=(1, 2), lowercase=False)
+    counter.update(ngram_texts)
+    assert ("kamar", 6) in counter.most_common(n=1)
+    assert all(len(ngram.split()) == 2 for ngram, _ in counter.most_common(n=2))
+    members, counts = counter.counts(1)
+    assert (len(counter.most_common(n=1)), 1) == members.shape
+    assert {counter.token(i) for i in members[:, 0].tolist()} >= {"Kamar", "kamar", "RAMAH", "ramah"}
+
+
+def test_ngram_counter_merge(ngram_texts):
+    first, second = NgramCounter(ngram_range=(1, 2)), NgramCounter(ngram_range=(1, 2))
+    first.update(ngram_texts[:7])
+    second.update(ngram_texts[7:])
+    first.merge(second)
+    assert _expected(ngram_texts, (1, 2)) == first.most_common()
+    with pytest.raises(ValueError):
+        first.merge(NgramCounter(ngram_range=(1, 3)))
+
+
+def test_ngram_counter_bounded(ngram_texts):
+    # the exact counts of the most frequent n-grams survive the pruning of rare ones
+    texts = ngram_texts + [f"rare{i} token{i}" for i in range(100)]
+    expected = _expected(texts, (1, 2))[:3]
+    for sketch_width in (None, 2 ** 16):
+        counter = NgramCounter(ngram_range=(1, 2), max_size=20, sketch_width=sketch_width)
+        counter.update_stream(texts, chunk_size=5)
+        assert len(counter) <= 2 * 2 * 20
+        assert expected == counter.most_common(3)
+
+    with pytest.raises(ValueError):
+        CountMinSketch(width=10)
+
+
+def test_count_ngrams(ngram_texts):
+    pipeline = Pipeline(["remove_punctuations"])
+    expected = _expected(pipeline.run_batch(ngram_texts), (1, 2))
+    assert expected == count_ngrams(ngram_texts, (1, 2), workers=1, chunk_size=4, pipeline=pipeline).most_common()
+    assert expected == count_ngrams(iter(ngram_texts), (1, 2), workers=2, chunk_size=4, pipeline=pipeline).most_common()
+    with pytest.raises(ValueError):
+        count_ngrams(ngram_texts, chunk_size=0)
@@ -0,0 +1,22 @@
+import pytest
+
+from src.tiketnlphub.feature_extraction.prices import Price, PriceExtractor, extract_prices, extract_prices_batch
+from tests.fixtures.feature_extraction.prices import (
+    extract_prices_test_cases,
+)
+
+
+def test_extract_prices(extract_prices_test_cases):
+    for input_text, expected_output in extract_prices_test_cases:
+        prices = extract_prices(input_text)
+        assert expected_output == [(price.amount, price.currency, price.per_unit, input_text[slice(*price.span)]) for price in prices]
+        # memoized prices give the same records
+        assert prices == extract_prices(input_text)
+    assert [extract_prices(text) for text, _ in extract_prices_test_cases] == extract_prices_batch([text for text, _ in extract_prices_test_cases])
+
+
+def test_price_extractor_options():
+    assert [Price(50000.0, "USD", None, (6, 9))] == extract_prices("Dapat 50k", default_currency="USD")
+    extractor = PriceExtractor(currencies={"RM": "MYR"}, cache_size=1)
+    assert [Price(5.0, "MYR", None, (0, 4)), Price(12.0, "MYR", "night", (6, 16))] == extractor.extract("RM 5, RM12/malam")
+    assert [Price(5.0, "MYR", None, (0, 4))] == extractor.extract("RM 5")
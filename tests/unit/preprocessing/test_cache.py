@@ -0,0 +1,119 @@
+from multiprocessing import Pool
+import sqlite3
+
+import pytest
+
+from src.tiketnlphub.preprocessing.cache import ResultCache
+from src.tiketnlphub.preprocessing.pipeline import STEPS, Pipeline
+from tests.fixtures.preprocessing.cache import (
+    cache_texts,
+)
+
+
+def test_result_cache_roundtrip(tmp_path, cache_texts):
+    cache = ResultCache(str(tmp_path / "cache.sqlite"))
+    assert [None] * len(cache_texts) == cache.get_many("fingerprint", cache_texts)
+
+    results = [text.upper() for text in cache_texts]
+    cache.put_many("fingerprint", cache_texts, results)
+    assert results == cache.get_many("fingerprint", cache_texts)
+    assert [None] * len(cache_texts) == cache.get_many("another fingerprint", cache_texts)
+    assert len(set(cache_texts)) == len(cache)
+
+    # results survive the connection, as they would across runs
+    cache.close()
+    assert results == ResultCache(str(tmp_path / "cache.sqlite")).get_many("fingerprint", cache_texts)
+
+
+def test_result_cache_evicts_least_recently_used(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache.sqlite"), max_entries=3)
+    cache.put_many("fingerprint", ["a", "b", "c"], ["A", "B", "C"])
+    cache.get_many("fingerprint", ["a"])
+    cache.put_many("fingerprint", ["d"], ["D"])
+    assert 3 == len(cache)
+    assert ["A", None, "C", "D"] == cache.get_many("fingerprint", ["a", "b", "c", "d"])
+
+
+def test_result_cache_counts_entries(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    cache = ResultCache(path, max_entries=3)
+    cache.put_many("fingerprint", ["a", "b", "a"], ["A", "B", "A2"])
+    cache.put_many("fingerprint", ["c"], ["C"])
+    assert 3 == len(cache) == len(ResultCache(path))
+    cache.get_many("fingerprint", ["a"])
+    cache.put_many("fingerprint", ["d", "e"], ["D", "E"])
+    assert 3 == len(cache)
+    assert ["A2", None, None, "D", "E"] == cache.get_many("fingerprint", ["a", "b", "c", "d", "e"])
+    cache.clear()
+    assert 0 == len(cache)
+
+
+def test_result_cache_rejects_mismatched_results(tmp_path):
+    with pytest.raises(ValueError):
+        ResultCache(str(tmp_path / "cache.sqlite")).put_many("fingerprint", ["a", "b"], ["A"])
+
+
+def test_pipeline_run_batch_with_cache(tmp_path, monkeypatch, cache_texts):
+    calls = []
+
+    def record(text):
+        calls.append(text)
+        return text
+
+    # a named step, only pipelines with a fingerprint can be cached
+    monkeypatch.setitem(STEPS, "record", record)
+    cache = ResultCache(str(tmp_path / "cache.sqlite"))
+    pipeline = Pipeline(["record", "remove_urls", "remove_white_spaces"])
+    expected_output = pipeline.run_batch(cache_texts)
+    calls.clear()
+
+    assert expected_output == pipeline.run_batch(cache_texts, cache=cache)
+    # duplicated texts are only processed once
+    assert len(set(cache_texts)) == len(calls)
+    calls.clear()
+
+    assert expected_output == pipeline.run_batch(cache_texts, cache=cache)
+    assert [] == calls
+    assert expected_output == pipeline.run_batch(cache_texts, langs=["en"] * len(cache_texts), cache=cache)
+    assert [] == calls
+
+
+def test_pipeline_run_batch_flushes_recently_used_marks(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    cache = ResultCache(path)
+    pipeline = Pipeline(["remove_white_spaces"])
+    pipeline.run_batch(["kamar  bersih"], cache=cache)
+    (before,), = sqlite3.connect(path).execute("SELECT last_used FROM results").fetchall()
+
+    # pool workers never close their cache, the hits are written by the batch itself
+    assert ["kamar bersih"] == pipeline.run_batch(["kamar  bersih"], cache=cache)
+    (after,), = sqlite3.connect(path).execute("SELECT last_used FROM results").fetchall()
+    assert after > before
+
+
+def _put_range(args):
+    path, start = args
+    cache = ResultCache(path)
+    texts = [str(i) for i in range(start, start + 200)]
+    for i in range(0, len(texts), 20):
+        cache.put_many("fingerprint", texts[i:i + 20], [f"result {text}" for text in texts[i:i + 20]])
+        cache.get_many("fingerprint", texts[:i + 20])
+    return len(texts)
+
+
+def test_pipeline_run_batch_refuses_cache_without_fingerprint(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache.sqlite"))
+    assert ["HELLO"] == Pipeline(["remove_white_spaces"]).run_batch(["HELLO"], cache=cache)
+    # two lambdas would share a name, their results must never be mixed up
+    with pytest.raises(ValueError):
+        Pipeline([lambda text: text.lower()]).run_batch(["HELLO"], cache=cache)
+    assert ["hello"] == Pipeline([lambda text: text.lower()]).run_batch(["HELLO"])
+
+
+def test_result_cache_concurrent_writers(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    with Pool(3) as pool:
+        assert 600 == sum(pool.map(_put_range, [(path, 0), (path, 200), (path, 400)]))
+
+    texts = [str(i) for i in range(600)]
+    assert [f"result {text}" for text in texts] == ResultCache(path).get_many("fingerprint", texts)
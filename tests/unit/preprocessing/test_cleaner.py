@@ -8,15 +8,19 @@ from tests.fixtures.preprocessing.cleaner import (
     remove_hastags_test_cases,
     remove_mentions_test_cases,
     remove_phone_numbers_test_cases,
+    removal_modes_test_cases,
     remove_numbering_bullets_test_cases,
     remove_bullets_test_cases,
     remove_html_tags_test_cases,
     remove_punctuations_default_test_cases,
     remove_punctuations_with_punct_to_remove_test_cases,
     remove_white_spaces_test_cases,
+    remove_stopwords_id_test_cases,
+    remove_stopwords_en_test_cases,
     remove_repeated_chars_test_cases,
     remove_repeated_words_test_cases,
     remove_repeated_puncts_test_cases,
+    collapse_repeats_test_cases,
     split_punct_and_word_test_cases,
     upper_selected_word_test_cases,
     upper_i_word_test_cases,
@@ -61,6 +65,16 @@ def test_remove_phone_numbers(remove_phone_numbers_test_cases):
         assert expected_output == result
 
 
+def test_removal_modes(removal_modes_test_cases):
+    for name, input_text, masked_text, values in removal_modes_test_cases:
+        remove = getattr(cleaner, name)
+        assert masked_text == remove(input_text, mode="mask")
+        assert (remove(input_text), values) == remove(input_text, mode="extract")
+    assert "kudos to [USER] and [USER]!" == cleaner.remove_mentions("kudos to @martin and @dewi!", mode="mask", placeholder="[USER]")
+    with pytest.raises(ValueError):
+        cleaner.remove_urls("https://example.com", mode="replace")
+
+
 def test_remove_numbering_bullets(remove_numbering_bullets_test_cases):
     for input_text, expected_output in remove_numbering_bullets_test_cases:
         result = cleaner.remove_numbering_bullets(input_text)
@@ -97,6 +111,21 @@ def test_remove_white_spaces(remove_white_spaces_test_cases):
         assert expected_output == result
 
 
+def test_remove_stopwords(remove_stopwords_id_test_cases, remove_stopwords_en_test_cases):
+    for lang, test_cases in (("id", remove_stopwords_id_test_cases), ("en", remove_stopwords_en_test_cases)):
+        for input_text, expected_output in test_cases:
+            assert expected_output == cleaner.remove_stopwords(input_text, lang=lang)
+            assert expected_output.split() == cleaner.remove_stopwords_tokens(input_text.split(), lang=lang)
+        assert [output for _, output in test_cases] == cleaner.remove_stopwords_batch([text for text, _ in test_cases], lang=lang)
+
+
+def test_remove_stopwords_with_options():
+    assert "Kamar bersih" == cleaner.remove_stopwords("Kamar yAng sangat bersih", extra=["SANGAT"], casefold=True)
+    assert "Kamar yAng bersih" == cleaner.remove_stopwords("Kamar yAng sangat bersih", extra={"sangat"})
+    assert cleaner.get_stopwords("id", ["sangat"]) is cleaner.get_stopwords("id", ("sangat",))
+    assert "yang" not in cleaner.get_stopwords("en")
+
+
 def test_remove_repeated_chars(remove_repeated_chars_test_cases):
     for input_text, expected_output in remove_repeated_chars_test_cases:
         result = cleaner.remove_repeated_chars(input_text)
@@ -115,6 +144,20 @@ def test_remove_repeated_puncts(remove_repeated_puncts_test_cases):
         assert expected_output == result
 
 
+def test_collapse_repeats(collapse_repeats_test_cases, remove_repeated_chars_test_cases, remove_repeated_words_test_cases, remove_repeated_puncts_test_cases):
+    for input_text, expected_output in collapse_repeats_test_cases:
+        assert expected_output == cleaner.collapse_repeats(input_text)
+        sequential = cleaner.remove_repeated_words(cleaner.remove_repeated_puncts(cleaner.remove_repeated_chars(input_text)))
+        assert sequential == cleaner.collapse_repeats(input_text)
+    assert [output for _, output in collapse_repeats_test_cases] == cleaner.collapse_repeats_batch([text for text, _ in collapse_repeats_test_cases])
+
+    # with a single behavior turned on, the results match the ones of the separate steps
+    for test_cases, behavior in ((remove_repeated_chars_test_cases, "chars"), (remove_repeated_words_test_cases, "words"), (remove_repeated_puncts_test_cases, "puncts")):
+        options = {"chars": False, "words": False, "puncts": False, behavior: True}
+        for input_text, expected_output in test_cases:
+            assert expected_output == cleaner.collapse_repeats(input_text, **options)
+
+
 def test_split_punct_and_word(split_punct_and_word_test_cases):
     for input_text, expected_output in split_punct_and_word_test_cases:
         result = cleaner.split_punct_and_word(input_text)
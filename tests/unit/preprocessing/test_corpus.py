@@ -0,0 +1,138 @@
+import json
+import os
+
+import pytest
+
+from src.tiketnlphub.preprocessing.corpus import (
+    clean_corpus,
+    concatenate_shards,
+    iter_cleaned_lines,
+    split_byte_ranges,
+)
+from src.tiketnlphub.preprocessing.pipeline import Pipeline
+from tests.fixtures.preprocessing.corpus import (
+    corpus_lines,
+    corpus_file,
+)
+
+
+def test_split_byte_ranges_are_newline_aligned(corpus_file):
+    ranges = split_byte_ranges(corpus_file, chunk_size=500)
+    with open(corpus_file, "rb") as f:
+        data = f.read()
+    assert len(ranges) > 1
+    assert 0 == ranges[0][0]
+    assert len(data) == ranges[-1][1]
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start
+        assert b"\n" == data[end - 1:end]
+
+
+def test_split_byte_ranges_rejects_invalid_chunk_size(corpus_file):
+    with pytest.raises(ValueError):
+        split_byte_ranges(corpus_file, chunk_size=0)
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_clean_corpus_keeps_input_order(tmp_path, corpus_file, corpus_lines, workers):
+    pipeline = Pipeline(["normalize_slashes", "normalize_symbols", "remove_white_spaces"], lang="id")
+    output_dir = str(tmp_path / "clean")
+    index_path = clean_corpus(corpus_file, output_dir, pipeline, workers=workers, chunk_size=700)
+
+    with open(index_path, encoding="utf-8") as f:
+        index = json.load(f)
+    assert len(corpus_lines) == index["lines"]
+    assert len(index["shards"]) > 1
+
+    expected_output = [pipeline(line) for line in corpus_lines]
+    assert expected_output == list(iter_cleaned_lines(output_dir))
+
+    output_path = str(tmp_path / "clean.txt")
+    concatenate_shards(output_dir, output_path)
+    with open(output_path, encoding="utf-8") as f:
+        assert "\n".join(expected_output) + "\n" == f.read()
+
+
+def test_clean_corpus_empty_file(tmp_path):
+    input_path = tmp_path / "empty.txt"
+    input_path.write_bytes(b"")
+    output_dir = str(tmp_path / "clean")
+    clean_corpus(str(input_path), output_dir, Pipeline(["remove_white_spaces"]))
+    assert [] == list(iter_cleaned_lines(output_dir))
+
+
+def test_clean_corpus_resumes_from_checkpoint(tmp_path, corpus_file, corpus_lines):
+    pipeline = Pipeline(["normalize_slashes", "normalize_symbols", "remove_white_spaces"], lang="id")
+    output_dir = str(tmp_path / "clean")
+    index_path = clean_corpus(corpus_file, output_dir, pipeline, workers=1, chunk_size=700)
+    with open(index_path, encoding="utf-8") as f:
+        shards = json.load(f)["shards"]
+
+    # simulate a job that died before committing its last shards
+    with open(tmp_path / "clean" / "checkpoint.json", encoding="utf-8") as f:
+        checkpoint = json.load(f)
+    checkpoint["shards"] = checkpoint["shards"][:2]
+    with open(tmp_path / "clean" / "checkpoint.json", "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f)
+    for shard in shards[2:]:
+        (tmp_path / "clean" / shard["path"]).unlink()
+    committed_mtime = (tmp_path / "clean" / shards[0]["path"]).stat().st_mtime_ns
+
+    clean_corpus(corpus_file, output_dir, pipeline, workers=1, chunk_size=700)
+    assert committed_mtime == (tmp_path / "clean" / shards[0]["path"]).stat().st_mtime_ns
+    assert [pipeline(line) for line in corpus_lines] == list(iter_cleaned_lines(output_dir))
+
+
+def test_clean_corpus_refuses_to_resume_changed_pipeline(tmp_path, corpus_file):
+    output_dir = str(tmp_path / "clean")
+    clean_corpus(corpus_file, output_dir, Pipeline(["remove_white_spaces"]), workers=1, chunk_size=700)
+    with pytest.raises(ValueError):
+        clean_corpus(corpus_file, output_dir, Pipeline(["remove_digits", "remove_white_spaces"]), workers=1, chunk_size=700)
+    with pytest.raises(ValueError):
+        clean_corpus(corpus_file, output_dir, Pipeline(["remove_white_spaces"]), workers=1, chunk_size=900)
+
+    pipeline = Pipeline(["remove_digits", "remove_white_spaces"])
+    clean_corpus(corpus_file, output_dir, pipeline, workers=1, chunk_size=700, resume=False)
+    assert all(not any(c.isdigit() for c in line) for line in iter_cleaned_lines(output_dir))
+
+
+def test_clean_corpus_refuses_to_resume_changed_input(tmp_path, corpus_file):
+    output_dir = str(tmp_path / "clean")
+    pipeline = Pipeline(["remove_white_spaces"])
+    clean_corpus(corpus_file, output_dir, pipeline, workers=1, chunk_size=700)
+
+    # same size, other content
+    copy_path = tmp_path / "copy.txt"
+    with open(corpus_file, "rb") as f:
+        copy_path.write_bytes(f.read().swapcase())
+    with pytest.raises(ValueError, match="'input'"):
+        clean_corpus(str(copy_path), output_dir, pipeline, workers=1, chunk_size=700)
+
+    os.replace(copy_path, corpus_file)
+    stat = os.stat(corpus_file)
+    os.utime(corpus_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    with pytest.raises(ValueError, match="'input_mtime'"):
+        clean_corpus(corpus_file, output_dir, pipeline, workers=1, chunk_size=700)
+
+
+def test_clean_corpus_never_resumes_without_fingerprint(tmp_path, corpus_file, corpus_lines):
+    from src.tiketnlphub.preprocessing.cache import ResultCache
+
+    output_dir = str(tmp_path / "clean")
+    clean_corpus(corpus_file, output_dir, Pipeline([str.upper]), workers=1, chunk_size=700)
+    clean_corpus(corpus_file, output_dir, Pipeline([str.lower]), workers=1, chunk_size=700)
+    assert [line.lower() for line in corpus_lines] == list(iter_cleaned_lines(output_dir))
+    with pytest.raises(ValueError):
+        clean_corpus(corpus_file, output_dir, Pipeline([str.lower]), workers=1, cache=ResultCache(str(tmp_path / "cache.sqlite")))
+
+
+def test_clean_corpus_with_result_cache(tmp_path, corpus_file, corpus_lines):
+    from src.tiketnlphub.preprocessing.cache import ResultCache
+
+    cache = ResultCache(str(tmp_path / "cache.sqlite"))
+    pipeline = Pipeline(["normalize_slashes", "normalize_symbols", "remove_white_spaces"], lang="id")
+    for run in ("first", "second"):
+        output_dir = str(tmp_path / run)
+        clean_corpus(corpus_file, output_dir, pipeline, workers=2, chunk_size=700, cache=cache)
+        assert [pipeline(line) for line in corpus_lines] == list(iter_cleaned_lines(output_dir))
+    assert len(set(corpus_lines)) == len(cache)
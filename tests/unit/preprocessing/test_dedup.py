@@ -0,0 +1,100 @@
+import numpy as np
+import pytest
+
+from src.tiketnlphub.preprocessing.dedup import (
+    LSHIndex,
+    MinHash,
+    NearDuplicateDetector,
+    optimal_bands,
+    shingle_hashes,
+)
+from tests.fixtures.preprocessing.dedup import (
+    dedup_clusters,
+    dedup_texts,
+)
+
+
+def test_shingle_hashes(dedup_texts):
+    hashes, offsets = shingle_hashes(["abcdef", "", "ab", "ABCDEF"], shingle_size=5)
+    assert [0, 2, 2, 3, 5] == offsets.tolist()
+    assert hashes[0:2].tolist() == hashes[3:5].tolist()
+    assert len(set(hashes[0:3].tolist())) == 3
+
+    hashes, offsets = shingle_hashes(dedup_texts)
+    assert len(dedup_texts) + 1 == len(offsets)
+    assert hashes[offsets[0]:offsets[1]].tolist() == hashes[offsets[7]:offsets[8]].tolist()
+
+
+def test_minhash_signatures(dedup_texts):
+    minhash = MinHash(num_perm=64)
+    signatures = minhash.signatures(dedup_texts)
+    assert (len(dedup_texts), 64) == signatures.shape
+    assert signatures.dtype == np.uint32
+    for text, signature in zip(dedup_texts, signatures):
+        assert signature.tolist() == minhash.signature(text).tolist()
+
+    assert 1.0 == MinHash.similarity(signatures[0], signatures[7])
+    assert MinHash.similarity(signatures[0], signatures[2]) > 0.8
+    assert MinHash.similarity(signatures[0], signatures[1]) < 0.3
+    assert (signatures[6] == np.iinfo(np.uint32).max).all()
+
+
+def test_optimal_bands():
+    bands, rows = optimal_bands(128, 0.8)
+    assert bands * rows <= 128
+    assert optimal_bands(128, 0.5)[1] < rows
+
+
+def test_lsh_index(dedup_texts):
+    minhash, index = MinHash(), LSHIndex(threshold=0.8)
+    signatures = minhash.signatures(dedup_texts)
+    assert [-1] * len(dedup_texts) == index.query(signatures).tolist()
+
+    index.insert(signatures[[0, 1]], [10, 11])
+    index.insert(signatures[[7]], [12])
+    assert 3 == len(index)
+    assert 3 * (16 * index.bands + 4 * 128 + 8) == index.nbytes
+    assert [10, 11, 10, -1, 11, -1, -1, 10] == index.query(signatures).tolist()
+
+    # an empty batch adds no run
+    index.insert(signatures[:0], [])
+    assert 3 == len(index)
+    assert [10, 11, 10, -1, 11, -1, -1, 10] == index.query(signatures).tolist()
+    empty = LSHIndex(threshold=0.8)
+    empty.insert(signatures[:0], [])
+    assert [-1] * len(dedup_texts) == empty.query(signatures).tolist()
+
+    with pytest.raises(ValueError):
+        LSHIndex(num_perm=64, bands=10, rows=10)
+
+
+def test_lsh_index_drops_dissimilar_candidates(dedup_texts):
+    signatures = MinHash().signatures(dedup_texts)
+    # single row bands make any signature sharing one value a candidate
+    index = LSHIndex(threshold=0.8, bands=128, rows=1)
+    index.insert(signatures[[0]], [10])
+    assert MinHash.similarity(signatures[0], signatures[5]) < 0.8
+    assert (index.band_keys(signatures[[0]]) == index.band_keys(signatures[[5]])).any()
+    assert [10, -1, 10] == index.query(signatures[[0, 5, 7]]).tolist()
+
+
+def test_near_duplicate_detector(dedup_texts, dedup_clusters):
+    detector = NearDuplicateDetector(threshold=0.8)
+    assert dedup_clusters == detector.add_batch(dedup_texts).tolist()
+    assert len(dedup_texts) == len(detector)
+    assert 5 == len(detector.index)
+
+    assert 3 == detector.query("Pelayanan check-in lambat, antri hampir satu jam!")
+    assert detector.query("Kolam renang kotor dan handuk tidak diganti") is None
+    assert 8 == detector.add("Kolam renang kotor dan handuk tidak diganti")
+    assert 1 == detector.add("lokasi strategis dekat stasiun, tapi AC kurang dingin")
+
+
+def test_near_duplicate_detector_streaming(dedup_texts, dedup_clusters):
+    batched = NearDuplicateDetector().add_batch(dedup_texts).tolist()
+    detector = NearDuplicateDetector()
+    assert batched == [detector.add(text) for text in dedup_texts]
+
+    unique = [text for i, text in enumerate(dedup_texts) if dedup_clusters[i] == i]
+    for batch_size in (1, 3, 100):
+        assert unique == list(NearDuplicateDetector().deduplicate(iter(dedup_texts), batch_size=batch_size))
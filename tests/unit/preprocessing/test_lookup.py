@@ -0,0 +1,82 @@
+from multiprocessing import Pool
+import pickle
+
+import pytest
+
+from src.tiketnlphub.preprocessing.lookup import PackedTable, pack_mapping
+from src.tiketnlphub.preprocessing.slang import SlangDictionary
+from tests.fixtures.preprocessing.lookup import (
+    lookup_mapping,
+)
+from tests.fixtures.preprocessing.slang import (
+    slang_mapping,
+    slang_test_cases,
+)
+
+
+def _lookup(args):
+    table, keys = args
+    return [table.get(key) for key in keys]
+
+
+@pytest.mark.parametrize("cache_size", [0, 65536])
+def test_packed_table_lookups(lookup_mapping, cache_size):
+    table = PackedTable.from_mapping(lookup_mapping, cache_size=cache_size)
+    assert len(lookup_mapping) == len(table)
+    assert lookup_mapping == dict(table.items())
+    assert sorted(lookup_mapping, key=lambda key: key.encode("utf-8")) == list(table)
+    for key, value in lookup_mapping.items():
+        assert value == table[key] == table.get(key)
+        assert key in table
+    assert table.get("missing") is None and "fallback" == table.get("missing", "fallback")
+    assert "missing" not in table
+    with pytest.raises(KeyError):
+        table["missing"]
+
+
+def test_packed_table_is_deterministic(lookup_mapping):
+    reversed_mapping = dict(reversed(list(lookup_mapping.items())))
+    assert pack_mapping(lookup_mapping, {"a": 1}) == pack_mapping(reversed_mapping, {"a": 1})
+    assert {"a": 1} == PackedTable.from_mapping(lookup_mapping, {"a": 1}).metadata
+    assert 0 == len(PackedTable.from_mapping({}))
+
+
+def test_packed_table_file(tmp_path, lookup_mapping):
+    path = str(tmp_path / "table.tbl")
+    PackedTable.from_mapping(lookup_mapping).save(path)
+    assert PackedTable.is_packed(path)
+
+    table = PackedTable.open(path)
+    assert lookup_mapping == dict(table.items())
+
+    # a memory-mapped table pickles as its path, not its content
+    payload = pickle.dumps(table)
+    assert len(payload) < 200
+    assert lookup_mapping == dict(pickle.loads(payload).items())
+    table.close()
+
+
+def test_packed_table_shared_memory(lookup_mapping):
+    table = PackedTable.from_mapping(lookup_mapping).to_shared_memory()
+    try:
+        assert len(pickle.dumps(table)) < 200
+        with Pool(2) as pool:
+            results = pool.map(_lookup, [(table, list(lookup_mapping))] * 2)
+        assert [list(lookup_mapping.values())] * 2 == results
+    finally:
+        table.unlink()
+
+
+def test_slang_dictionary_packed(tmp_path, slang_mapping, slang_test_cases):
+    slangs = SlangDictionary.from_table(SlangDictionary(slang_mapping).to_table())
+    assert slang_mapping == dict(slangs.items())
+    for input_text, expected_output in slang_test_cases:
+        assert expected_output == slangs.normalize(input_text)
+    with pytest.raises(TypeError):
+        slangs.update({"tp": "tapi"})
+
+    path = str(tmp_path / "slangs.tbl")
+    SlangDictionary(slang_mapping).save(path)
+    for slangs in (SlangDictionary.open(path), SlangDictionary.from_file(path), pickle.loads(pickle.dumps(SlangDictionary.open(path)))):
+        for input_text, expected_output in slang_test_cases:
+            assert expected_output == slangs.normalize(input_text)
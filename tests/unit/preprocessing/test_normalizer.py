@@ -5,6 +5,8 @@ from tests.fixtures.preprocessing.normalizer import (
     normalize_to_ascii_chars_test_cases, 
     normalize_punctuations_test_cases,
     normalize_punctuations_with_additional_punctuations_test_cases,
+    normalize_fullwidth_chars_test_cases,
+    normalize_fullwidth_chars_with_options_test_cases,
     normalize_remunerations_test_cases,
     normalize_remunerations_with_additional_remunerations_test_cases,
     normalize_slashes_en_test_cases,
@@ -17,7 +19,9 @@ from tests.fixtures.preprocessing.normalizer import (
     normalize_contractions_default_test_cases,
     normalize_contractions_with_addition_test_cases,
     normalize_fullstops_test_cases,
-    normalize_split_word_and_num_test_cases
+    normalize_split_word_and_num_test_cases,
+    normalize_slangs_id_test_cases,
+    normalize_slangs_en_test_cases,
 )
 
 
@@ -39,6 +43,21 @@ def test_normalize_punctuations_with_additional_punctuations(normalize_punctuati
         assert expected_output == result
 
 
+def test_normalize_fullwidth_chars(normalize_fullwidth_chars_test_cases):
+    for input_text, expected_output in normalize_fullwidth_chars_test_cases:
+        result = normalizer.normalize_fullwidth_chars(input_text)
+        assert expected_output == result
+
+
+def test_normalize_fullwidth_chars_with_options(normalize_fullwidth_chars_with_options_test_cases):
+    for input_text, additional_chars, punctuations, expected_output in normalize_fullwidth_chars_with_options_test_cases:
+        result = normalizer.normalize_fullwidth_chars(input_text, additional_chars=additional_chars, punctuations=punctuations)
+        assert expected_output == result
+
+    with pytest.raises(ValueError):
+        normalizer.normalize_fullwidth_chars("ＯＫ", additional_chars={"->": ","})
+
+
 def test_normalize_remunerations(normalize_remunerations_test_cases):
     for input_text, expected_output in normalize_remunerations_test_cases:
         result = normalizer.normalize_remunerations(input_text)
@@ -118,6 +137,51 @@ def test_split_word_and_num(normalize_split_word_and_num_test_cases):
         assert expected_output == result
 
 
+def test_normalize_slangs_id(normalize_slangs_id_test_cases):
+    for input_text, expected_output in normalize_slangs_id_test_cases:
+        result = normalizer.normalize_slangs(input_text, lang="id")
+        assert expected_output == result
+
+
+def test_normalize_slangs_en(normalize_slangs_en_test_cases):
+    for input_text, expected_output in normalize_slangs_en_test_cases:
+        result = normalizer.normalize_slangs(input_text, lang="en")
+        assert expected_output == result
+
+
+def test_normalize_slangs_with_additional_slangs(tmp_path):
+    text = "Dkt bandara, yg penting murmer"
+    expected_output = "Dekat bandara, yang penting murah meriah"
+    assert expected_output == normalizer.normalize_slangs(text, additional_slangs={"dkt": "dekat", "murmer": "murah meriah"})
+
+    path = tmp_path / "slangs.tsv"
+    path.write_text("dkt\tdekat\nmurmer\tmurah meriah\n", encoding="utf-8")
+    assert expected_output == normalizer.normalize_slangs(text, additional_slangs=str(path))
+    # a rewritten file is read once by the per-text functions, and loaded again by get_slang_dictionary
+    path.write_text("dkt\tdekat sekali\n", encoding="utf-8")
+    assert "Dekat bandara" == normalizer.normalize_slangs("Dkt bandara", additional_slangs=str(path))
+    dictionary = normalizer.get_slang_dictionary("id", str(path))
+    assert "Dekat sekali bandara" == normalizer.normalize_slangs("Dkt bandara", additional_slangs=str(path))
+    assert "Dekat sekali bandara" == normalizer.normalize_slangs("Dkt bandara", additional_slangs=dictionary)
+
+    # a dict is merged once
+    additional_slangs = {"dkt": "dekat"}
+    dictionary = normalizer.get_slang_dictionary("id", additional_slangs)
+    assert dictionary is normalizer.get_slang_dictionary("id", additional_slangs)
+    assert dictionary is normalizer.get_slang_dictionary("id", dictionary)
+    assert dictionary is not normalizer.get_slang_dictionary("en", additional_slangs)
+
+
+def test_normalize_slangs_keeps_units_and_titles():
+    assert "Jarak 30 cm dari kasur, dr. Budi ramah" == normalizer.normalize_slangs("Jarak 30 cm dari kasur, dr. Budi ramah")
+
+
+def test_normalize_slangs_with_packed_dictionary(tmp_path):
+    path = str(tmp_path / "slangs.tbl")
+    normalizer.get_slang_dictionary("id", {"dkt": "dekat"}).save(path)
+    assert "Dekat bandara, yang penting" == normalizer.normalize_slangs("Dkt bandara, yg penting", additional_slangs=path)
+
+
 
 
 
@@ -0,0 +1,44 @@
+import os
+
+import pytest
+
+from src.tiketnlphub.preprocessing.parallel import pack_texts, run_parallel, unpack_texts
+from src.tiketnlphub.preprocessing.pipeline import Pipeline
+from tests.fixtures.preprocessing.parallel import (
+    parallel_texts,
+)
+
+
+def test_pack_texts_roundtrip(parallel_texts):
+    data, offsets = pack_texts(parallel_texts)
+    assert len(parallel_texts) + 1 == len(offsets)
+    assert parallel_texts == unpack_texts(data, offsets)
+    assert parallel_texts == unpack_texts(memoryview(data), offsets)
+    assert [] == unpack_texts(*pack_texts([]))
+
+
+@pytest.mark.parametrize("workers, chunk_size", [(1, 10), (2, 5), (3, 1000)])
+def test_run_parallel_matches_run_batch(parallel_texts, workers, chunk_size):
+    pipeline = Pipeline(["remove_urls", "normalize_slashes", "remove_white_spaces"], lang="id")
+    assert pipeline.run_batch(parallel_texts) == run_parallel(pipeline, parallel_texts, workers=workers, chunk_size=chunk_size)
+    assert pipeline.run_batch(parallel_texts, langs="en") == run_parallel(pipeline, parallel_texts, lang="en", workers=workers, chunk_size=chunk_size)
+
+
+def _fail_on_boom(text):
+    if text == "boom":
+        raise RuntimeError(text)
+    return text
+
+
+@pytest.mark.skipif(not os.path.isdir("/dev/shm"), reason="shared memory blocks are not listed as files")
+def test_run_parallel_releases_blocks_on_error(parallel_texts):
+    before = set(os.listdir("/dev/shm"))
+    texts = list(parallel_texts) * 4 + ["boom"] + list(parallel_texts) * 4
+    with pytest.raises(RuntimeError):
+        run_parallel(Pipeline([_fail_on_boom]), texts, workers=3, chunk_size=2)
+    assert set() == set(os.listdir("/dev/shm")) - before
+
+
+def test_run_parallel_rejects_invalid_chunk_size(parallel_texts):
+    with pytest.raises(ValueError):
+        run_parallel(Pipeline(["remove_white_spaces"]), parallel_texts, chunk_size=0)
@@ -0,0 +1,240 @@
+import itertools
+import os
+import pickle
+
+import pytest
+
+import src.tiketnlphub.preprocessing.cleaner as cleaner
+import src.tiketnlphub.preprocessing.normalizer as normalizer
+from src.tiketnlphub.preprocessing.pipeline import (
+    DELETIONS,
+    STEPS,
+    TOKEN_STEPS,
+    Pipeline,
+    RuleChain,
+    TokenChain,
+    group_deletions,
+)
+from tests.fixtures.preprocessing.pipeline import (
+    pipeline_texts,
+    pipeline_mixed_language_batch,
+    pipeline_spec,
+    deletion_texts,
+)
+
+
+@pytest.mark.parametrize("lang", ["en", "id"])
+def test_pipeline_matches_sequential_steps(pipeline_texts, lang):
+    pipeline = Pipeline(["normalize_slashes", "normalize_symbols", "remove_white_spaces"], lang=lang)
+    for input_text in pipeline_texts:
+        expected_output = normalizer.normalize_slashes(input_text, lang=lang)
+        expected_output = normalizer.normalize_symbols(expected_output, lang=lang)
+        expected_output = cleaner.remove_white_spaces(expected_output)
+        assert expected_output == pipeline(input_text)
+
+
+def test_pipeline_with_step_params(pipeline_texts):
+    pipeline = Pipeline([("normalize_symbols", {"lang": "en", "additional_symbols": {"Rp.": "IDR"}}), "remove_white_spaces"], lang="id")
+    for input_text in pipeline_texts:
+        expected_output = normalizer.normalize_symbols(input_text, lang="en", additional_symbols={"Rp.": "IDR"})
+        expected_output = cleaner.remove_white_spaces(expected_output)
+        assert expected_output == pipeline(input_text)
+
+
+def test_pipeline_merges_rule_chains():
+    pipeline = Pipeline(["normalize_slashes", "normalize_symbols", cleaner.remove_white_spaces], lang="id")
+    plan = pipeline.compile()
+    assert len(plan) == 2
+    assert isinstance(plan[0], RuleChain)
+    assert plan is pipeline.compile("id")
+    assert plan is not pipeline.compile("en")
+
+
+def test_pipeline_run_batch_groups_languages(pipeline_mixed_language_batch):
+    texts, langs, expected_outputs = pipeline_mixed_language_batch
+    pipeline = Pipeline(["normalize_slashes", "normalize_symbols", "remove_white_spaces"])
+    assert expected_outputs == pipeline.run_batch(texts, langs=langs)
+
+
+def test_pipeline_run_batch_rejects_mismatched_langs():
+    pipeline = Pipeline(["normalize_slashes"])
+    with pytest.raises(ValueError):
+        pipeline.run_batch(["a", "b"], langs=["en"])
+
+
+def test_pipeline_rejects_unknown_step():
+    with pytest.raises(ValueError):
+        Pipeline(["remove_everything"])
+
+
+def test_pipeline_transform_column_series(pipeline_texts):
+    pd = pytest.importorskip("pandas")
+    pipeline = Pipeline(["normalize_slashes", "normalize_symbols", "remove_white_spaces"], lang="id")
+    column = pd.Series(pipeline_texts, index=range(10, 10 + len(pipeline_texts)), name="review", dtype=object)
+    result = pipeline.transform_column(column)
+    assert list(column.index) == list(result.index)
+    assert "review" == result.name
+    assert [pipeline(text) for text in pipeline_texts] == result.tolist()
+    # untouched elements reuse the original objects
+    assert result.iloc[0] is column.iloc[0]
+
+
+def test_pipeline_transform_column_array(pipeline_texts):
+    np = pytest.importorskip("numpy")
+    pipeline = Pipeline(["normalize_slashes", "normalize_symbols", "remove_white_spaces"], lang="en")
+    for column in (np.array(pipeline_texts, dtype=object), np.array(pipeline_texts)):
+        result = pipeline.transform_column(column)
+        assert column.dtype.kind == result.dtype.kind
+        assert [pipeline(text) for text in pipeline_texts] == result.tolist()
+
+
+def test_pipeline_transform_column_rejects_lists(pipeline_texts):
+    with pytest.raises(TypeError):
+        Pipeline(["remove_white_spaces"]).transform_column(pipeline_texts)
+
+
+def test_pipeline_fingerprint():
+    fingerprint = Pipeline(["normalize_slashes", ("normalize_symbols", {"additional_symbols": {"Rp.": "IDR"}})], lang="id").fingerprint
+    assert fingerprint == Pipeline(["normalize_slashes", ("normalize_symbols", {"additional_symbols": {"Rp.": "IDR"}})], lang="id").fingerprint
+    assert fingerprint != Pipeline(["normalize_slashes", ("normalize_symbols", {"additional_symbols": {"Rp.": "IDR"}})], lang="en").fingerprint
+    assert fingerprint != Pipeline(["normalize_slashes", "normalize_symbols"], lang="id").fingerprint
+
+
+def test_pipeline_fingerprint_needs_a_description(tmp_path):
+    # plain callables and object parameters can not be told apart by their names or reprs
+    assert Pipeline([lambda text: text.upper()]).fingerprint is None
+    assert Pipeline([("correct_spelling", {"dictionary": object()})]).fingerprint is None
+
+    path = tmp_path / "slangs.tsv"
+    path.write_text("yg\tyang\n", encoding="utf-8")
+    pipeline = Pipeline([("normalize_slangs", {"additional_slangs": str(path)})], lang="id")
+    fingerprint = pipeline.fingerprint
+    assert "yang" == pipeline("yg")
+    path.write_text("yg\tyg itu\n", encoding="utf-8")
+    assert fingerprint != pipeline.fingerprint
+    assert "yg itu" == pipeline("yg")
+
+
+def test_pipeline_checks_files_once_per_batch(tmp_path, monkeypatch):
+    import src.tiketnlphub.preprocessing.pipeline as pipeline_module
+
+    checks = []
+    monkeypatch.setattr(pipeline_module, "file_signature", lambda path: checks.append(path) or os.stat(path).st_size)
+    path = tmp_path / "slangs.tsv"
+    path.write_text("yg\tyang\n", encoding="utf-8")
+    pipeline = Pipeline([("normalize_slangs", {"additional_slangs": str(path)})], lang="id")
+    assert ["yang"] * 3 == [pipeline("yg") for _ in range(3)]
+    assert 1 == len(checks)
+
+    # a single text reuses the compiled plan, a batch sees the new file
+    path.write_text("yg\tyg itu\n", encoding="utf-8")
+    assert "yang" == pipeline("yg")
+    assert ["yg itu", "yg itu"] == pipeline.run_batch(["yg", "yg"])
+    assert 2 == len(checks)
+
+
+def test_pipeline_spec_roundtrip(pipeline_spec, pipeline_texts):
+    pipeline = Pipeline.from_spec(pipeline_spec)
+    assert pipeline.declarative
+    assert pipeline_spec == pipeline.to_spec()
+
+    restored = Pipeline.from_json(pipeline.to_json())
+    assert pipeline.fingerprint == restored.fingerprint
+    assert [pipeline(text) for text in pipeline_texts] == [restored(text) for text in pipeline_texts]
+
+
+def test_pipeline_yaml_spec(tmp_path, pipeline_spec):
+    pytest.importorskip("yaml")
+    pipeline = Pipeline.from_spec(pipeline_spec)
+    pipeline.save(str(tmp_path / "pipeline.yaml"))
+    assert pipeline.fingerprint == Pipeline.load(str(tmp_path / "pipeline.yaml")).fingerprint
+    pipeline.save(str(tmp_path / "pipeline.json"))
+    assert pipeline.fingerprint == Pipeline.load(str(tmp_path / "pipeline.json")).fingerprint
+
+
+def test_pipeline_fingerprint_is_stable():
+    # changing the fingerprint invalidates every checkpoint and cached result, do it on purpose only
+    pipeline = Pipeline(["remove_urls", ("normalize_symbols", {"additional_symbols": {"Rp.": "IDR"}})], lang="id")
+    assert "1126af43" == pipeline.fingerprint[:8]
+
+
+def test_pipeline_spec_validation():
+    with pytest.raises(ValueError):
+        Pipeline.from_spec({"steps": [{"name": "normalize_symbols", "params": {"language": "id"}}]})
+    with pytest.raises(ValueError):
+        Pipeline.from_spec({"steps": ["remove_urls"], "language": "id"})
+    with pytest.raises(ValueError):
+        Pipeline([str.strip]).to_spec()
+
+
+def test_pipeline_pickles_compactly(pipeline_spec, pipeline_texts):
+    pipeline = Pipeline.from_spec(pipeline_spec)
+    plan = pipeline.compile()
+    payload = pickle.dumps(pipeline)
+    assert len(payload) < 1024
+
+    restored = pickle.loads(payload)
+    assert pipeline.fingerprint == restored.fingerprint
+    # declarative pipelines share their compiled plans within a process
+    assert plan is restored.compile()
+    assert [pipeline(text) for text in pipeline_texts] == [restored(text) for text in pipeline_texts]
+
+
+def test_group_deletions():
+    assert [["remove_urls"], ["remove_mentions", "remove_hashtags"], ["remove_phone_numbers", "remove_digits"]] == group_deletions(
+        ["remove_urls", "remove_mentions", "remove_hashtags", "remove_phone_numbers", "remove_digits"]
+    )
+    assert [["remove_hashtags", "remove_mentions", "remove_digits"]] == group_deletions(["remove_hashtags", "remove_mentions", "remove_digits"])
+    assert [["remove_digits"], ["remove_hashtags"]] == group_deletions(["remove_digits", "remove_hashtags"])
+
+
+def test_pipeline_fused_deletions_match_sequential_steps(deletion_texts):
+    for size in (2, 3):
+        for names in itertools.permutations(DELETIONS, size):
+            pipeline = Pipeline(names)
+            for input_text in deletion_texts:
+                expected_output = input_text
+                for name in names:
+                    expected_output = getattr(cleaner, name)(expected_output)
+                assert expected_output == pipeline(input_text), (names, input_text)
+
+
+def test_pipeline_fuses_deletions_into_one_pass():
+    plan = Pipeline(["remove_hashtags", "remove_mentions", "remove_digits"]).compile()
+    assert 1 == len(plan)
+    assert 1 == len(plan[0].rules)
+
+
+def test_pipeline_deletion_modes():
+    # only the default remove mode is fused
+    plan = Pipeline(["remove_hashtags", ("remove_mentions", {"mode": "remove"}), "remove_digits"]).compile()
+    assert 1 == len(plan)
+    assert 1 == len(plan[0].rules)
+
+    pipeline = Pipeline(["remove_urls", ("remove_mentions", {"mode": "mask"}), "remove_digits"])
+    assert 3 == len(pipeline.compile())
+    assert "thanks <MENTION> for  nights " == pipeline("thanks @dewi for 2 nights https://example.com")
+    with pytest.raises(ValueError):
+        Pipeline([("remove_urls", {"mode": "extract"})])
+
+
+def test_token_steps_contract(pipeline_texts):
+    # the steps without a default for a required parameter
+    params = {"correct_spelling": {"dictionary": {"paid": 10, "loved": 5, "hotel": 20}}}
+    for name, token_step in TOKEN_STEPS.items():
+        for input_text in pipeline_texts + ["i  paid €20 and  i loved it", "i  payd €20 and  i lovd it", "   ", ""]:
+            assert STEPS[name](input_text, **params.get(name, {})) == " ".join(token_step(input_text.split(), **params.get(name, {})))
+
+
+def test_pipeline_shares_token_stream(pipeline_texts):
+    names = ["remove_urls", "upper_i_word", "remove_white_spaces", "normalize_non_ascii_char_currencies", "normalize_symbols"]
+    pipeline = Pipeline(names)
+    plan = pipeline.compile()
+    assert [RuleChain, TokenChain, RuleChain] == [type(step) for step in plan]
+    assert 3 == len(plan[1].steps)
+
+    for input_text in pipeline_texts + ["i  paid €20 and  i loved it"]:
+        expected_output = input_text
+        for name in names:
+            expected_output = STEPS[name](expected_output)
+        assert expected_output == pipeline(input_text)
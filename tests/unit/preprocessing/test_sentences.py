@@ -0,0 +1,47 @@
+import pytest
+
+from src.tiketnlphub.preprocessing.sentences import (
+    SentenceSplitter,
+    iter_sentences,
+    sentence_spans,
+    sentence_spans_batch,
+    split_sentences,
+)
+from tests.fixtures.preprocessing.sentences import (
+    split_sentences_test_cases,
+)
+
+
+def test_split_sentences(split_sentences_test_cases):
+    for input_text, expected_output in split_sentences_test_cases:
+        assert expected_output == split_sentences(input_text)
+        assert expected_output == [input_text[start:end] for start, end in sentence_spans(input_text)]
+    assert [output for _, output in split_sentences_test_cases] == list(iter_sentences(text for text, _ in split_sentences_test_cases))
+
+
+def test_sentence_spans_batch(split_sentences_test_cases):
+    texts = [text for text, _ in split_sentences_test_cases]
+    indices, starts, ends = sentence_spans_batch(texts)
+    assert len(indices) == len(starts) == len(ends) == sum(len(output) for _, output in split_sentences_test_cases)
+    assert [sentence for _, output in split_sentences_test_cases for sentence in output] == [texts[i][s:e] for i, s, e in zip(indices, starts, ends)]
+
+
+def test_sentence_splitter_options():
+    text = "Menginap di Kec. Kuta dkk. Pantai dekat\nSarapan enak"
+    assert ["Menginap di Kec. Kuta dkk.", "Pantai dekat", "Sarapan enak"] == SentenceSplitter().split(text)
+    assert ["Menginap di Kec. Kuta dkk. Pantai dekat", "Sarapan enak"] == SentenceSplitter(abbreviations=["dkk."]).split(text)
+    assert ["Menginap di Kec. Kuta dkk.", "Pantai dekat\nSarapan enak"] == SentenceSplitter(newlines=False).split(text)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("1. Dekat bandara", ["1. Dekat bandara"]),
+    ("Plus: 1. Dekat bandara", ["Plus: 1. Dekat bandara"]),
+    ("Oke. 12. Dekat bandara", ["Oke.", "12. Dekat bandara"]),
+    ("Oke! 2) Dekat bandara", ["Oke!", "2) Dekat bandara"]),
+    ("Oke. • Dekat bandara * Sarapan", ["Oke.", "• Dekat bandara * Sarapan"]),
+    ("Lantai 9. Dekat lift", ["Lantai 9.", "Dekat lift"]),
+    ("Lantai 9. dekat lift", ["Lantai 9. dekat lift"]),
+])
+def test_split_sentences_bullets(text, expected):
+    assert expected == split_sentences(text)
+    assert expected == SentenceSplitter(newlines=False).split(text)
@@ -0,0 +1,51 @@
+import json
+
+import pytest
+
+from src.tiketnlphub.preprocessing.slang import SlangDictionary
+from tests.fixtures.preprocessing.slang import (
+    slang_mapping,
+    slang_test_cases,
+)
+
+
+def test_slang_dictionary_normalize(slang_mapping, slang_test_cases):
+    slangs = SlangDictionary(slang_mapping)
+    for input_text, expected_output in slang_test_cases:
+        assert expected_output == slangs.normalize(input_text)
+
+
+def test_slang_dictionary_matches_naive_lookup(slang_mapping):
+    # without punctuation, case or multi-token entries, the dictionary is a plain per-token lookup
+    mapping = {key: value for key, value in slang_mapping.items() if " " not in key and value}
+    slangs = SlangDictionary(mapping)
+    tokens = ["yg", "bgt", "kamar", "mantul", "gak", "bersih"] * 50
+    expected_output = [word for token in tokens for word in mapping.get(token, token).split()]
+    assert expected_output == slangs.normalize_tokens(tokens)
+
+
+def test_slang_dictionary_entries(slang_mapping):
+    slangs = SlangDictionary(slang_mapping)
+    assert len(slang_mapping) == len(slangs)
+    assert "YG" in slangs and "Gak  Papa" in slangs and "papa" not in slangs
+    assert slang_mapping == dict(slangs.items())
+
+
+@pytest.mark.parametrize("suffix, content", [
+    (".tsv", "# slang\treplacement\nyg\tyang\n\ngak papa\ttidak apa-apa\nmantul\tmantap betul\n"),
+    (".csv", "yg,yang\ngak papa,tidak apa-apa\nmantul,mantap betul\n"),
+    (".json", json.dumps({"yg": "yang", "gak papa": "tidak apa-apa", "mantul": "mantap betul"})),
+])
+def test_slang_dictionary_from_file(tmp_path, suffix, content):
+    path = tmp_path / f"slangs{suffix}"
+    path.write_text(content, encoding="utf-8")
+    slangs = SlangDictionary.from_file(str(path))
+    assert 3 == len(slangs)
+    assert "Yang gitu tidak apa-apa, mantap betul" == slangs.normalize("Yg gitu gak papa, mantul")
+
+
+def test_slang_dictionary_from_file_rejects_invalid_lines(tmp_path):
+    path = tmp_path / "slangs.tsv"
+    path.write_text("yg\tyang\nbgt banget\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="bgt banget"):
+        SlangDictionary.from_file(str(path))
@@ -0,0 +1,89 @@
+import pickle
+
+import pytest
+
+from src.tiketnlphub.preprocessing.pipeline import Pipeline
+from src.tiketnlphub.preprocessing.spelling import (
+    SpellingCorrector,
+    build_index,
+    correct_spelling,
+    correct_spelling_batch,
+    get_spelling_corrector,
+)
+from tests.fixtures.preprocessing.spelling import (
+    spelling_frequencies,
+    spelling_test_cases,
+)
+
+
+def test_spelling_corrector_correct(spelling_frequencies, spelling_test_cases):
+    corrector = SpellingCorrector(spelling_frequencies)
+    for input_text, expected_output in spelling_test_cases:
+        assert expected_output == corrector.correct(input_text)
+
+    texts = [input_text for input_text, _ in spelling_test_cases]
+    expected = [expected_output for _, expected_output in spelling_test_cases]
+    assert expected == SpellingCorrector(spelling_frequencies, cache_size=2).correct_batch(iter(texts))
+    assert expected == correct_spelling_batch(texts, spelling_frequencies)
+    assert expected == [correct_spelling(text, spelling_frequencies) for text in texts]
+
+
+def test_spelling_corrector_lookup(spelling_frequencies):
+    corrector = SpellingCorrector(spelling_frequencies, max_distance=1)
+    assert ("kamar", 0, 900) == corrector.lookup("kamar")
+    assert ("kamar", 1, 900) == corrector.lookup("kamr")
+    assert corrector.lookup("kmr") is None
+    assert "Kamar" in corrector and "kamr" not in corrector
+    assert 900 == corrector.frequency("kamar") and 0 == corrector.frequency("kamr")
+    with pytest.raises(ValueError):
+        SpellingCorrector(spelling_frequencies, max_distance=3, prefix_length=3)
+
+
+def test_build_index():
+    assert {"ab": "3", "a": "0 ab", "b": "0 ab", "": "0 ab"} == build_index({"AB": 3, "zero": 0}, max_distance=2)
+
+
+def test_get_spelling_corrector_is_cached(tmp_path, spelling_frequencies):
+    frequencies = dict(spelling_frequencies)
+    corrector = get_spelling_corrector(frequencies)
+    assert corrector is get_spelling_corrector(frequencies)
+    assert corrector is not get_spelling_corrector(frequencies, max_distance=1)
+    assert corrector is get_spelling_corrector(corrector)
+    assert "Kamar" == correct_spelling("Kamr", corrector)
+
+    path = tmp_path / "frequencies.txt"
+    path.write_text("kamar 900\n", encoding="utf-8")
+    assert "Kamar" == correct_spelling("Kamr", str(path))
+    # a rewritten file is read once by the per-text functions, and loaded again by get_spelling_corrector
+    path.write_text("kamera 900\n", encoding="utf-8")
+    assert "Kamar" == correct_spelling("Kamer", str(path))
+    assert "Kamera" == get_spelling_corrector(str(path)).correct("Kamer")
+    assert "Kamera" == correct_spelling("Kamer", str(path))
+    assert "kamar" not in get_spelling_corrector(str(path))
+
+
+def test_spelling_corrector_file(tmp_path, spelling_frequencies, spelling_test_cases):
+    path = tmp_path / "frequencies.txt"
+    path.write_text("# word count\n" + "".join(f"{word} {count}\n" for word, count in spelling_frequencies.items()), encoding="utf-8")
+    corrector = SpellingCorrector.from_file(str(path))
+
+    index_path = str(tmp_path / "spelling.tbl")
+    corrector.save(index_path)
+    opened = SpellingCorrector.from_file(index_path)
+    # a memory-mapped index pickles as its path, not its content
+    payload = pickle.dumps(opened._index)
+    assert len(payload) < 200
+    for input_text, expected_output in spelling_test_cases:
+        assert expected_output == corrector.correct(input_text) == opened.correct(input_text)
+
+    # an index keeps the max_distance it was built with
+    assert 2 == SpellingCorrector.from_file(index_path, max_distance=2).max_distance
+    with pytest.raises(ValueError, match="max_distance"):
+        SpellingCorrector.from_file(index_path, max_distance=1)
+
+    pipeline = Pipeline(["remove_white_spaces", ("correct_spelling", {"dictionary": index_path})])
+    assert "Kamar bersih dan breakfast enak" == pipeline("Kamr  bersi dan breakfats enak")
+
+    path.write_text("kamar 900\nbersih tujuh\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="bersih"):
+        SpellingCorrector.from_file(str(path))
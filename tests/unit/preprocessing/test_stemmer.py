@@ -0,0 +1,37 @@
+from src.tiketnlphub.preprocessing.stemmer import (
+    IndonesianStemmer,
+    stem_words,
+    stem_words_batch,
+    stem_words_tokens,
+)
+from tests.fixtures.preprocessing.stemmer import (
+    stem_test_cases,
+)
+
+
+def test_stem(stem_test_cases):
+    for cache_size in (0, 16):
+        stemmer = IndonesianStemmer(cache_size=cache_size)
+        for word, expected_stem in stem_test_cases:
+            assert expected_stem == stemmer.stem(word)
+
+
+def test_stem_with_roots_and_exceptions():
+    assert ["tikah", "tanti", "laporan"] == IndonesianStemmer(exceptions=["laporan"]).stem_tokens(["menikah", "menantikan", "laporan"])
+    assert ["nikah", "nanti", "lapor"] == IndonesianStemmer(roots=["nikah", "Nanti"]).stem_tokens(["menikah", "menantikan", "laporan"])
+
+
+def test_stem_memo_is_bounded():
+    stemmer = IndonesianStemmer(cache_size=2)
+    assert ["kamar", "kamar", "hotel", "inap"] == stemmer.stem_tokens(["kamarnya", "kamarnya", "hotelnya", "menginap"])
+    assert 2 == stemmer.stem.cache_info().currsize
+    assert 1 == stemmer.stem.cache_info().hits
+
+
+def test_stem_words(stem_test_cases):
+    texts = [" ".join(word for word, _ in stem_test_cases), "", "Kamarnya   bersih, pelayanannya memuaskan"]
+    expected = [" ".join(stem for _, stem in stem_test_cases), "", "kamar bersih, layan puas"]
+    assert expected == [stem_words(text) for text in texts]
+    assert expected == [" ".join(stem_words_tokens(text.split())) for text in texts]
+    assert expected == stem_words_batch(texts)
+    assert expected == IndonesianStemmer(cache_size=0).stem_batch(iter(texts))
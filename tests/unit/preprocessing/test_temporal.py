@@ -0,0 +1,29 @@
+import pytest
+
+from src.tiketnlphub.preprocessing.pipeline import Pipeline
+from src.tiketnlphub.preprocessing.temporal import (
+    TimeDate,
+    TimeDateRecognizer,
+    normalize_times_dates,
+    normalize_times_dates_batch,
+    recognize_times_dates,
+)
+from tests.fixtures.preprocessing.temporal import (
+    normalize_times_dates_test_cases,
+)
+
+
+def test_normalize_times_dates(normalize_times_dates_test_cases):
+    for input_text, expected_output in normalize_times_dates_test_cases:
+        assert expected_output == normalize_times_dates(input_text)
+        # memoized expressions give the same results
+        assert expected_output == normalize_times_dates(input_text)
+    assert [output for _, output in normalize_times_dates_test_cases] == normalize_times_dates_batch([text for text, _ in normalize_times_dates_test_cases])
+    assert [output for _, output in normalize_times_dates_test_cases] == Pipeline(["normalize_times_dates"]).run_batch([text for text, _ in normalize_times_dates_test_cases])
+
+
+def test_recognize_times_dates():
+    text = "Menginap Aug 17, 2023, check-out pukul 12 siang"
+    assert [TimeDate("date", "2023-08-17", (9, 21)), TimeDate("time", "12.00", (39, 47))] == recognize_times_dates(text)
+    assert ["Aug 17, 2023", "12 siang"] == [text[slice(*expression.span)] for expression in recognize_times_dates(text)]
+    assert [] == TimeDateRecognizer(cache_size=0).recognize("31/02/2023")
@@ -0,0 +1,49 @@
+import pytest
+
+from src.tiketnlphub.preprocessing.truecase import (
+    TrueCaser,
+    get_truecaser,
+    truecase,
+    truecase_batch,
+)
+from tests.fixtures.preprocessing.truecase import (
+    truecase_id_test_cases,
+    truecase_en_test_cases,
+)
+
+
+def test_truecase_id(truecase_id_test_cases):
+    for input_text, expected_output in truecase_id_test_cases:
+        assert expected_output == truecase(input_text, lang="id")
+    assert [output for _, output in truecase_id_test_cases] == truecase_batch([text for text, _ in truecase_id_test_cases], lang="id")
+
+
+def test_truecase_en(truecase_en_test_cases):
+    for input_text, expected_output in truecase_en_test_cases:
+        assert expected_output == truecase(input_text, lang="en")
+
+
+def test_truecase_with_additional_words(tmp_path):
+    assert "Menginap di Aston dekat MRT" == truecase("MENGINAP DI ASTON DEKAT MRT", additional_words={"Aston": "Aston", "mrt": "MRT"})
+    assert "Ac" == get_truecaser("id", {"AC": "Ac"}).table["ac"]
+    assert "AC" == get_truecaser("id").table["ac"]
+
+    path = str(tmp_path / "truecase.json")
+    TrueCaser({"mrt": "MRT"}).save(path)
+    assert "Naik MRT ke Jakarta" == truecase("naik mrt ke jakarta", additional_words=path)
+    assert {"mrt": "MRT"} == TrueCaser.from_file(path).table
+
+
+def test_truecaser_fit():
+    texts = [
+        "Kami menginap di Jakarta dekat MRT.",
+        "Lokasi di Jakarta Selatan, dekat MRT juga",
+        "Jakarta macet. AC kamar mati, TOLONG DIPERBAIKI",
+        "Kamar di Bandung bersih",
+    ]
+    truecaser = TrueCaser.fit(texts)
+    # sentence starts are not counted, forms seen once are left out
+    assert {"jakarta": "Jakarta", "mrt": "MRT"} == truecaser.table
+    # a single shouty text makes it to the table only without a frequency floor
+    assert {"jakarta": "Jakarta", "mrt": "MRT", "bandung": "Bandung", "selatan": "Selatan", "tolong": "TOLONG", "diperbaiki": "DIPERBAIKI"} == TrueCaser.fit(texts, min_count=1).table
+    assert "Kamar dekat MRT di Jakarta" == truecaser.truecase("KAMAR DEKAT MRT DI JAKARTA")